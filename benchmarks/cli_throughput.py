@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark the throughput of the command-line colorizer in MB/s.
+
+A synthetic log file of the requested size is generated and colorized with the
+builtin rules into a null output:
+
+.. code-block:: bash
+
+    $ python benchmarks/cli_throughput.py --size 256
+"""
+
+import argparse
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from chalky.cli import colorize, iter_file_chunks, load_highlighter
+from chalky.constants import configure
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+MEGABYTE = 1024 * 1024
+
+
+class NullWriter(io.RawIOBase):
+    """Raw writer discarding everything written to it."""
+
+    def writable(self) -> bool:
+        """Report that the writer is writable."""
+
+        return True
+
+    def write(self, content) -> int:
+        """Discard some content, reporting it as written."""
+
+        return len(content)
+
+
+def generate_log(filepath: Path, size: int):
+    """Write a synthetic log file of at least the given size in bytes."""
+
+    random.seed(0)
+    lines = [
+        (
+            f"2021-01-19 10:{index % 60:02d}:{index % 60:02d} {random.choice(LEVELS)} "
+            f"request {index} from 10.0.{index % 256}.{(index * 7) % 256} "
+            f"GET /api/v1/items/{index} took {random.randint(1, 999)}ms\n"
+        )
+        for index in range(1000)
+    ]
+    block = "".join(lines).encode("utf-8")
+    with filepath.open("wb") as file_io:
+        written = 0
+        while written < size:
+            file_io.write(block)
+            written += len(block)
+
+
+def main():
+    """Colorize a generated log file and report the throughput."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=64, help="log size in MB")
+    arguments = parser.parse_args()
+
+    configure(disable=False)
+    highlighter = load_highlighter()
+    with tempfile.TemporaryDirectory() as temp_dirpath:
+        filepath = Path(temp_dirpath, "benchmark.log")
+        generate_log(filepath, arguments.size * MEGABYTE)
+
+        output = io.BufferedWriter(NullWriter(), buffer_size=MEGABYTE)
+        start = time.perf_counter()
+        size = colorize(iter_file_chunks(filepath), output, highlighter)
+        output.flush()
+        elapsed = time.perf_counter() - start
+
+    print(
+        f"colorized {size / MEGABYTE:.1f} MB in {elapsed:.2f}s "
+        f"({size / MEGABYTE / elapsed:.2f} MB/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
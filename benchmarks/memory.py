@@ -0,0 +1,105 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark the memory overhead of attaching chalk to many buffered rows.
+
+Rows are built with both a copy of the previous, non-interned, chalk dataclass and
+the current interned :class:`~chalky.chalk.Chalk`, and the memory allocated for the
+rows is measured with :mod:`tracemalloc`:
+
+.. code-block:: bash
+
+    $ python benchmarks/memory.py --rows 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Set, Tuple
+
+from chalky import fg, sty
+from chalky.chalk import Chalk
+from chalky.color import Color, Color_T
+from chalky.style import Style
+
+LEVELS = (Color.BLUE, Color.GREEN, Color.YELLOW, Color.RED)
+
+
+@dataclass
+class UninternedChalk:
+    """Describes a chalk created anew for every combination, as before interning."""
+
+    style: Set[Style] = field(default_factory=set)
+    foreground: Optional[Color_T] = field(default=None)
+    background: Optional[Color_T] = field(default=None)
+
+    def __and__(self, other: "UninternedChalk") -> "UninternedChalk":
+        """Combine the styles and colors of two chalk into a new chalk."""
+
+        return UninternedChalk(
+            style=self.style.union(other.style),
+            foreground=other.foreground or self.foreground,
+            background=other.background or self.background,
+        )
+
+
+def build_uninterned_rows(count: int) -> List[Tuple[str, UninternedChalk]]:
+    """Build rows of text styled by newly created chalk."""
+
+    bold = UninternedChalk(style={Style.BOLD})
+    return [
+        (
+            f"row {index}",
+            bold & UninternedChalk(foreground=LEVELS[index % len(LEVELS)]),
+        )
+        for index in range(count)
+    ]
+
+
+def build_interned_rows(count: int) -> List[Tuple[str, Chalk]]:
+    """Build rows of text styled by interned chalk."""
+
+    levels = (fg.blue, fg.green, fg.yellow, fg.red)
+    return [
+        (f"row {index}", sty.bold & levels[index % len(levels)])
+        for index in range(count)
+    ]
+
+
+def measure(build: Callable[[int], list], count: int) -> int:
+    """Measure the bytes allocated while building some rows."""
+
+    gc.collect()
+    tracemalloc.start()
+    rows = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del rows
+    return size
+
+
+def main():
+    """Measure the memory used by each way of building rows."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="number of rows")
+    arguments = parser.parse_args()
+
+    baseline = measure(
+        lambda count: [(f"row {index}", None) for index in range(count)],
+        arguments.rows,
+    )
+    for name, build in (
+        ("uninterned", build_uninterned_rows),
+        ("interned", build_interned_rows),
+    ):
+        size = measure(build, arguments.rows)
+        overhead = (size - baseline) / arguments.rows
+        print(f"{name:>10}: {size / 1024 / 1024:8.1f} MiB, {overhead:6.1f} B/row")
+
+
+if __name__ == "__main__":
+    main()
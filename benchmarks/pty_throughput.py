@@ -0,0 +1,233 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Benchmark the end-to-end throughput of styled output written to a pseudo-terminal.
+
+Each scenario writes to the terminal side of a fresh pty through the same buffered,
+line buffered text io stack as :data:`sys.stdout` on a terminal, while a reader thread
+drains the other side.
+Flushes and write system calls are paid for just like in production, and are counted
+at the raw file underneath the buffers:
+
+.. code-block:: bash
+
+    $ python benchmarks/pty_throughput.py --lines 100000 --frames 1000
+    $ python benchmarks/pty_throughput.py --scenario log --scenario log-fused
+
+The terminal is put in raw mode, so the line discipline neither translates newlines
+nor echoes anything back.
+Requires a platform providing :mod:`pty`, such as Linux or macOS.
+"""
+
+import argparse
+import io
+import os
+import pty
+import threading
+import time
+import tty
+from typing import Callable, Dict
+
+import chalky
+from chalky import fg, sty
+from chalky.interface.ansi import AnsiInterface
+from chalky.live import Progress
+from chalky.screen import Screen
+
+LEVELS = (
+    ("DEBUG", fg.blue),
+    ("INFO", fg.green),
+    ("WARNING", sty.bold & fg.yellow),
+    ("ERROR", sty.bold & fg.red),
+)
+MEGABYTE = 1024 * 1024
+
+Scenario_T = Callable[[io.TextIOWrapper, AnsiInterface, argparse.Namespace], None]
+
+
+class CountingFileIO(io.FileIO):
+    """Describes a raw file that counts the write system calls made through it."""
+
+    writes = 0
+
+    def write(self, content) -> int:
+        """Write some content to the file and count the call."""
+
+        self.writes += 1
+        return super().write(content)
+
+
+class Drain(threading.Thread):
+    """Describes a thread that reads and discards everything written to a pty."""
+
+    def __init__(self, fd: int):
+        """Initialize the thread for the controlling side of a pty."""
+
+        super().__init__(daemon=True)
+        self.fd = fd
+        self.size = 0
+
+    def run(self):
+        """Read from the pty until the terminal side is closed."""
+
+        while True:
+            try:
+                chunk = os.read(self.fd, 1 << 16)
+            except OSError:
+                # reading fails with EIO once the terminal side of the pty is closed
+                break
+
+            if not chunk:
+                break
+            self.size += len(chunk)
+
+
+def log_spam(output: io.TextIOWrapper, _: AnsiInterface, arguments: argparse.Namespace):
+    """Print styled log lines through the builtin print."""
+
+    for index in range(arguments.lines):
+        level, chalk = LEVELS[index % len(LEVELS)]
+        print(
+            chalk | level,
+            f"request {index} from 10.0.{index % 256}.{(index * 7) % 256}",
+            f"took {index % 1000}ms",
+            file=output,
+        )
+
+
+def log_spam_fused(
+    output: io.TextIOWrapper, _: AnsiInterface, arguments: argparse.Namespace
+):
+    """Print styled log lines through :func:`chalky.print`."""
+
+    for index in range(arguments.lines):
+        level, chalk = LEVELS[index % len(LEVELS)]
+        chalky.print(
+            (chalk, level),
+            f"request {index} from 10.0.{index % 256}.{(index * 7) % 256}",
+            f"took {index % 1000}ms",
+            file=output,
+        )
+
+
+def controls(
+    _: io.TextIOWrapper, interface: AnsiInterface, arguments: argparse.Namespace
+):
+    """Clear the line and set the title with unbatched control sequences."""
+
+    for index in range(arguments.lines):
+        interface.clear_line()
+        interface.set_title(f"step {index}")
+
+
+def controls_batched(
+    _: io.TextIOWrapper, interface: AnsiInterface, arguments: argparse.Namespace
+):
+    """Clear the line and set the title within a batch."""
+
+    for index in range(arguments.lines):
+        with interface.batch(synchronized=False):
+            interface.clear_line()
+            interface.set_title(f"step {index}")
+
+
+def progress(
+    _: io.TextIOWrapper, interface: AnsiInterface, arguments: argparse.Namespace
+):
+    """Refresh a progress region of a few bars for every frame."""
+
+    region = Progress(interface=interface)
+    bars = [
+        region.add(f"worker {index}", total=arguments.frames, chalk=fg.green)
+        for index in range(4)
+    ]
+    region.start()
+    for _frame in range(arguments.frames):
+        for bar in bars:
+            bar.completed += 1
+        region.refresh()
+    region.stop()
+
+
+def redraw(
+    _: io.TextIOWrapper, interface: AnsiInterface, arguments: argparse.Namespace
+):
+    """Redraw every cell of a full screen for every frame."""
+
+    screen = Screen(80, 24, interface=interface)
+    for frame in range(arguments.frames):
+        # invalidating the front grid forces every cell to be redrawn
+        screen.invalidate()
+        for row in range(screen.height):
+            level, chalk = LEVELS[(frame + row) % len(LEVELS)]
+            screen.write(0, row, f"{level:<8}", chalk)
+            screen.write(8, row, f"row {row:>2} frame {frame:>6} ".ljust(72, "."))
+        screen.refresh()
+
+
+SCENARIOS: Dict[str, Scenario_T] = {
+    "log": log_spam,
+    "log-fused": log_spam_fused,
+    "controls": controls,
+    "controls-batched": controls_batched,
+    "progress": progress,
+    "redraw": redraw,
+}
+
+
+def run(scenario: Scenario_T, arguments: argparse.Namespace):
+    """Run a scenario against a fresh pty and count what reaches it."""
+
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+
+    raw = CountingFileIO(slave, "w")
+    output = io.TextIOWrapper(
+        io.BufferedWriter(raw), encoding="utf-8", line_buffering=True
+    )
+    drain = Drain(master)
+    drain.start()
+
+    start = time.perf_counter()
+    try:
+        scenario(output, AnsiInterface(output), arguments)
+    finally:
+        output.close()
+        drain.join()
+        os.close(master)
+    elapsed = time.perf_counter() - start
+
+    return drain.size, raw.writes, elapsed
+
+
+def main():
+    """Run the selected scenarios and report their throughput."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--lines", type=int, default=100_000, help="lines and control operations"
+    )
+    parser.add_argument(
+        "--frames", type=int, default=1000, help="progress and redraw frames"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to run, may be repeated (defaults to all)",
+    )
+    arguments = parser.parse_args()
+
+    chalky.configure(disable=False)
+    for name in arguments.scenario or SCENARIOS:
+        size, writes, elapsed = run(SCENARIOS[name], arguments)
+        print(
+            f"{name:>16}: {size / MEGABYTE:7.2f} MB in {elapsed:6.2f}s "
+            f"({size / MEGABYTE / elapsed:7.2f} MB/s, {writes / elapsed:9.0f} "
+            f"writes/s, {size / max(writes, 1):7.1f} B/write)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+Adding a NumPy backed :class:`~.array.TrueColorArray` for bulk color conversions,
+available through the ``array`` extra.
@@ -0,0 +1,2 @@
+Adding :meth:`~.interface.ansi.AnsiInterface.batch` to write control sequences and text
+at once, wrapped in a synchronized update when the terminal supports it.
@@ -0,0 +1,2 @@
+Adding :func:`~.width.cell_width` to measure the terminal columns of wide characters
+and emoji from a generated Unicode width table.
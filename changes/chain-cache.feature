@@ -0,0 +1,2 @@
+Caching the chalk of :class:`~.chain.Chain` attribute paths so repeated chains are
+resolved without composing them again.
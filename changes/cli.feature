@@ -0,0 +1,2 @@
+Adding the ``python -m chalky`` command-line colorizer that streams files and standard
+input through the rules of a JSON rules file.
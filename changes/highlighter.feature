@@ -0,0 +1,2 @@
+Adding a :class:`~.highlight.Highlighter` that styles the matches of many pattern and
+keyword rules in a single pass.
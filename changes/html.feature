@@ -0,0 +1,2 @@
+Adding an :class:`~.interface.html.HtmlInterface` that streams styled text as HTML
+spans referencing a deduplicated stylesheet.
@@ -0,0 +1,2 @@
+Adding :func:`~.image.render` to draw images in the terminal as truecolor half-block
+cells.
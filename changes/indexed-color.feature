@@ -0,0 +1 @@
+Adding :class:`~.color.IndexedColor` for the 256 colors of the xterm palette.
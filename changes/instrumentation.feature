@@ -0,0 +1,3 @@
+Adding opt-in instrumentation through :func:`~.constants.configure` with
+:func:`~.instrument.stats` counters, cache statistics and a :func:`~.instrument.profile`
+context manager.
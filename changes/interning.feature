@@ -0,0 +1 @@
+Interning :class:`~.chalk.Chalk` instances so equal chalk share a single instance.
@@ -0,0 +1,2 @@
+Adding rate-limited :class:`~.live.LiveRegion` regions redrawn in place and multi-bar
+:class:`~.live.Progress` rendering.
@@ -0,0 +1,2 @@
+Restoring the outer styles after resets within nested styled values applied by
+:class:`~.interface.ansi.AnsiInterface`.
@@ -0,0 +1,2 @@
+Adding :func:`~.parallel.render_lines` to style large inputs across a pool of
+workers while preserving the order of lines.
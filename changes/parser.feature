@@ -0,0 +1,2 @@
+Adding an incremental :class:`~.parser.AnsiParser` that turns chunks of styled text
+back into segments and control sequences, even when sequences span chunks.
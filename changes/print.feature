@@ -0,0 +1,2 @@
+Adding :func:`chalky.print` and :meth:`~.interface.base.BaseInterface.write` to write
+styled values without building joined styled strings.
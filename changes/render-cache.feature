@@ -0,0 +1,2 @@
+Adding an opt-in :class:`~.cache.RenderCache` of repeatedly styled values, enabled
+through ``configure(cache=True)``.
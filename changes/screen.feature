@@ -0,0 +1,2 @@
+Adding a double-buffered :class:`~.screen.Screen` that only redraws the cells that
+changed since the last refresh.
@@ -0,0 +1,2 @@
+Reading the escape sequences of named colors and styles from tables generated by the
+new ``codegen.generate`` task.
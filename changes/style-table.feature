@@ -0,0 +1,2 @@
+Pickling chalk as a single packed integer and adding
+:class:`~.registry.StyleTable` to share chalk across processes by index.
@@ -0,0 +1,2 @@
+Adding :func:`~.tabular.table` to stream rows of styled cells padded by their visible
+width.
@@ -0,0 +1,2 @@
+Adding :func:`~.text.wrap`, :func:`~.text.truncate` and :func:`~.text.slice` to cut
+styled text by the cells it occupies while keeping its styles.
@@ -0,0 +1,2 @@
+Adding :class:`~.theme.Theme` files that compile TOML style definitions and reload
+them when the file changes.
@@ -0,0 +1,2 @@
+Adding :func:`~.tokens.render_tokens` to style token streams, such as those of Pygments,
+through a precompiled map of token types to styles.
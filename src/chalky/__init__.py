@@ -18,15 +18,23 @@ using ``|``:
 
 from .chain import chain
 from .chalk import Chalk
-from .color import Color, TrueColor
+from .color import Color, IndexedColor, TrueColor
 from .constants import configure
+from .instrument import profile, stats
+from .output import print  # noqa: A001
+from .registry import StyleTable
 from .shortcuts import bg, fg, hex, rgb, sty
 from .style import Style
+from .tabular import table
+from .text import slice, truncate, wrap  # noqa: A001
+from .theme import Theme
+from .tokens import render_tokens
 
 __all__ = [
     "Chalk",
     "Color",
     "TrueColor",
+    "IndexedColor",
     "Style",
     "fg",
     "bg",
@@ -35,4 +43,12 @@ __all__ = [
     "hex",
     "chain",
     "configure",
+    "stats",
+    "profile",
+    "table",
+    "wrap",
+    "truncate",
+    "Theme",
+    "render_tokens",
+    "StyleTable",
 ]
@@ -0,0 +1,318 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a NumPy backed array of true colors for working with colors in bulk.
+
+Building palettes for thousands of entities one :class:`~.color.TrueColor` at a time
+is slow, a :class:`~.array.TrueColorArray` converts and blends all of its colors at
+once:
+
+>>> from chalky import TrueColor
+>>> from chalky.array import TrueColorArray
+>>> colors = TrueColorArray.from_hex(["#ff0000", "#00ff00", "#0000ff"])
+>>> colors.darken(0.5).to_hex()
+['#800000', '#008000', '#000080']
+>>> colors.contrast(TrueColor(255, 255, 255)).round(2)
+array([4.  , 1.37, 8.59])
+
+.. important::
+    This module requires :mod:`numpy` which is installed with the ``array`` extra
+    (``pip install chalky[array]``).
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Sequence, Union, overload
+
+try:
+    import numpy
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "chalky.array requires numpy, install it with `pip install chalky[array]`"
+    ) from exc
+
+from .color import TrueColor
+
+Other_T = Union["TrueColorArray", TrueColor]
+Ratio_T = Union[float, Sequence[float], "numpy.ndarray"]
+
+LUMINANCE_WEIGHTS = numpy.array([0.2126, 0.7152, 0.0722])
+
+
+def _get_values(other: Other_T) -> numpy.ndarray:
+    if isinstance(other, TrueColor):
+        return numpy.array([[other.red, other.green, other.blue]], dtype=numpy.uint8)
+
+    return other.values
+
+
+def _get_ratio(ratio: Ratio_T) -> numpy.ndarray:
+    ratios: numpy.ndarray = numpy.asarray(ratio, dtype=numpy.float64)
+    if ratios.ndim == 1:
+        ratios = ratios[:, numpy.newaxis]
+
+    if numpy.any((ratios < 0) | (ratios > 1)):
+        raise ValueError("Ratios must be within 0.0-1.0")
+
+    return ratios
+
+
+class TrueColorArray:
+    """Describes an array of true colors backed by an (N, 3) array of RGB values.
+
+    Parameters:
+        values (Union[Sequence[Sequence[int]], numpy.ndarray]):
+            The RGB values of the colors (0-255).
+
+    Raises:
+        ValueError:
+            When the values are not (N, 3) or are not within 0-255.
+    """
+
+    def __init__(self, values: Union[Sequence[Sequence[int]], numpy.ndarray]):
+        """Initialize the array from some RGB values."""
+
+        array: numpy.ndarray = numpy.asarray(values)
+        if array.size == 0:
+            array = array.reshape(0, 3)
+
+        if array.ndim != 2 or array.shape[1] != 3:
+            raise ValueError(
+                f"Color values must have a shape of (N, 3), received {array.shape}"
+            )
+
+        if array.dtype != numpy.uint8:
+            if array.size and (array.min() < 0 or array.max() > 255):
+                raise ValueError("Color values must be within 0-255")
+            array = array.astype(numpy.uint8)
+
+        self.values = array
+
+    def __len__(self) -> int:
+        """Get the number of colors in the array.
+
+        Returns:
+            int:
+                The number of colors.
+        """
+
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[TrueColor]:
+        """Iterate over the colors of the array.
+
+        Yields:
+            :class:`~.color.TrueColor`:
+                The colors of the array.
+        """
+
+        for red, green, blue in self.values.tolist():
+            yield TrueColor(red, green, blue)
+
+    @overload
+    def __getitem__(self, index: int) -> TrueColor:  # noqa: D105
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(  # noqa: D105
+        self, index: Union[slice, numpy.ndarray]
+    ) -> TrueColorArray:
+        ...  # pragma: no cover
+
+    def __getitem__(self, index):
+        """Get a single color or a selection of colors from the array.
+
+        Args:
+            index (Union[int, slice, numpy.ndarray]):
+                The index, slice, index array or boolean mask to select.
+
+        Returns:
+            Union[:class:`~.color.TrueColor`, :class:`~.array.TrueColorArray`]:
+                The color at an integer index, otherwise the selected colors.
+        """
+
+        if isinstance(index, (int, numpy.integer)):
+            red, green, blue = self.values[index].tolist()
+            return TrueColor(red, green, blue)
+
+        return TrueColorArray(self.values[index])
+
+    def __repr__(self) -> str:
+        """Get a short representation of the array.
+
+        Returns:
+            str:
+                The representation of the array.
+        """
+
+        return f"{self.__class__.__name__}({self.to_hex()!r})"
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[TrueColor]) -> TrueColorArray:
+        """Create an array from some true color instances.
+
+        Args:
+            colors (Iterable[:class:`~.color.TrueColor`]):
+                The colors to create the array from.
+
+        Returns:
+            :class:`~.array.TrueColorArray`:
+                The created array.
+        """
+
+        return cls(
+            numpy.array(
+                [(color.red, color.green, color.blue) for color in colors],
+                dtype=numpy.uint8,
+            )
+        )
+
+    @classmethod
+    def from_hex(cls, colors: Iterable[str]) -> TrueColorArray:
+        """Create an array from some hex color strings.
+
+        Args:
+            colors (Iterable[str]):
+                The hex color strings of the colors to create.
+
+        Raises:
+            ValueError:
+                If any of the given hex color strings is not a length of 3 or 6 or is
+                not valid hex.
+
+        Returns:
+            :class:`~.array.TrueColorArray`:
+                The created array.
+        """
+
+        values = []
+        for color in colors:
+            color = color.lstrip("#")
+            if len(color) == 3:
+                color = "".join([element * 2 for element in color])
+            elif len(color) != 6:
+                raise ValueError(f"Hex color #{color!s} is not of length 3 or 6")
+            values.append(color)
+
+        # all of the strings are decoded by a single call instead of once per color
+        content = bytes.fromhex("".join(values))
+        if len(content) != len(values) * 3:
+            raise ValueError("Hex colors must not contain whitespace")
+
+        return cls(numpy.frombuffer(content, dtype=numpy.uint8).reshape(-1, 3))
+
+    def to_hex(self) -> List[str]:
+        """Convert the colors to hex color strings.
+
+        Returns:
+            List[str]:
+                The hex color strings of the colors (#ffffff).
+        """
+
+        content = self.values.tobytes().hex()
+        return ["#" + content[index : index + 6] for index in range(0, len(content), 6)]
+
+    def to_color_codes(self, background: bool = False) -> List[bytes]:
+        """Build the SGR parameters that apply each of the colors.
+
+        Args:
+            background (bool, optional):
+                If True, will build codes for background colors.
+                Defaults to False.
+
+        Returns:
+            List[bytes]:
+                The SGR parameters of the colors without the surrounding escape
+                sequence, such as ``b"38;2;255;0;0"``.
+        """
+
+        template = (b"48" if background else b"38") + b";2;%d;%d;%d"
+        return [template % tuple(row) for row in self.values.tolist()]
+
+    def blend(self, other: Other_T, ratio: Ratio_T = 0.5) -> TrueColorArray:
+        """Blend the colors with some other colors.
+
+        Args:
+            other (Union[:class:`~.array.TrueColorArray`, :class:`~.color.TrueColor`]):
+                The colors to blend with, a single color is blended with every color.
+            ratio (Union[float, Sequence[float], numpy.ndarray], optional):
+                The amount of the other colors in the result (0.0-1.0), either one
+                ratio for all colors or one ratio for each color.
+                Defaults to 0.5.
+
+        Raises:
+            ValueError:
+                When a ratio is not within 0.0-1.0.
+
+        Returns:
+            :class:`~.array.TrueColorArray`:
+                The blended colors.
+        """
+
+        ratio = _get_ratio(ratio)
+        blended = self.values * (1.0 - ratio) + _get_values(other) * ratio
+        return TrueColorArray(numpy.rint(blended).astype(numpy.uint8))
+
+    def lighten(self, amount: Ratio_T) -> TrueColorArray:
+        """Lighten the colors by blending them with white.
+
+        Args:
+            amount (Union[float, Sequence[float], numpy.ndarray]):
+                The amount of white in the result (0.0-1.0).
+
+        Returns:
+            :class:`~.array.TrueColorArray`:
+                The lightened colors.
+        """
+
+        return self.blend(TrueColor(255, 255, 255), amount)
+
+    def darken(self, amount: Ratio_T) -> TrueColorArray:
+        """Darken the colors by blending them with black.
+
+        Args:
+            amount (Union[float, Sequence[float], numpy.ndarray]):
+                The amount of black in the result (0.0-1.0).
+
+        Returns:
+            :class:`~.array.TrueColorArray`:
+                The darkened colors.
+        """
+
+        return self.blend(TrueColor(0, 0, 0), amount)
+
+    def luminance(self) -> numpy.ndarray:
+        """Compute the WCAG relative luminance of the colors.
+
+        Returns:
+            numpy.ndarray:
+                The relative luminance of each color (0.0-1.0).
+        """
+
+        channels = self.values / 255.0
+        linear = numpy.where(
+            channels <= 0.03928, channels / 12.92, ((channels + 0.055) / 1.055) ** 2.4
+        )
+        return linear @ LUMINANCE_WEIGHTS
+
+    def contrast(self, other: Other_T) -> numpy.ndarray:
+        """Compute the WCAG contrast ratio between the colors and some other colors.
+
+        Args:
+            other (Union[:class:`~.array.TrueColorArray`, :class:`~.color.TrueColor`]):
+                The colors to compare against, a single color is compared against
+                every color.
+
+        Returns:
+            numpy.ndarray:
+                The contrast ratio of each color (1.0-21.0).
+        """
+
+        if isinstance(other, TrueColor):
+            other = TrueColorArray.from_colors([other])
+
+        luminance, other_luminance = self.luminance(), other.luminance()
+        lighter = numpy.maximum(luminance, other_luminance)
+        darker = numpy.minimum(luminance, other_luminance)
+        return (lighter + 0.05) / (darker + 0.05)
@@ -0,0 +1,154 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains the bounded cache of rendered values for repeatedly styled strings.
+
+Output often styles the same short strings over and over, such as log levels,
+status words and column headers.
+The render cache is disabled by default and is enabled through
+:func:`~.constants.configure`, repeated values are then returned as the same string
+instance without building any escape sequences:
+
+>>> from chalky import configure, fg, stats
+>>> configure(cache=True)
+>>> assert (fg.green | "OK") is (fg.green | "OK")
+>>> stats().caches["render"].hit_rate
+0.5
+
+Entries are keyed by the interface, the chalk and the value, so swapping the text io
+buffer of the default interface never returns values rendered for another interface.
+Every call to :func:`~.constants.configure` clears the cache, clear it manually with
+:meth:`~.cache.RenderCache.clear` if the way an interface renders changes.
+"""
+
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from .interface.base import BaseInterface
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .chalk import Chalk
+
+Key_T = Tuple[BaseInterface, "Chalk", str]
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class RenderCache:
+    """Describes a least recently used cache of rendered values.
+
+    Parameters:
+        maxsize (int, optional):
+            The maximum number of entries in the cache.
+            Defaults to 1024.
+        maxmemory (int, optional):
+            The maximum number of bytes used by the cached strings.
+            Defaults to 1 MiB.
+        maxlength (int, optional):
+            The maximum length of values to cache, longer values are rendered but
+            never cached.
+            Defaults to 128.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, maxmemory: int = 1 << 20, maxlength: int = 128
+    ):
+        """Initialize an empty cache."""
+
+        self.maxsize = maxsize
+        self.maxmemory = maxmemory
+        self.maxlength = maxlength
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Key_T, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached entries.
+
+        Returns:
+            int:
+                The number of cached entries.
+        """
+
+        return len(self._entries)
+
+    def render(self, interface: BaseInterface, chalk: "Chalk", value: str) -> str:
+        """Render a value, returning the cached string if it was rendered before.
+
+        Args:
+            interface (:class:`~.interface.base.BaseInterface`):
+                The interface to render the value for.
+            chalk (:class:`~.chalk.Chalk`):
+                The chalk to apply to the value.
+            value (str):
+                The value to render.
+
+        Returns:
+            str:
+                The styled value.
+        """
+
+        key = (interface, chalk, value)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:  # pragma: no cover
+                pass  # evicted by another thread since the lookup
+
+            return entry[0]
+
+        self.misses += 1
+        rendered = interface.apply(
+            value=value,
+            style=chalk.style,
+            background=chalk.background,
+            foreground=chalk.foreground,
+        )
+        if len(value) <= self.maxlength:
+            self._store(key, rendered)
+
+        return rendered
+
+    def _store(self, key: Key_T, rendered: str):
+        size = sys.getsizeof(key[2]) + sys.getsizeof(rendered)
+        with self._lock:
+            if key in self._entries:
+                return
+
+            self._entries[key] = (rendered, size)
+            self.memory += size
+            while self._entries and (
+                len(self._entries) > self.maxsize or self.memory > self.maxmemory
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.memory -= evicted_size
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.memory = 0
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Get the state of the cache like :func:`functools.lru_cache`.
+
+        Returns:
+            CacheInfo:
+                The hits, misses, maximum size and current size of the cache.
+        """
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+render_cache = RenderCache()
@@ -6,14 +6,85 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Union, overload
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Union, overload
 
 from .chalk import Chalk
-from .color import Color, Color_T, TrueColor
+from .color import Color, Color_T, IndexedColor, TrueColor
 from .style import Style
 
 
+class _ChainAttribute:
+    """Descriptor resolving a chain attribute to a cached child node of the trie.
+
+    The first access builds the child node and stores it in the instance dictionary
+    of the parent node under the attribute name, shadowing the descriptor.
+    Every following access of the same attribute path is a plain attribute lookup.
+    """
+
+    def __init__(
+        self,
+        style: Optional[Style] = None,
+        color: Optional[Color_T] = None,
+        background: Optional[bool] = None,
+    ):
+        self.style = style
+        self.color = color
+        self.background = background
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str):
+        """Remember the attribute name the descriptor is assigned to.
+
+        Args:
+            owner (type):
+                The class the descriptor is assigned on.
+            name (str):
+                The name of the attribute.
+        """
+
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: Any) -> _ChainAttribute:  # noqa: D105
+        ...  # pragma: no cover
+
+    @overload
+    def __get__(self, instance: Chain, owner: Any) -> Chain:  # noqa: D105
+        ...  # pragma: no cover
+
+    def __get__(
+        self, instance: Optional[Chain], owner: Any
+    ) -> Union[_ChainAttribute, Chain]:
+        """Get the child node of a chain for the attribute, building it once.
+
+        Args:
+            instance (Optional[:class:`~.chain.Chain`]):
+                The chain the attribute is accessed on, None when accessed on the
+                class.
+            owner (~typing.Any):
+                The class the attribute is accessed on.
+
+        Returns:
+            Union[:class:`~.chain._ChainAttribute`, :class:`~.chain.Chain`]:
+                The descriptor itself when accessed on the class, otherwise the
+                child node.
+        """
+
+        if instance is None:
+            return self
+
+        if self.style is not None:
+            child = instance._handle_style(self.style)
+        elif self.color is not None:
+            child = instance._handle_color(self.color)
+        else:
+            child = Chain(_chalk=instance._chalk, _background=bool(self.background))
+
+        instance.__dict__[self.name] = child
+        return child
+
+
 @dataclass
 class Chain:
     """Quickly produce a chain of styles and colors that can be applied to a string.
@@ -29,8 +100,11 @@ class Chain:
         >>> print(chain.bold.blue | "Bold blue text")
         >>> print(chain.black.bg.green.italic | "Italic black text on green background")
 
-        Once a :class:`~.chain.Chain` instance is applied to a string, the styles are
-        consumed and the chain instance is reset.
+        Chain instances are immutable nodes of a trie of attribute paths.
+        Each attribute resolves to a child node holding its precompiled chalk, which
+        is built on first use and cached on the parent node.
+        Repeating a chain expression only looks up the already built nodes, so
+        ``chain.bold.blue`` costs about as much as a module-level chalk constant.
     """
 
     _chalk: Chalk = field(default_factory=Chalk)
@@ -46,15 +120,13 @@ class Chain:
 
         Returns:
             :class:`~.shortcuts.chain.Chain`:
-                The newly updated chain.
+                The new composed chain.
         """
 
         if isinstance(other, Chalk):
-            self._chalk = self._chalk & other
-            return self
+            return replace(self, _chalk=self._chalk & other)
 
-        self._chalk = self._chalk & other._chalk
-        return self
+        return replace(self, _chalk=self._chalk & other._chalk)
 
     @overload
     def __add__(
@@ -95,10 +167,7 @@ class Chain:
                 The newly styled string.
         """
 
-        applied = self._chalk | value
-        self._reset()
-
-        return applied
+        return self._chalk | value
 
     def __call__(self, value: str) -> str:
         """Handle applying a chain to a strings.
@@ -114,22 +183,23 @@ class Chain:
 
         return self | value
 
-    def _reset(self):
-        self._chalk = Chalk()
-        self._background = False
-
     def _handle_style(self, style: Style) -> Chain:
-        self._chalk.style.add(style)
-
-        return self
+        return Chain(
+            _chalk=replace(self._chalk, style=self._chalk.style | {style}),
+            _background=self._background,
+        )
 
     def _handle_color(self, color: Color_T) -> Chain:
         if self._background:
-            self._chalk.background = color
-        else:
-            self._chalk.foreground = color
+            return Chain(
+                _chalk=replace(self._chalk, background=color),
+                _background=self._background,
+            )
 
-        return self
+        return Chain(
+            _chalk=replace(self._chalk, foreground=color),
+            _background=self._background,
+        )
 
     def rgb(self, red: int, green: int, blue: int) -> Chain:
         """Add a truecolor chalk from an RGB tuple.
@@ -163,142 +233,63 @@ class Chain:
 
         return self._handle_color(TrueColor.from_hex(color))
 
-    @property
-    def chalk(self) -> Chalk:
-        """Extract the currently built chalk instance.
+    def index(self, value: int) -> Chain:
+        """Add an indexed color chalk from the xterm 256 color palette.
 
-        .. important::
-            Consuming this property will reset the current chain's styles.
-            We are assuming that if you need the :class:`~.chalk.Chalk`, you have
-            finished constructing it through the chaining syntax.
+        Args:
+            value (int):
+                The index of the color in the palette (0-255).
 
         Returns:
-            ~.chalk.Chalk:
-                The current chalk instance from the chained styles and colors.
+            :class:`~.chain.Chain`:
+                The newly updated chain.
         """
 
-        chalk = self._chalk
-        self._reset()
-
-        return chalk
-
-    @property
-    def bg(self) -> Chain:
-        """Following colors will be applied as the background color."""
-
-        self._background = True
-        return self
-
-    @property
-    def fg(self) -> Chain:
-        """Following colors will be applied as the foreground color."""
-
-        self._background = False
-        return self
-
-    @property
-    def bold(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.BOLD)
-
-    @property
-    def dim(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.DIM)
-
-    @property
-    def italic(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.ITALIC)
-
-    @property
-    def underline(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.UNDERLINE)
-
-    @property
-    def slow_blink(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.SLOW_BLINK)
-
-    @property
-    def rapid_blink(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.RAPID_BLINK)
-
-    @property
-    def reversed(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.REVERSED)
-
-    @property
-    def conceal(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.CONCEAL)
-
-    @property
-    def strikethrough(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.STRIKETHROUGH)
-
-    @property
-    def normal(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_style(Style.NORMAL)
-
-    @property
-    def black(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BLACK)
-
-    @property
-    def red(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.RED)
-
-    @property
-    def green(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.GREEN)
-
-    @property
-    def yellow(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.YELLOW)
-
-    @property
-    def blue(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BLUE)
-
-    @property
-    def magenta(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.MAGENTA)
-
-    @property
-    def cyan(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.CYAN)
-
-    @property
-    def white(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.WHITE)
-
-    @property
-    def bright_black(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_BLACK)
-
-    @property
-    def bright_red(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_RED)
-
-    @property
-    def bright_green(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_GREEN)
+        return self._handle_color(IndexedColor(value))
 
     @property
-    def bright_yellow(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_YELLOW)
-
-    @property
-    def bright_blue(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_BLUE)
-
-    @property
-    def bright_magenta(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_MAGENTA)
+    def chalk(self) -> Chalk:
+        """Extract the currently built chalk instance.
 
-    @property
-    def bright_cyan(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_CYAN)
+        Returns:
+            ~.chalk.Chalk:
+                The current chalk instance from the chained styles and colors.
+        """
 
-    @property
-    def bright_white(self) -> Chain:  # noqa: D102 # pragma: no cover
-        return self._handle_color(Color.BRIGHT_WHITE)
+        return self._chalk
+
+    # following colors will be applied as the background or foreground color
+    bg = _ChainAttribute(background=True)
+    fg = _ChainAttribute(background=False)
+
+    bold = _ChainAttribute(style=Style.BOLD)
+    dim = _ChainAttribute(style=Style.DIM)
+    italic = _ChainAttribute(style=Style.ITALIC)
+    underline = _ChainAttribute(style=Style.UNDERLINE)
+    slow_blink = _ChainAttribute(style=Style.SLOW_BLINK)
+    rapid_blink = _ChainAttribute(style=Style.RAPID_BLINK)
+    reversed = _ChainAttribute(style=Style.REVERSED)
+    conceal = _ChainAttribute(style=Style.CONCEAL)
+    strikethrough = _ChainAttribute(style=Style.STRIKETHROUGH)
+    normal = _ChainAttribute(style=Style.NORMAL)
+
+    black = _ChainAttribute(color=Color.BLACK)
+    red = _ChainAttribute(color=Color.RED)
+    green = _ChainAttribute(color=Color.GREEN)
+    yellow = _ChainAttribute(color=Color.YELLOW)
+    blue = _ChainAttribute(color=Color.BLUE)
+    magenta = _ChainAttribute(color=Color.MAGENTA)
+    cyan = _ChainAttribute(color=Color.CYAN)
+    white = _ChainAttribute(color=Color.WHITE)
+
+    bright_black = _ChainAttribute(color=Color.BRIGHT_BLACK)
+    bright_red = _ChainAttribute(color=Color.BRIGHT_RED)
+    bright_green = _ChainAttribute(color=Color.BRIGHT_GREEN)
+    bright_yellow = _ChainAttribute(color=Color.BRIGHT_YELLOW)
+    bright_blue = _ChainAttribute(color=Color.BRIGHT_BLUE)
+    bright_magenta = _ChainAttribute(color=Color.BRIGHT_MAGENTA)
+    bright_cyan = _ChainAttribute(color=Color.BRIGHT_CYAN)
+    bright_white = _ChainAttribute(color=Color.BRIGHT_WHITE)
 
 
 chain = Chain()
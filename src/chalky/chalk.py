@@ -7,16 +7,133 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Optional, Set, Union, overload
-
-from .color import Color_T
-from .constants import is_disabled
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    FrozenSet,
+    Iterable,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
+from weakref import WeakValueDictionary
+
+from .cache import render_cache
+from .color import Color, Color_T, IndexedColor, TrueColor
+from .constants import is_cached, is_disabled
 from .interface import get_interface
+from .interface.base import BaseInterface
 from .style import Style
 
+STYLE_NAMES = {style.value: style for style in Style}
+COLOR_NAMES = {color.value: color for color in Color}
+
+Key_T = Tuple[type, FrozenSet[Style], Optional[Color_T], Optional[Color_T]]
+
+# packed chalk store the style bit mask in the lowest bits followed by both colors
+STYLE_ORDER = tuple(Style)
+STYLE_BITS = 16
+STYLE_MASK = (1 << STYLE_BITS) - 1
+STYLE_FLAGS = {style: 1 << index for index, style in enumerate(STYLE_ORDER)}
+
+# packed colors are 0 for no color, 1-255 for colors, 256-511 for indexed colors and
+# 2^24 + RGB for true colors
+COLOR_ORDER = tuple(Color)
+COLOR_CODES = {color: index + 1 for index, color in enumerate(COLOR_ORDER)}
+COLOR_BITS = 25
+COLOR_MASK = (1 << COLOR_BITS) - 1
+INDEXED_OFFSET = 256
+TRUECOLOR_FLAG = 1 << 24
+
+
+def pack_color(color: Optional[Color_T]) -> int:
+    """Pack a color into an integer.
+
+    Args:
+        color (Optional[:class:`~.color.Color_T`]):
+            The color to pack.
+
+    Returns:
+        int:
+            The packed color, 0 if there is no color.
+    """
+
+    if color is None:
+        return 0
+    if isinstance(color, TrueColor):
+        return TRUECOLOR_FLAG | (color.red << 16) | (color.green << 8) | color.blue
+    if isinstance(color, IndexedColor):
+        return INDEXED_OFFSET + color.index
+
+    return COLOR_CODES[color]
+
+
+def unpack_color(value: int) -> Optional[Color_T]:
+    """Unpack a color packed by :func:`~.chalk.pack_color`.
+
+    Args:
+        value (int):
+            The packed color.
+
+    Raises:
+        ValueError:
+            When the value is not a packed color.
+
+    Returns:
+        Optional[:class:`~.color.Color_T`]:
+            The unpacked color, None if there is no color.
+    """
+
+    if value == 0:
+        return None
+    if value & TRUECOLOR_FLAG:
+        return TrueColor((value >> 16) & 255, (value >> 8) & 255, value & 255)
+    if value <= len(COLOR_ORDER):
+        return COLOR_ORDER[value - 1]
+    if INDEXED_OFFSET <= value < INDEXED_OFFSET + 256:
+        return IndexedColor(value - INDEXED_OFFSET)
+
+    raise ValueError(f"Value {value} is not a packed color")
+
+
+@lru_cache(maxsize=None)
+def _get_styles(mask: int) -> FrozenSet[Style]:
+    return frozenset(style for style, flag in STYLE_FLAGS.items() if mask & flag)
+
+
+class _InternedMeta(type):
+    """Metaclass interning instances so equal chalk share a single instance."""
+
+    _interned: MutableMapping[Key_T, Any]
+
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        cls._interned = WeakValueDictionary()
+
+    def __call__(
+        cls,
+        style: Iterable[Style] = frozenset(),
+        foreground: Optional[Color_T] = None,
+        background: Optional[Color_T] = None,
+    ):
+        style = frozenset(style)
+        key = (cls, style, foreground, background)
+        instance = cls._interned.get(key)
+        if instance is None:
+            instance = super().__call__(style, foreground, background)
+            cls._interned[key] = instance
+
+        return instance
+
 
-@dataclass
-class Chalk:
+@dataclass(frozen=True, eq=False)
+class Chalk(metaclass=_InternedMeta):
     """Describes the style and color to use for styling some printable text.
 
     Chalk can be composed using ``&`` and can be applied to strings with ``|``.
@@ -52,12 +169,83 @@ class Chalk:
         >>> red = Chalk(foreground=Color.RED)
         >>> blue = Chalk(foreground=Color.BLUE)
         >>> assert blue == (red & blue)
+
+    .. note::
+
+        Chalk instances are immutable and interned, creating or composing chalk that
+        is equal to an existing instance returns that existing instance.
+        Equal chalk are therefore always identical and are compared by identity:
+
+        >>> assert Chalk(style={Style.BOLD}) is Chalk(style={Style.BOLD})
+        >>> assert (red & blue) is blue
     """
 
-    style: Set[Style] = field(default_factory=set)
+    style: FrozenSet[Style] = field(default_factory=frozenset)
     foreground: Optional[Color_T] = field(default=None)
     background: Optional[Color_T] = field(default=None)
 
+    if TYPE_CHECKING:  # pragma: no cover
+
+        def __init__(
+            self,
+            style: AbstractSet[Style] = frozenset(),
+            foreground: Optional[Color_T] = None,
+            background: Optional[Color_T] = None,
+        ):
+            """Initialize an instance, the metaclass freezes any given set of styles."""
+
+    @classmethod
+    def from_string(cls, spec: str) -> Chalk:
+        """Create an instance from a space separated description of styles and colors.
+
+        The description may contain any :class:`~.style.Style` or
+        :class:`~.color.Color` name and hex colors (``#ffffff``).
+        Colors following the word ``on`` are used as the background color.
+
+        Examples:
+            >>> Chalk.from_string("bold bright_red on #202020")
+
+        Args:
+            spec (str):
+                The description of the chalk to create.
+
+        Raises:
+            ValueError:
+                If the description contains an unknown style or color.
+
+        Returns:
+            :class:`~Chalk`:
+                The created instance.
+        """
+
+        style: Set[Style] = set()
+        colors = {}
+        background = False
+        for token in spec.lower().split():
+            if token == "on":
+                background = True
+                continue
+
+            color: Optional[Color_T] = None
+            if token.startswith("#"):
+                color = TrueColor.from_hex(token)
+            elif token in STYLE_NAMES and not background:
+                style.add(STYLE_NAMES[token])
+                continue
+            else:
+                color = COLOR_NAMES.get(token)
+
+            if color is None:
+                raise ValueError(f"Unknown style or color {token!r} in {spec!r}")
+
+            colors["background" if background else "foreground"] = color
+            background = False
+
+        if background:
+            raise ValueError(f"Missing background color after 'on' in {spec!r}")
+
+        return cls(style=style, **colors)
+
     def __and__(self, other: Chalk) -> Chalk:
         """Create a new chalk instance from the composition of two chalk.
 
@@ -70,12 +258,96 @@ class Chalk:
                 The newly created chalk instance.
         """
 
-        return Chalk(
-            style=self.style.union(other.style),
-            foreground=other.foreground or self.foreground,
-            background=other.background or self.background,
+        return compose(self, other)
+
+    def pack(self) -> int:
+        """Pack the styles and colors of the instance into a single integer.
+
+        Examples:
+            >>> packed = Chalk.from_string("bold red on #202020").pack()
+            >>> assert Chalk.unpack(packed) is Chalk.from_string("bold red on #202020")
+
+        Returns:
+            int:
+                The packed instance.
+        """
+
+        packed = 0
+        for style in self.style:
+            packed |= STYLE_FLAGS[style]
+
+        return (
+            packed
+            | (pack_color(self.foreground) << STYLE_BITS)
+            | (pack_color(self.background) << (STYLE_BITS + COLOR_BITS))
         )
 
+    @classmethod
+    def unpack(cls, value: int) -> Chalk:
+        """Get the instance of an integer packed by :meth:`~.chalk.Chalk.pack`.
+
+        Args:
+            value (int):
+                The packed instance.
+
+        Raises:
+            ValueError:
+                When the value is not a packed instance.
+
+        Returns:
+            :class:`~Chalk`:
+                The interned instance.
+        """
+
+        if value < 0 or value >> (STYLE_BITS + COLOR_BITS * 2):
+            raise ValueError(f"Value {value} is not a packed chalk")
+
+        mask = value & STYLE_MASK
+        if mask >> len(STYLE_ORDER):
+            raise ValueError(f"Value {value} is not a packed chalk")
+
+        return cls(
+            style=_get_styles(mask),
+            foreground=unpack_color((value >> STYLE_BITS) & COLOR_MASK),
+            background=unpack_color((value >> (STYLE_BITS + COLOR_BITS)) & COLOR_MASK),
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Reduce the instance to its packed integer.
+
+        Pickles only contain the integer and a reference to the function unpacking
+        it, which returns the interned instance.
+
+        Returns:
+            Tuple[Any, ...]:
+                The callable and arguments that recreate the instance.
+        """
+
+        if type(self) is Chalk:
+            return (_unpack, (self.pack(),))
+
+        return (_unpack, (self.pack(), type(self)))
+
+    def __copy__(self) -> Chalk:
+        """Copy the instance, interned instances are shared rather than copied.
+
+        Returns:
+            :class:`~Chalk`:
+                The current instance.
+        """
+
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Chalk:
+        """Deep copy the instance, interned instances are shared rather than copied.
+
+        Returns:
+            :class:`~Chalk`:
+                The current instance.
+        """
+
+        return self
+
     def __or__(self, value: Any) -> str:
         """Style some given string with the current chalk instance.
 
@@ -98,6 +370,9 @@ class Chalk:
             return str(value)
 
         interface = get_interface()
+        if is_cached():
+            return render_cache.render(interface, self, str(value))
+
         return interface.apply(
             value=str(value),
             style=self.style,
@@ -166,6 +441,36 @@ class Chalk:
 
         return self | value
 
+    def affixes(self, interface: Optional[BaseInterface] = None) -> Tuple[str, str]:
+        """Get the strings to place around a value to apply the current chalk.
+
+        This is useful when the same chalk is applied to many values as the escape
+        sequences only need to be built once.
+
+        Examples:
+            >>> prefix, suffix = Chalk(foreground=Color.RED).affixes()
+            >>> print("".join(f"{prefix}{value}{suffix}" for value in ("a", "b")))
+
+        Args:
+            interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+                The interface to build the affixes for.
+                Defaults to the interface for :data:`sys.stdout`.
+
+        Returns:
+            Tuple[str, str]:
+                The prefix and suffix to place before and after a value.
+                Both are empty if chalky is disabled.
+        """
+
+        if is_disabled():
+            return ("", "")
+
+        return (interface or get_interface()).get_affixes(
+            style=self.style,
+            background=self.background,
+            foreground=self.foreground,
+        )
+
     @property
     def reverse(self) -> Chalk:
         """Color reverse of the current chalk instance.
@@ -176,3 +481,29 @@ class Chalk:
         """
 
         return self & Chalk(style={Style.REVERSED})
+
+
+def _unpack(value: int, cls: Type[Chalk] = Chalk) -> Chalk:
+    return cls.unpack(value)
+
+
+@lru_cache(maxsize=1024)
+def compose(base: Chalk, other: Chalk) -> Chalk:
+    """Compose two chalk instances, caching the most recent compositions.
+
+    Args:
+        base (:class:`~Chalk`):
+            The chalk being composed onto.
+        other (:class:`~Chalk`):
+            The chalk whose colors override the colors of the base chalk.
+
+    Returns:
+        :class:`~Chalk`:
+            The interned composition of both chalk.
+    """
+
+    return Chalk(
+        style=base.style | other.style,
+        foreground=other.foreground or base.foreground,
+        background=other.background or base.background,
+    )
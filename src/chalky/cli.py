@@ -0,0 +1,366 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+r"""Contains the command-line colorizer exposed through ``python -m chalky``.
+
+Files and standard input are colorized with the rules of a JSON rules file:
+
+.. code-block:: bash
+
+    $ python -m chalky --rules rules.json build.log
+    $ tail -f service.log | python -m chalky
+
+Rules files contain a list of rules that each describe a ``style`` (see
+:meth:`~.chalk.Chalk.from_string`) and exactly one of a ``pattern``, a list of
+``keywords`` or one of the builtin ``preset`` patterns (``number``, ``ipv4``,
+``uuid``, ``path``, ``level``):
+
+.. code-block:: json
+
+    {
+      "rules": [
+        {"preset": "level", "style": "bold red", "priority": 2},
+        {"keywords": ["GET", "POST"], "style": "green"},
+        {"pattern": "\\d+ms", "style": "yellow"}
+      ]
+    }
+
+Regular files are read through :mod:`mmap` in large chunks split on line boundaries
+and all output is written through a single buffered binary writer, so arbitrarily
+large files are colorized in constant memory.
+"""
+
+import argparse
+import codecs
+import json
+import mmap
+import os
+import re
+import stat
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+
+from .chalk import Chalk
+from .constants import configure
+from .highlight import IPV4, LEVEL, NUMBER, PATH, UUID, Highlighter, Rule
+
+CHUNK_SIZE = 4 * 1024 * 1024
+BUFFER_SIZE = 1024 * 1024
+
+PRESETS = {
+    "number": NUMBER,
+    "ipv4": IPV4,
+    "uuid": UUID,
+    "path": PATH,
+    "level": LEVEL,
+}
+
+DEFAULT_RULES: List[Dict[str, Any]] = [
+    {"preset": "level", "style": "bold yellow", "priority": 4},
+    {"preset": "uuid", "style": "magenta", "priority": 3},
+    {"preset": "ipv4", "style": "cyan", "priority": 2},
+    {"preset": "path", "style": "blue", "priority": 1},
+    {"preset": "number", "style": "bright_magenta"},
+]
+
+
+def build_rule(definition: dict) -> Rule:
+    """Build a highlighter rule from its definition in a rules file.
+
+    Args:
+        definition (dict):
+            The rule definition.
+
+    Raises:
+        ValueError:
+            If the definition is missing a style, references an unknown preset or
+            contains a value of the wrong type or an invalid pattern.
+
+    Returns:
+        :class:`~.highlight.Rule`:
+            The built rule.
+    """
+
+    if "style" not in definition:
+        raise ValueError(f"Rule {definition!r} is missing a style")
+    if not isinstance(definition["style"], str):
+        raise ValueError(f"Rule {definition!r} style must be a string")
+
+    pattern = definition.get("pattern")
+    if pattern is not None:
+        if not isinstance(pattern, str):
+            raise ValueError(f"Rule {definition!r} pattern must be a string")
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            raise ValueError(
+                f"Rule {definition!r} has an invalid pattern, {exc!s}"
+            ) from exc
+
+    preset = definition.get("preset")
+    if preset is not None:
+        if preset not in PRESETS:
+            raise ValueError(f"Rule {definition!r} references unknown preset")
+        pattern = PRESETS[preset]
+
+    keywords = definition.get("keywords")
+    if keywords is not None and (
+        not isinstance(keywords, list)
+        or not all(isinstance(keyword, str) for keyword in keywords)
+    ):
+        raise ValueError(f"Rule {definition!r} keywords must be a list of strings")
+
+    priority = definition.get("priority", 0)
+    if not isinstance(priority, int) or isinstance(priority, bool):
+        raise ValueError(f"Rule {definition!r} priority must be an integer")
+
+    return Rule(
+        chalk=Chalk.from_string(definition["style"]),
+        pattern=pattern,
+        keywords=keywords,
+        priority=priority,
+    )
+
+
+def load_highlighter(rules_path: Optional[Path] = None) -> Highlighter:
+    """Load the highlighter described by a rules file.
+
+    Args:
+        rules_path (Optional[:class:`~pathlib.Path`], optional):
+            The path of the JSON rules file.
+            Defaults to the builtin rules.
+
+    Raises:
+        ValueError:
+            If a rule is invalid or the rules cannot be compiled together.
+
+    Returns:
+        :class:`~.highlight.Highlighter`:
+            The highlighter for the rules.
+    """
+
+    definitions: List[Dict[str, Any]] = DEFAULT_RULES
+    if rules_path is not None:
+        content: Union[Dict[str, Any], List[Dict[str, Any]]] = json.loads(
+            rules_path.read_text("utf-8")
+        )
+        definitions = content["rules"] if isinstance(content, dict) else content
+
+    highlighter = Highlighter([build_rule(definition) for definition in definitions])
+    try:
+        highlighter.compile()
+    except re.error as exc:
+        raise ValueError(f"Rules cannot be compiled, {exc!s}") from exc
+
+    return highlighter
+
+
+def iter_file_chunks(filepath: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read chunks of a regular file split on line boundaries through mmap.
+
+    Lines longer than the chunk size are split across chunks.
+
+    Args:
+        filepath (:class:`~pathlib.Path`):
+            The path of the file to read.
+        chunk_size (int, optional):
+            The maximum size of each chunk.
+            Defaults to :data:`~.cli.CHUNK_SIZE`.
+
+    Yields:
+        bytes:
+            The chunks of the file.
+    """
+
+    with filepath.open("rb") as file_io:
+        size = os.fstat(file_io.fileno()).st_size
+        if size == 0:
+            return
+
+        with mmap.mmap(file_io.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    newline = mapped.rfind(b"\n", start, end)
+                    if newline >= 0:
+                        end = newline + 1
+
+                yield mapped[start:end]
+                start = end
+
+
+def iter_stream_chunks(
+    stream: BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Read chunks of a stream split on line boundaries.
+
+    Args:
+        stream (:class:`~typing.BinaryIO`):
+            The stream to read.
+        chunk_size (int, optional):
+            The maximum size of each read.
+            Defaults to :data:`~.cli.CHUNK_SIZE`.
+
+    Yields:
+        bytes:
+            The chunks of the stream.
+    """
+
+    remainder = b""
+    read = getattr(stream, "read1", stream.read)
+    while True:
+        content = read(chunk_size)
+        if not content:
+            break
+
+        content = remainder + content
+        newline = content.rfind(b"\n")
+        if newline < 0 and len(content) < chunk_size:
+            remainder = content
+            continue
+
+        split = newline + 1 if newline >= 0 else len(content)
+        remainder = content[split:]
+        yield content[:split]
+
+    if remainder:
+        yield remainder
+
+
+def colorize(
+    chunks: Iterator[bytes],
+    output: BinaryIO,
+    highlighter: Highlighter,
+    flush: bool = False,
+) -> int:
+    """Colorize chunks of UTF-8 text and write them to a binary output.
+
+    Bytes that are not valid UTF-8 are passed through untouched.
+
+    Args:
+        chunks (Iterator[bytes]):
+            The chunks of text to colorize.
+        output (:class:`~typing.BinaryIO`):
+            The binary output to write to.
+        highlighter (:class:`~.highlight.Highlighter`):
+            The highlighter to colorize the text with.
+        flush (bool, optional):
+            If True, will flush the output after every chunk.
+            Defaults to False.
+
+    Returns:
+        int:
+            The number of input bytes colorized.
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="surrogateescape")
+    size = 0
+    for chunk in chunks:
+        size += len(chunk)
+        text = decoder.decode(chunk)
+        if text:
+            output.write(
+                highlighter.highlight(text).encode("utf-8", errors="surrogateescape")
+            )
+            if flush:
+                output.flush()
+
+    text = decoder.decode(b"", final=True)
+    if text:
+        output.write(
+            highlighter.highlight(text).encode("utf-8", errors="surrogateescape")
+        )
+
+    return size
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the command-line colorizer.
+
+    Returns:
+        :class:`~argparse.ArgumentParser`:
+            The built argument parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="chalky", description="Colorize text using highlighting rules."
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        type=Path,
+        help="files to colorize, reads standard input if none or '-' are given",
+    )
+    parser.add_argument(
+        "-r", "--rules", type=Path, help="JSON rules file, defaults to builtin rules"
+    )
+    parser.add_argument(
+        "--color",
+        choices=("auto", "always", "never"),
+        default="auto",
+        help="when to colorize the output",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line colorizer.
+
+    Args:
+        argv (Optional[List[str]], optional):
+            The command-line arguments.
+            Defaults to :data:`sys.argv`.
+
+    Returns:
+        int:
+            The exit code of the command.
+    """
+
+    arguments = build_parser().parse_args(argv)
+    try:
+        highlighter = load_highlighter(arguments.rules)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"chalky: failed to load rules, {exc!s}", file=sys.stderr)
+        return 2
+
+    sys.stdout.flush()
+    output = open(sys.stdout.fileno(), "wb", buffering=BUFFER_SIZE, closefd=False)
+    if arguments.color != "auto":
+        configure(disable=arguments.color == "never")
+    else:
+        configure(disable=not output.isatty())
+
+    try:
+        for filepath in arguments.files or [Path("-")]:
+            if str(filepath) == "-":
+                stdin_chunks = iter_stream_chunks(sys.stdin.buffer)
+                colorize(stdin_chunks, output, highlighter, flush=True)
+            elif stat.S_ISREG(filepath.stat().st_mode):
+                colorize(iter_file_chunks(filepath), output, highlighter)
+            else:
+                with filepath.open("rb") as stream:
+                    colorize(
+                        iter_stream_chunks(stream), output, highlighter, flush=True
+                    )
+    except BrokenPipeError:
+        # the reader went away, such as when piping into head, so stop quietly and
+        # point stdout at devnull to avoid another error when it is flushed on exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        return 141
+    except OSError as exc:
+        print(f"chalky: {exc!s}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        try:
+            output.close()
+        except BrokenPipeError:
+            pass
+
+    return 0
@@ -56,6 +56,26 @@ class Color(Enum):
     BRIGHT_WHITE = "bright_white"
 
 
+XTERM_SYSTEM_COLORS = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+
 @dataclass
 class TrueColor:
     """Describes a true color that can be displayed on compatible terminals.
@@ -113,6 +133,39 @@ class TrueColor:
 
         return cls(red=red, green=green, blue=blue)
 
+    @classmethod
+    def from_xterm(cls, index: int) -> TrueColor:
+        """Create an instance from an index of the xterm 256 color palette.
+
+        Args:
+            index (int):
+                The index of the color in the palette (0-255).
+
+        Raises:
+            ValueError:
+                If the given index is outside of the palette.
+
+        Returns:
+            TrueColor:
+                The created instance.
+        """
+
+        if not (0 <= index <= 255):
+            raise ValueError(f"Xterm color index {index} is not within 0-255")
+
+        if index < 16:
+            return cls(*XTERM_SYSTEM_COLORS[index])
+
+        if index < 232:
+            index -= 16
+            red, green, blue = index // 36, (index // 6) % 6, index % 6
+            return cls(
+                *((value * 40 + 55) if value > 0 else 0 for value in (red, green, blue))
+            )
+
+        gray = (index - 232) * 10 + 8
+        return cls(gray, gray, gray)
+
     def to_bytes(self) -> Tuple[bytes, bytes, bytes]:
         """Convert the current color to a tuple of RGB bytes.
 
@@ -128,4 +181,39 @@ class TrueColor:
         )
 
 
-Color_T = Union[Color, TrueColor]
+@dataclass(frozen=True)
+class IndexedColor:
+    """Describes a color of the xterm 256 color palette.
+
+    Indexed colors are displayed by terminals that do not support truecolors and are
+    applied through precomputed escape sequences, just like the named colors.
+
+    Parameters:
+        index (int):
+            The index of the color in the palette (0-255).
+
+    Raises:
+        ValueError:
+            If the given index is outside of the palette.
+    """
+
+    index: int
+
+    def __post_init__(self):
+        """Validate the index of the color."""
+
+        if not (0 <= self.index <= 255):
+            raise ValueError(f"Xterm color index {self.index} is not within 0-255")
+
+    def to_true_color(self) -> TrueColor:
+        """Convert the current color to the truecolor of the xterm palette.
+
+        Returns:
+            TrueColor:
+                The truecolor of the xterm palette at the current index.
+        """
+
+        return TrueColor.from_xterm(self.index)
+
+
+Color_T = Union[Color, TrueColor, IndexedColor]
@@ -10,10 +10,24 @@ future application of :class:`~.chalk.Chalk` to strings.
 >>> from chalky import configure, fg
 >>> configure(disable=True)
 >>> print(fg.green | "I'm NOT green text")
+
+Instrumentation of the package can also be enabled through the same method:
+
+>>> from chalky import configure, stats
+>>> configure(instrument=True)
+>>> stats().compositions
+0
+
+The render cache of repeatedly styled values is also enabled through the same method:
+
+>>> configure(cache=True)
 """
 
+from typing import Optional
 
 DISABLED = False
+INSTRUMENTED = False
+CACHED = False
 
 
 def is_disabled() -> bool:
@@ -27,15 +41,67 @@ def is_disabled() -> bool:
     return DISABLED
 
 
-def configure(disable: bool = False):
+def is_instrumented() -> bool:
+    """Callable to evaluate the instrumented conditional.
+
+    Returns:
+        bool:
+            True if chalky is collecting instrumentation, otherwise False.
+    """
+
+    return INSTRUMENTED
+
+
+def is_cached() -> bool:
+    """Callable to evaluate the cached conditional.
+
+    Returns:
+        bool:
+            True if applied chalk are rendered through the render cache, otherwise
+            False.
+    """
+
+    return CACHED
+
+
+def configure(
+    disable: Optional[bool] = None,
+    instrument: Optional[bool] = None,
+    cache: Optional[bool] = None,
+):
     """Configure the global state of the chalky module.
 
+    Options that are not given keep their current value.
+
     Args:
-        disable (bool, optional):
+        disable (Optional[bool], optional):
             If True, will disable all future application of colors and styles.
-            Defaults to False.
+            Defaults to None.
+        instrument (Optional[bool], optional):
+            If True, will collect counters and timings reported by
+            :func:`~.instrument.stats` and :func:`~.instrument.profile`.
+            When False, the instrumentation is removed entirely.
+            Defaults to None.
+        cache (Optional[bool], optional):
+            If True, will return repeatedly applied values from the
+            :class:`~.cache.RenderCache`.
+            The cache is cleared by every call to this function.
+            Defaults to None.
     """
 
-    global DISABLED
+    global DISABLED, CACHED
+
+    from . import instrument as _instrument
+    from .cache import render_cache
+
+    if disable is not None:
+        DISABLED = disable
+    if cache is not None:
+        CACHED = cache
+    render_cache.clear()
 
-    DISABLED = disable
+    # the instrumentation flag is kept by installing and uninstalling the wrappers
+    if instrument is True:
+        _instrument.install()
+    elif instrument is False:
+        _instrument.uninstall()
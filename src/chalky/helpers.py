@@ -7,6 +7,7 @@
 import os
 import platform
 import subprocess
+import sys
 
 
 def supports_posix() -> bool:
@@ -58,6 +59,61 @@ def supports_truecolor() -> bool:
     return False
 
 
+def supports_synchronized_output() -> bool:
+    """Attempt to check if the current terminal supports synchronized output.
+
+    Synchronized output is enabled through the DEC private mode 2026 and allows
+    terminals to display all updates made between the start and end of the mode at
+    once.
+
+    Returns:
+        bool:
+            True if the current terminal supports synchronized output, otherwise False.
+    """
+
+    term_program = os.getenv("TERM_PROGRAM")
+    if term_program and term_program.lower() in (
+        "wezterm",
+        "iterm.app",
+        "ghostty",
+        "contour",
+    ):
+        return True
+
+    term = os.getenv("TERM")
+    if not term:
+        return False
+
+    term = term.lower()
+    return any(
+        value in term
+        for value in (
+            "kitty",
+            "foot",
+            "alacritty",
+            "contour",
+            "ghostty",
+            "wezterm",
+        )
+    )
+
+
+def supports_free_threading() -> bool:
+    """Check if the current interpreter is running without the global interpreter lock.
+
+    Returns:
+        bool:
+            True if the current interpreter is a free-threaded build with the GIL
+            disabled, otherwise False.
+    """
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return False
+
+    return not is_gil_enabled()
+
+
 def int_to_bytes(value: int) -> bytes:
     """Convert a given number to its representation in bytes.
 
@@ -0,0 +1,400 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a highlighter that applies many rules to text in a single pass.
+
+Rules map either a regular expression or a set of keywords to the chalk used to
+style their matches.
+All rules are compiled into a single combined pass over the text rather than running
+a separate pass for each rule:
+
+>>> from chalky import fg, sty
+>>> from chalky.highlight import IPV4, LEVEL, NUMBER, Highlighter
+>>> highlighter = Highlighter()
+>>> highlighter.add_pattern(LEVEL, sty.bold & fg.red, priority=2)
+>>> highlighter.add_pattern(IPV4, fg.cyan, priority=1)
+>>> highlighter.add_pattern(NUMBER, fg.magenta)
+>>> highlighter.add_keywords(["GET", "POST", "PUT", "DELETE"], fg.green)
+>>> print(highlighter | "ERROR 10.0.0.1 GET /index.html took 35ms")
+
+Matches are found from left to right.
+When several rules match at the same position, the rule with the highest priority
+is used.
+Keyword sets larger than :data:`~.highlight.AUTOMATON_THRESHOLD` are matched with an
+Aho-Corasick automaton, which results in the same matches as if the keywords were part
+of the combined regular expression.
+"""
+
+import re
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Collection, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from .chalk import Chalk
+from .constants import is_disabled
+from .interface import get_interface
+from .interface.base import BaseInterface
+
+NUMBER = r"\b\d+(?:\.\d+)?\b"
+IPV4 = r"\b(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)\b"
+UUID = (
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+PATH = r"(?:~|\.{1,2})?(?:/[\w.\-]+)+/?"
+LEVEL = r"\b(?:CRITICAL|FATAL|ERROR|WARN(?:ING)?|INFO|DEBUG|TRACE)\b"
+
+# Keyword sets larger than this are matched through an Aho-Corasick automaton instead
+# of being folded into the combined regular expression.
+AUTOMATON_THRESHOLD = 64
+
+Span_T = Tuple[int, int, int]
+
+
+@dataclass
+class Rule:
+    """Describes a single highlighting rule.
+
+    Parameters:
+        chalk (:class:`~.chalk.Chalk`):
+            The chalk to style matches of the rule with.
+        pattern (Optional[str], optional):
+            The regular expression to match.
+            Defaults to None.
+        keywords (Optional[Collection[str]], optional):
+            The keywords to match as whole words.
+            Defaults to None.
+        priority (int, optional):
+            The priority of the rule when matches overlap, higher wins.
+            Defaults to 0.
+    """
+
+    chalk: Chalk
+    pattern: Optional[str] = field(default=None)
+    keywords: Optional[Collection[str]] = field(default=None)
+    priority: int = field(default=0)
+
+
+def _is_word_character(character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+
+class _KeywordAutomaton:
+    """An Aho-Corasick automaton matching whole-word keywords."""
+
+    def __init__(self, keywords: Dict[str, Tuple[int, int]]):
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.outputs: List[List[Tuple[int, int, int]]] = [[]]
+
+        for keyword, (priority, rule_index) in keywords.items():
+            state = 0
+            for character in keyword:
+                next_state = self.transitions[state].get(character)
+                if next_state is None:
+                    next_state = len(self.transitions)
+                    self.transitions[state][character] = next_state
+                    self.transitions.append({})
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append((len(keyword), priority, rule_index))
+
+        self.failures = [0] * len(self.transitions)
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                failure = self.failures[state]
+                while failure and character not in self.transitions[failure]:
+                    failure = self.failures[failure]
+                self.failures[next_state] = self.transitions[failure].get(character, 0)
+                self.outputs[next_state] = (
+                    self.outputs[next_state] + self.outputs[self.failures[next_state]]
+                )
+
+    def finditer(self, value: str) -> Iterator[Tuple[int, int, int, int]]:
+        transitions, failures, outputs = self.transitions, self.failures, self.outputs
+        length = len(value)
+        state = 0
+        for index, character in enumerate(value):
+            while state and character not in transitions[state]:
+                state = failures[state]
+            state = transitions[state].get(character, 0)
+
+            for keyword_length, priority, rule_index in outputs[state]:
+                start, end = index - keyword_length + 1, index + 1
+                if start > 0 and _is_word_character(value[start - 1]):
+                    continue
+                if end < length and _is_word_character(value[end]):
+                    continue
+                yield (start, end, priority, rule_index)
+
+
+class Highlighter:
+    """Apply many highlighting rules to text in a single combined pass.
+
+    Parameters:
+        rules (Optional[Collection[:class:`~.highlight.Rule`]], optional):
+            The initial rules of the highlighter.
+            Defaults to no rules.
+        interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+            The interface to style matches for.
+            Defaults to the interface for :data:`sys.stdout`.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Collection[Rule]] = None,
+        interface: Optional[BaseInterface] = None,
+    ):
+        """Initialize the highlighter with some optional starting rules."""
+
+        self.rules: List[Rule] = []
+        self.interface = interface
+
+        self._pattern: Optional[Pattern] = None
+        self._group_rules: Dict[int, int] = {}
+        self._automaton: Optional[_KeywordAutomaton] = None
+        self._compiled = False
+        self._affixes: List[Tuple[str, str]] = []
+        self._affixes_key: Optional[Tuple[bool, BaseInterface]] = None
+
+        for rule in rules or []:
+            self.add(rule)
+
+    def __or__(self, value: str) -> str:
+        """Highlight the given string.
+
+        Args:
+            value (str):
+                The string to highlight.
+
+        Returns:
+            str:
+                The highlighted string.
+        """
+
+        return self.highlight(value)
+
+    def __call__(self, value: str) -> str:
+        """Highlight the given string.
+
+        Args:
+            value (str):
+                The string to highlight.
+
+        Returns:
+            str:
+                The highlighted string.
+        """
+
+        return self.highlight(value)
+
+    def add(self, rule: Rule):
+        """Add a new rule to the highlighter.
+
+        Args:
+            rule (:class:`~.highlight.Rule`):
+                The rule to add.
+
+        Raises:
+            ValueError:
+                When the rule has either none or both of a pattern and keywords.
+        """
+
+        if (rule.pattern is None) == (rule.keywords is None):
+            raise ValueError("Rules must have exactly one of a pattern or keywords")
+
+        self.rules.append(rule)
+        self._compiled = False
+        self._affixes_key = None
+
+    def add_pattern(self, pattern: str, chalk: Chalk, priority: int = 0):
+        """Add a regular expression rule to the highlighter.
+
+        .. important::
+            Patterns are combined into a single regular expression, so they must not
+            use numbered backreferences.
+
+        Args:
+            pattern (str):
+                The regular expression to match.
+            chalk (:class:`~.chalk.Chalk`):
+                The chalk to style matches with.
+            priority (int, optional):
+                The priority of the rule when matches overlap, higher wins.
+                Defaults to 0.
+        """
+
+        self.add(Rule(chalk=chalk, pattern=pattern, priority=priority))
+
+    def add_keywords(self, keywords: Collection[str], chalk: Chalk, priority: int = 0):
+        """Add a keyword rule to the highlighter.
+
+        Args:
+            keywords (Collection[str]):
+                The keywords to match as whole words.
+            chalk (:class:`~.chalk.Chalk`):
+                The chalk to style matches with.
+            priority (int, optional):
+                The priority of the rule when matches overlap, higher wins.
+                Defaults to 0.
+        """
+
+        self.add(Rule(chalk=chalk, keywords=list(keywords), priority=priority))
+
+    def compile(self):
+        """Compile all rules into the combined regular expression and automaton."""
+
+        alternatives: List[str] = []
+        automaton_keywords: Dict[str, Tuple[int, int]] = {}
+        ordered = sorted(
+            enumerate(self.rules), key=lambda item: item[1].priority, reverse=True
+        )
+        for rule_index, rule in ordered:
+            if rule.keywords is not None:
+                keywords = [keyword for keyword in rule.keywords if keyword]
+                if len(keywords) > AUTOMATON_THRESHOLD:
+                    for keyword in keywords:
+                        automaton_keywords.setdefault(
+                            keyword, (rule.priority, rule_index)
+                        )
+                    continue
+
+                if not keywords:
+                    continue
+
+                pattern = r"(?<!\w)(?:{})(?!\w)".format(
+                    "|".join(
+                        re.escape(keyword)
+                        for keyword in sorted(keywords, key=len, reverse=True)
+                    )
+                )
+            else:
+                pattern = str(rule.pattern)
+
+            alternatives.append(f"(?P<_rule{rule_index}>{pattern})")
+
+        self._pattern = None
+        self._group_rules = {}
+        if alternatives:
+            self._pattern = re.compile("|".join(alternatives), re.MULTILINE)
+            self._group_rules = {
+                group_index: int(name[len("_rule") :])
+                for name, group_index in self._pattern.groupindex.items()
+                if name.startswith("_rule")
+            }
+
+        self._automaton = (
+            _KeywordAutomaton(automaton_keywords) if automaton_keywords else None
+        )
+        self._compiled = True
+
+    def _get_affixes(self) -> List[Tuple[str, str]]:
+        interface = self.interface or get_interface()
+        key = (is_disabled(), interface)
+        if key != self._affixes_key:
+            self._affixes = [rule.chalk.affixes(interface) for rule in self.rules]
+            self._affixes_key = key
+
+        return self._affixes
+
+    def _iter_pattern_spans(self, value: str) -> Iterator[Span_T]:
+        if self._pattern is None:
+            return
+
+        group_rules = self._group_rules
+        for match in self._pattern.finditer(value):
+            start, end = match.span()
+            if start != end:
+                yield (start, end, group_rules[match.lastindex])  # type: ignore
+
+    def _search_pattern(self, value: str, position: int) -> Optional[Span_T]:
+        if self._pattern is None:
+            return None
+
+        while position <= len(value):
+            match = self._pattern.search(value, position)
+            if match is None:
+                return None
+
+            start, end = match.span()
+            if start != end:
+                return (start, end, self._group_rules[match.lastindex])  # type: ignore
+            position = end + 1
+
+        return None
+
+    def _resolve(self, value: str) -> List[Span_T]:
+        # keyword matches are ordered like the alternatives of the combined pattern,
+        # so taking the leftmost of both matches results in the same spans as if the
+        # keywords were part of the pattern
+        keywords = deque(
+            sorted(
+                self._automaton.finditer(value) if self._automaton else (),
+                key=lambda item: (item[0], -item[2], item[3], item[0] - item[1]),
+            )
+        )
+        spans: List[Span_T] = []
+        position = 0
+        match = self._search_pattern(value, position)
+        while True:
+            while keywords and keywords[0][0] < position:
+                keywords.popleft()
+            if match is not None and match[0] < position:
+                match = self._search_pattern(value, position)
+
+            span = match
+            if keywords:
+                start, end, priority, rule_index = keywords[0]
+                if match is None or (start, -priority, rule_index) < (
+                    match[0],
+                    -self.rules[match[2]].priority,
+                    match[2],
+                ):
+                    span = (start, end, rule_index)
+
+            if span is None:
+                return spans
+
+            spans.append(span)
+            position = span[1]
+
+    def highlight(self, value: str) -> str:
+        """Highlight the given string.
+
+        Args:
+            value (str):
+                The string to highlight.
+
+        Returns:
+            str:
+                The highlighted string.
+        """
+
+        if not self._compiled:
+            self.compile()
+
+        spans = (
+            self._resolve(value)
+            if self._automaton is not None
+            else self._iter_pattern_spans(value)
+        )
+
+        affixes = self._get_affixes()
+        pieces: List[str] = []
+        last = 0
+        for start, end, rule_index in spans:
+            prefix, suffix = affixes[rule_index]
+            pieces.append(value[last:start])
+            pieces.append(prefix)
+            pieces.append(value[start:end])
+            pieces.append(suffix)
+            last = end
+
+        if last == 0:
+            return value
+
+        pieces.append(value[last:])
+        return "".join(pieces)
@@ -0,0 +1,293 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a renderer for drawing images in the terminal with half-block characters.
+
+Each cell draws two vertically stacked pixels using the upper half block ``▀``, the
+top pixel as the foreground color and the bottom pixel as the background color:
+
+>>> from chalky.image import read_ppm, render
+>>> print(render(read_ppm("chart.ppm"), width=80))
+
+Images can be rendered for terminals without truecolor support by passing the number
+of colors to render with, optionally dithered to hide the banding of the smaller
+palette:
+
+>>> print(render(read_ppm("chart.ppm"), width=80, colors=256, dither=True))
+
+All pixels are mapped to color codes at once, Python only loops over the runs of
+identical cells of each line.
+
+.. important::
+    This module requires :mod:`numpy` which is installed with the ``array`` extra
+    (``pip install chalky[array]``).
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "chalky.image requires numpy, install it with `pip install chalky[array]`"
+    ) from exc
+
+from .color import XTERM_SYSTEM_COLORS
+from .helpers import supports_truecolor
+from .interface._sequences import RESET
+
+UPPER_HALF_BLOCK = "▀"
+TRUECOLOR = 1 << 24
+COLORS = (TRUECOLOR, 256, 16)
+
+PPM_HEADER_PATTERN = re.compile(rb"(?:\s+|#[^\n]*\n?)*(\S+)")
+
+CUBE_LEVELS = numpy.array([0, 95, 135, 175, 215, 255])
+CUBE_THRESHOLDS = (CUBE_LEVELS[1:] + CUBE_LEVELS[:-1]) / 2
+SYSTEM_PALETTE = numpy.array(XTERM_SYSTEM_COLORS, dtype=numpy.int32)
+
+BAYER_MATRIX = (
+    numpy.array(
+        [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]],
+        dtype=numpy.float64,
+    )
+    + 0.5
+) / 16 - 0.5
+
+# the distance between palette colors which dithering spreads over
+DITHER_SPREAD = {256: 40.0, 16: 128.0}
+
+# SGR parameters of the palette indexes, background codes follow at an offset of 10
+SYSTEM_CODES = list(range(30, 38)) + list(range(90, 98))
+NO_COLOR = -1
+
+
+def _read_header(content: bytes, count: int) -> Tuple[List[bytes], int]:
+    tokens: List[bytes] = []
+    position = 2
+    while len(tokens) < count:
+        match = PPM_HEADER_PATTERN.match(content, position)
+        if match is None:
+            raise ValueError("PPM header is truncated")
+        tokens.append(match.group(1))
+        position = match.end()
+
+    return tokens, position
+
+
+def read_ppm(source: Union[str, Path, bytes]) -> numpy.ndarray:
+    """Read the pixels of a binary (``P6``) or plain (``P3``) PPM image.
+
+    Args:
+        source (Union[str, :class:`~pathlib.Path`, bytes]):
+            The path of the image or the content of the image.
+
+    Raises:
+        ValueError:
+            When the image is not a valid PPM image.
+
+    Returns:
+        numpy.ndarray:
+            The (height, width, 3) array of RGB pixels.
+    """
+
+    content = source if isinstance(source, bytes) else Path(source).read_bytes()
+    magic = content[:2]
+    if magic not in (b"P6", b"P3"):
+        raise ValueError(f"Image is not a PPM image, magic number is {magic!r}")
+
+    header, position = _read_header(content, 3)
+    width, height, maxval = (int(token) for token in header)
+    if not (0 < maxval < 65536):
+        raise ValueError(f"PPM maximum value {maxval} is not within 1-65535")
+
+    size = width * height * 3
+    values: numpy.ndarray
+    if magic == b"P3":
+        values = numpy.array(content[position:].split()[:size], dtype=numpy.int64)
+    else:
+        # a single whitespace character separates the header from the pixels
+        dtype = ">u2" if maxval > 255 else numpy.uint8
+        values = numpy.frombuffer(content, dtype=dtype, count=size, offset=position + 1)
+
+    if values.size != size:
+        raise ValueError(f"PPM image contains {values.size} values, expected {size}")
+
+    if maxval != 255:
+        values = numpy.rint(values.astype(numpy.float64) * (255 / maxval))
+
+    return values.astype(numpy.uint8).reshape(height, width, 3)
+
+
+def _resize(pixels: numpy.ndarray, width: int) -> numpy.ndarray:
+    height, original_width = pixels.shape[:2]
+    resized_height = max(1, round(height * width / original_width))
+    rows = (numpy.arange(resized_height) * height) // resized_height
+    columns = (numpy.arange(width) * original_width) // width
+    return pixels[rows[:, numpy.newaxis], columns]
+
+
+def _dither(pixels: numpy.ndarray, colors: int) -> numpy.ndarray:
+    height, width = pixels.shape[:2]
+    threshold = numpy.tile(BAYER_MATRIX, (height // 4 + 1, width // 4 + 1))
+    offset = threshold[:height, :width, numpy.newaxis] * DITHER_SPREAD[colors]
+    return numpy.clip(pixels + offset, 0, 255)
+
+
+def get_xterm_indexes(pixels: numpy.ndarray) -> numpy.ndarray:
+    """Get the indexes of the closest colors of the xterm 256 color palette.
+
+    Only the color cube and grayscale ramp (16-255) are matched, as the system colors
+    are configured differently by every terminal.
+
+    Args:
+        pixels (numpy.ndarray):
+            The (..., 3) array of RGB pixels.
+
+    Returns:
+        numpy.ndarray:
+            The palette indexes of the pixels.
+    """
+
+    values: numpy.ndarray = numpy.asarray(pixels, dtype=numpy.float64)
+    levels = numpy.asarray(numpy.searchsorted(CUBE_THRESHOLDS, values))
+    cube = CUBE_LEVELS[levels]
+    cube_index = 16 + levels[..., 0] * 36 + levels[..., 1] * 6 + levels[..., 2]
+
+    gray_level = numpy.rint((values.mean(axis=-1) - 8) / 10)
+    gray_level = numpy.clip(gray_level, 0, 23).astype(numpy.int64)
+    gray = (gray_level * 10 + 8)[..., numpy.newaxis]
+
+    cube_distance = ((values - cube) ** 2).sum(axis=-1)
+    gray_distance = ((values - gray) ** 2).sum(axis=-1)
+    return numpy.where(gray_distance < cube_distance, 232 + gray_level, cube_index)
+
+
+def get_system_indexes(pixels: numpy.ndarray) -> numpy.ndarray:
+    """Get the indexes of the closest of the 16 system colors.
+
+    Args:
+        pixels (numpy.ndarray):
+            The (..., 3) array of RGB pixels.
+
+    Returns:
+        numpy.ndarray:
+            The indexes of the pixels within :data:`~.color.XTERM_SYSTEM_COLORS`.
+    """
+
+    pixels = numpy.asarray(pixels, dtype=numpy.int32)
+    distance = ((pixels[..., numpy.newaxis, :] - SYSTEM_PALETTE) ** 2).sum(axis=-1)
+    return distance.argmin(axis=-1)
+
+
+def _get_keys(pixels: numpy.ndarray, colors: int) -> numpy.ndarray:
+    if colors == 256:
+        return get_xterm_indexes(pixels)
+    if colors == 16:
+        return get_system_indexes(pixels)
+
+    pixels = pixels.astype(numpy.int64)
+    return (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+
+
+def _get_code(key: int, colors: int, background: bool) -> str:
+    if key == NO_COLOR:
+        return "49" if background else "39"
+    if colors == 16:
+        return str(SYSTEM_CODES[key] + (10 if background else 0))
+
+    prefix = "48" if background else "38"
+    if colors == 256:
+        return f"{prefix};5;{key}"
+
+    return f"{prefix};2;{key >> 16};{(key >> 8) & 255};{key & 255}"
+
+
+def render(
+    pixels: numpy.ndarray,
+    width: Optional[int] = None,
+    colors: Optional[int] = None,
+    dither: bool = False,
+) -> str:
+    """Render an image as lines of half-block characters.
+
+    Args:
+        pixels (numpy.ndarray):
+            The (height, width, 3) array of RGB pixels.
+        width (Optional[int], optional):
+            The number of columns to scale the image to, keeping its aspect ratio.
+            Defaults to one column for each pixel.
+        colors (Optional[int], optional):
+            The number of colors to render with, one of ``16``, ``256`` or
+            :data:`~.image.TRUECOLOR`.
+            Defaults to truecolor if the terminal supports it, otherwise 256.
+        dither (bool, optional):
+            If True, will apply ordered dithering when rendering with 16 or 256
+            colors.
+            Defaults to False.
+
+    Raises:
+        ValueError:
+            When the pixels are not (height, width, 3) or the number of colors is not
+            supported.
+
+    Returns:
+        str:
+            The lines of the rendered image, each ending with a reset.
+    """
+
+    pixels = numpy.asarray(pixels)
+    if pixels.ndim != 3 or pixels.shape[2] != 3 or 0 in pixels.shape:
+        raise ValueError(f"Pixels must be (height, width, 3), received {pixels.shape}")
+
+    if colors is None:
+        colors = TRUECOLOR if supports_truecolor() else 256
+    if colors not in COLORS:
+        raise ValueError(f"Colors must be one of {COLORS!r}, received {colors!r}")
+
+    if width is not None and width != pixels.shape[1]:
+        pixels = _resize(pixels, width)
+    if dither and colors != TRUECOLOR:
+        pixels = _dither(pixels, colors)
+
+    keys = _get_keys(pixels, colors)
+    if len(keys) % 2:
+        keys = numpy.vstack([keys, numpy.full((1, keys.shape[1]), NO_COLOR)])
+    foreground, background = keys[0::2], keys[1::2]
+
+    # cells are split into runs wherever either color differs from the previous cell
+    changes = numpy.ones(foreground.shape, dtype=bool)
+    changes[:, 1:] = (foreground[:, 1:] != foreground[:, :-1]) | (
+        background[:, 1:] != background[:, :-1]
+    )
+
+    codes: Dict[Tuple[int, bool], str] = {}
+    lines: List[str] = []
+    for row, (foreground_row, background_row) in enumerate(
+        zip(foreground.tolist(), background.tolist())
+    ):
+        starts = numpy.flatnonzero(changes[row]).tolist() + [len(foreground_row)]
+        line: List[str] = []
+        previous: Tuple[Optional[int], Optional[int]] = (None, None)
+        for start, end in zip(starts, starts[1:]):
+            cell = (foreground_row[start], background_row[start])
+            params = []
+            for index, is_background in ((0, False), (1, True)):
+                if cell[index] != previous[index]:
+                    key = (cell[index], is_background)
+                    code = codes.get(key)
+                    if code is None:
+                        code = _get_code(cell[index], colors, is_background)
+                        codes[key] = code
+                    params.append(code)
+
+            line.append(f"\x1b[{';'.join(params)}m{UPPER_HALF_BLOCK * (end - start)}")
+            previous = cell
+
+        line.append(RESET)
+        lines.append("".join(line))
+
+    return "\n".join(lines)
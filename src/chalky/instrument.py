@@ -0,0 +1,374 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains the optional instrumentation of the package.
+
+Instrumentation is disabled by default and costs nothing while it is disabled.
+Enabling it through :func:`~.constants.configure` swaps the hot methods of
+:class:`~.chalk.Chalk` and the interfaces for counting wrappers, disabling it puts
+the original methods back in place.
+
+>>> from chalky import configure, fg, stats
+>>> configure(instrument=True)
+>>> print(fg.red | "Counted red text")
+>>> stats().interfaces["<stdout>"].applies
+1
+
+Use :func:`~.instrument.profile` to measure the time spent building escape sequences
+versus the time spent writing to the terminal buffer:
+
+>>> from chalky import profile
+>>> with profile() as report:
+...     print(fg.red | "Profiled red text")
+>>> report.build_time, report.io_time
+"""
+
+import functools
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from . import constants
+from .cache import render_cache
+from .chalk import Chalk, compose
+from .interface import _get_interface
+from .interface.ansi import AnsiInterface, get_prefix
+from .interface.base import BaseInterface
+from .width import _measure
+
+
+@dataclass
+class InterfaceStats:
+    """Describes the counters collected for a single interface.
+
+    Parameters:
+        applies (int):
+            The number of times styles were applied to a value.
+        writes (int):
+            The number of writes made to the interface's text io buffer.
+        flushes (int):
+            The number of flushes made to the interface's text io buffer.
+        bytes_emitted (int):
+            The number of bytes written to the interface's text io buffer.
+    """
+
+    applies: int = field(default=0)
+    writes: int = field(default=0)
+    flushes: int = field(default=0)
+    bytes_emitted: int = field(default=0)
+
+
+@dataclass
+class CacheStats:
+    """Describes the current state of a registered cache.
+
+    Parameters:
+        hits (int):
+            The number of lookups that were answered by the cache.
+        misses (int):
+            The number of lookups that had to be computed.
+        size (int):
+            The current number of entries in the cache.
+        maxsize (Optional[int]):
+            The maximum number of entries in the cache, ``None`` if unbounded.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: Optional[int]
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of lookups that were answered by the cache.
+
+        Returns:
+            float:
+                The hit rate of the cache (0.0-1.0).
+        """
+
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) if lookups > 0 else 0.0
+
+
+@dataclass
+class Stats:
+    """Describes a snapshot of the collected instrumentation.
+
+    Parameters:
+        enabled (bool):
+            True if instrumentation was enabled when the snapshot was taken.
+        compositions (int):
+            The number of chalk compositions (``&``) performed.
+        interfaces (Dict[str, :class:`~.instrument.InterfaceStats`]):
+            The collected counters keyed by the name of the interface's text io.
+        caches (Dict[str, :class:`~.instrument.CacheStats`]):
+            The state of all registered caches keyed by their name.
+    """
+
+    enabled: bool
+    compositions: int
+    interfaces: Dict[str, InterfaceStats]
+    caches: Dict[str, CacheStats]
+
+
+@dataclass
+class Profile:
+    """Describes the time collected while profiling.
+
+    Parameters:
+        build_time (float):
+            The seconds spent building escape sequences and composing chalk.
+        io_time (float):
+            The seconds spent writing and flushing the terminal buffer.
+    """
+
+    build_time: float = field(default=0.0)
+    io_time: float = field(default=0.0)
+
+    @property
+    def total_time(self) -> float:
+        """Total seconds spent within chalky while profiling.
+
+        Returns:
+            float:
+                The sum of the build and io time.
+        """
+
+        return self.build_time + self.io_time
+
+
+_ORIGINALS: Dict[Tuple[type, str], Callable] = {}
+_INTERFACES: "WeakKeyDictionary[BaseInterface, InterfaceStats]" = WeakKeyDictionary()
+_CACHES: Dict[str, Any] = {}
+_PROFILES: List[Profile] = []
+_COMPOSITIONS = 0
+
+
+def _get_interface_stats(interface: BaseInterface) -> InterfaceStats:
+    interface_stats = _INTERFACES.get(interface)
+    if interface_stats is None:
+        interface_stats = _INTERFACES[interface] = InterfaceStats()
+
+    return interface_stats
+
+
+def _get_interface_name(interface: BaseInterface) -> str:
+    name = getattr(interface.io, "name", None)
+    if not isinstance(name, str):
+        return repr(interface.io)
+
+    return name
+
+
+def _record(attribute: str, elapsed: float):
+    for active_profile in _PROFILES:
+        setattr(active_profile, attribute, getattr(active_profile, attribute) + elapsed)
+
+
+def _timed(attribute: str, method: Callable, *args, **kwargs) -> Any:
+    if not _PROFILES:
+        return method(*args, **kwargs)
+
+    start = time.perf_counter()
+    try:
+        return method(*args, **kwargs)
+    finally:
+        _record(attribute, time.perf_counter() - start)
+
+
+def _wrap_compose(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, other):
+        global _COMPOSITIONS
+
+        _COMPOSITIONS += 1
+        return _timed("build_time", method, self, other)
+
+    return wrapper
+
+
+def _wrap_apply(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        _get_interface_stats(self).applies += 1
+        return _timed("build_time", method, self, *args, **kwargs)
+
+    return wrapper
+
+
+def _wrap_emit(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, content: bytes):
+        interface_stats = _get_interface_stats(self)
+        interface_stats.writes += 1
+        interface_stats.bytes_emitted += len(content)
+        return _timed("io_time", method, self, content)
+
+    return wrapper
+
+
+def _wrap_write_text(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, text: str):
+        # text written within a batch is counted once the batch is emitted
+        if self._batch is None:
+            interface_stats = _get_interface_stats(self)
+            interface_stats.writes += 1
+            interface_stats.bytes_emitted += len(text.encode(self.io.encoding))
+        return _timed("io_time", method, self, text)
+
+    return wrapper
+
+
+def _wrap_flush(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self):
+        # flushes are only counted, as most happen within an already timed emit
+        _get_interface_stats(self).flushes += 1
+        return method(self)
+
+    return wrapper
+
+
+_WRAPPERS: Dict[Tuple[type, str], Callable[[Callable], Callable]] = {
+    (Chalk, "__and__"): _wrap_compose,
+    (AnsiInterface, "apply"): _wrap_apply,
+    (AnsiInterface, "_emit"): _wrap_emit,
+    (AnsiInterface, "write_text"): _wrap_write_text,
+    (BaseInterface, "flush"): _wrap_flush,
+}
+
+
+def is_installed() -> bool:
+    """Check if the instrumentation wrappers are currently installed.
+
+    Returns:
+        bool:
+            True if instrumentation is currently collecting, otherwise False.
+    """
+
+    return len(_ORIGINALS) > 0
+
+
+def install():
+    """Install the instrumentation wrappers.
+
+    .. tip::
+        Prefer calling :func:`~.constants.configure` with ``instrument=True`` over
+        calling this function directly.
+    """
+
+    if is_installed():
+        return
+
+    for (owner, name), wrap in _WRAPPERS.items():
+        original = owner.__dict__[name]
+        _ORIGINALS[(owner, name)] = original
+        setattr(owner, name, wrap(original))
+
+    constants.INSTRUMENTED = True
+
+
+def uninstall():
+    """Remove the instrumentation wrappers and restore the original methods."""
+
+    for (owner, name), original in _ORIGINALS.items():
+        setattr(owner, name, original)
+
+    _ORIGINALS.clear()
+    constants.INSTRUMENTED = False
+
+
+def register_cache(name: str, cache: Any):
+    """Register a cache to be reported by :func:`~.instrument.stats`.
+
+    Args:
+        name (str):
+            The name to report the cache as.
+        cache (~typing.Any):
+            Any object providing a ``cache_info()`` method that returns a
+            :func:`functools.lru_cache` compatible ``CacheInfo`` tuple.
+    """
+
+    _CACHES[name] = cache
+
+
+def reset_stats():
+    """Reset all collected counters back to zero."""
+
+    global _COMPOSITIONS
+
+    _COMPOSITIONS = 0
+    _INTERFACES.clear()
+
+
+def stats() -> Stats:
+    """Take a snapshot of the collected instrumentation.
+
+    Returns:
+        :class:`~.instrument.Stats`:
+            The collected counters and the state of all registered caches.
+    """
+
+    interfaces: Dict[str, InterfaceStats] = {}
+    for interface, interface_stats in list(_INTERFACES.items()):
+        total = interfaces.setdefault(_get_interface_name(interface), InterfaceStats())
+        total.applies += interface_stats.applies
+        total.writes += interface_stats.writes
+        total.flushes += interface_stats.flushes
+        total.bytes_emitted += interface_stats.bytes_emitted
+
+    caches: Dict[str, CacheStats] = {}
+    for name, cache in _CACHES.items():
+        info = cache.cache_info()
+        caches[name] = CacheStats(
+            hits=info.hits,
+            misses=info.misses,
+            size=info.currsize,
+            maxsize=info.maxsize,
+        )
+
+    return Stats(
+        enabled=is_installed(),
+        compositions=_COMPOSITIONS,
+        interfaces=interfaces,
+        caches=caches,
+    )
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Collect the time spent building escape sequences and writing to the terminal.
+
+    Instrumentation is installed for the duration of the context if it is not already
+    enabled.
+
+    Yields:
+        :class:`~.instrument.Profile`:
+            The profile that is updated while the context is active.
+    """
+
+    installed = is_installed()
+    if not installed:
+        install()
+
+    report = Profile()
+    _PROFILES.append(report)
+
+    try:
+        yield report
+    finally:
+        _PROFILES.remove(report)
+        if not installed:
+            uninstall()
+
+
+register_cache("interface", _get_interface)
+register_cache("prefix", get_prefix)
+register_cache("compose", compose)
+register_cache("width", _measure)
+register_cache("render", render_cache)
@@ -13,7 +13,6 @@ from .ansi import AnsiInterface
 from .base import BaseInterface
 
 
-@lru_cache()
 def get_interface(io: Optional[TextIO] = None) -> BaseInterface:
     """Get the appropriate interface to interact with some terminal buffer.
 
@@ -42,6 +41,12 @@ def get_interface(io: Optional[TextIO] = None) -> BaseInterface:
     if not io:
         io = sys.stdout
 
+    # the default io is resolved first so it shares the interface given sys.stdout
+    return _get_interface(io)
+
+
+@lru_cache()
+def _get_interface(io: TextIO) -> BaseInterface:
     return AnsiInterface(io)
 
 
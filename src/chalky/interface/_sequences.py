@@ -0,0 +1,399 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains precomputed escape sequences for named colors, indexed colors and styles.
+
+.. important::
+    This module is generated from the maps in :mod:`~.interface.ansi` by running
+    ``invoke codegen.generate``, do not edit it by hand.
+"""
+
+from typing import Dict, Tuple
+
+from ..color import Color
+from ..style import Style
+
+FOREGROUND_PREFIXES: Dict[Color, str] = {
+    Color.BLACK: "\x1b[30m",
+    Color.RED: "\x1b[31m",
+    Color.GREEN: "\x1b[32m",
+    Color.YELLOW: "\x1b[33m",
+    Color.BLUE: "\x1b[34m",
+    Color.MAGENTA: "\x1b[35m",
+    Color.CYAN: "\x1b[36m",
+    Color.WHITE: "\x1b[37m",
+    Color.BRIGHT_BLACK: "\x1b[90m",
+    Color.BRIGHT_RED: "\x1b[91m",
+    Color.BRIGHT_GREEN: "\x1b[92m",
+    Color.BRIGHT_YELLOW: "\x1b[93m",
+    Color.BRIGHT_BLUE: "\x1b[94m",
+    Color.BRIGHT_MAGENTA: "\x1b[95m",
+    Color.BRIGHT_CYAN: "\x1b[96m",
+    Color.BRIGHT_WHITE: "\x1b[97m",
+}
+
+FOREGROUND_PREFIX_BYTES: Dict[Color, bytes] = {
+    Color.BLACK: b"\x1b[30m",
+    Color.RED: b"\x1b[31m",
+    Color.GREEN: b"\x1b[32m",
+    Color.YELLOW: b"\x1b[33m",
+    Color.BLUE: b"\x1b[34m",
+    Color.MAGENTA: b"\x1b[35m",
+    Color.CYAN: b"\x1b[36m",
+    Color.WHITE: b"\x1b[37m",
+    Color.BRIGHT_BLACK: b"\x1b[90m",
+    Color.BRIGHT_RED: b"\x1b[91m",
+    Color.BRIGHT_GREEN: b"\x1b[92m",
+    Color.BRIGHT_YELLOW: b"\x1b[93m",
+    Color.BRIGHT_BLUE: b"\x1b[94m",
+    Color.BRIGHT_MAGENTA: b"\x1b[95m",
+    Color.BRIGHT_CYAN: b"\x1b[96m",
+    Color.BRIGHT_WHITE: b"\x1b[97m",
+}
+
+BACKGROUND_PREFIXES: Dict[Color, str] = {
+    Color.BLACK: "\x1b[40m",
+    Color.RED: "\x1b[41m",
+    Color.GREEN: "\x1b[42m",
+    Color.YELLOW: "\x1b[43m",
+    Color.BLUE: "\x1b[44m",
+    Color.MAGENTA: "\x1b[45m",
+    Color.CYAN: "\x1b[46m",
+    Color.WHITE: "\x1b[47m",
+    Color.BRIGHT_BLACK: "\x1b[100m",
+    Color.BRIGHT_RED: "\x1b[101m",
+    Color.BRIGHT_GREEN: "\x1b[102m",
+    Color.BRIGHT_YELLOW: "\x1b[103m",
+    Color.BRIGHT_BLUE: "\x1b[104m",
+    Color.BRIGHT_MAGENTA: "\x1b[105m",
+    Color.BRIGHT_CYAN: "\x1b[106m",
+    Color.BRIGHT_WHITE: "\x1b[107m",
+}
+
+BACKGROUND_PREFIX_BYTES: Dict[Color, bytes] = {
+    Color.BLACK: b"\x1b[40m",
+    Color.RED: b"\x1b[41m",
+    Color.GREEN: b"\x1b[42m",
+    Color.YELLOW: b"\x1b[43m",
+    Color.BLUE: b"\x1b[44m",
+    Color.MAGENTA: b"\x1b[45m",
+    Color.CYAN: b"\x1b[46m",
+    Color.WHITE: b"\x1b[47m",
+    Color.BRIGHT_BLACK: b"\x1b[100m",
+    Color.BRIGHT_RED: b"\x1b[101m",
+    Color.BRIGHT_GREEN: b"\x1b[102m",
+    Color.BRIGHT_YELLOW: b"\x1b[103m",
+    Color.BRIGHT_BLUE: b"\x1b[104m",
+    Color.BRIGHT_MAGENTA: b"\x1b[105m",
+    Color.BRIGHT_CYAN: b"\x1b[106m",
+    Color.BRIGHT_WHITE: b"\x1b[107m",
+}
+
+STYLE_PREFIXES: Dict[Style, str] = {
+    Style.RESET: "\x1b[0m",
+    Style.BOLD: "\x1b[1m",
+    Style.DIM: "\x1b[2m",
+    Style.ITALIC: "\x1b[3m",
+    Style.UNDERLINE: "\x1b[4m",
+    Style.SLOW_BLINK: "\x1b[5m",
+    Style.RAPID_BLINK: "\x1b[6m",
+    Style.REVERSED: "\x1b[7m",
+    Style.CONCEAL: "\x1b[8m",
+    Style.STRIKETHROUGH: "\x1b[9m",
+    Style.NORMAL: "\x1b[22m",
+}
+
+STYLE_PREFIX_BYTES: Dict[Style, bytes] = {
+    Style.RESET: b"\x1b[0m",
+    Style.BOLD: b"\x1b[1m",
+    Style.DIM: b"\x1b[2m",
+    Style.ITALIC: b"\x1b[3m",
+    Style.UNDERLINE: b"\x1b[4m",
+    Style.SLOW_BLINK: b"\x1b[5m",
+    Style.RAPID_BLINK: b"\x1b[6m",
+    Style.REVERSED: b"\x1b[7m",
+    Style.CONCEAL: b"\x1b[8m",
+    Style.STRIKETHROUGH: b"\x1b[9m",
+    Style.NORMAL: b"\x1b[22m",
+}
+
+# fmt: off
+INDEXED_FOREGROUND_PREFIXES: Tuple[str, ...] = (
+    "\x1b[38;5;0m", "\x1b[38;5;1m", "\x1b[38;5;2m", "\x1b[38;5;3m",
+    "\x1b[38;5;4m", "\x1b[38;5;5m", "\x1b[38;5;6m", "\x1b[38;5;7m",
+    "\x1b[38;5;8m", "\x1b[38;5;9m", "\x1b[38;5;10m", "\x1b[38;5;11m",
+    "\x1b[38;5;12m", "\x1b[38;5;13m", "\x1b[38;5;14m", "\x1b[38;5;15m",
+    "\x1b[38;5;16m", "\x1b[38;5;17m", "\x1b[38;5;18m", "\x1b[38;5;19m",
+    "\x1b[38;5;20m", "\x1b[38;5;21m", "\x1b[38;5;22m", "\x1b[38;5;23m",
+    "\x1b[38;5;24m", "\x1b[38;5;25m", "\x1b[38;5;26m", "\x1b[38;5;27m",
+    "\x1b[38;5;28m", "\x1b[38;5;29m", "\x1b[38;5;30m", "\x1b[38;5;31m",
+    "\x1b[38;5;32m", "\x1b[38;5;33m", "\x1b[38;5;34m", "\x1b[38;5;35m",
+    "\x1b[38;5;36m", "\x1b[38;5;37m", "\x1b[38;5;38m", "\x1b[38;5;39m",
+    "\x1b[38;5;40m", "\x1b[38;5;41m", "\x1b[38;5;42m", "\x1b[38;5;43m",
+    "\x1b[38;5;44m", "\x1b[38;5;45m", "\x1b[38;5;46m", "\x1b[38;5;47m",
+    "\x1b[38;5;48m", "\x1b[38;5;49m", "\x1b[38;5;50m", "\x1b[38;5;51m",
+    "\x1b[38;5;52m", "\x1b[38;5;53m", "\x1b[38;5;54m", "\x1b[38;5;55m",
+    "\x1b[38;5;56m", "\x1b[38;5;57m", "\x1b[38;5;58m", "\x1b[38;5;59m",
+    "\x1b[38;5;60m", "\x1b[38;5;61m", "\x1b[38;5;62m", "\x1b[38;5;63m",
+    "\x1b[38;5;64m", "\x1b[38;5;65m", "\x1b[38;5;66m", "\x1b[38;5;67m",
+    "\x1b[38;5;68m", "\x1b[38;5;69m", "\x1b[38;5;70m", "\x1b[38;5;71m",
+    "\x1b[38;5;72m", "\x1b[38;5;73m", "\x1b[38;5;74m", "\x1b[38;5;75m",
+    "\x1b[38;5;76m", "\x1b[38;5;77m", "\x1b[38;5;78m", "\x1b[38;5;79m",
+    "\x1b[38;5;80m", "\x1b[38;5;81m", "\x1b[38;5;82m", "\x1b[38;5;83m",
+    "\x1b[38;5;84m", "\x1b[38;5;85m", "\x1b[38;5;86m", "\x1b[38;5;87m",
+    "\x1b[38;5;88m", "\x1b[38;5;89m", "\x1b[38;5;90m", "\x1b[38;5;91m",
+    "\x1b[38;5;92m", "\x1b[38;5;93m", "\x1b[38;5;94m", "\x1b[38;5;95m",
+    "\x1b[38;5;96m", "\x1b[38;5;97m", "\x1b[38;5;98m", "\x1b[38;5;99m",
+    "\x1b[38;5;100m", "\x1b[38;5;101m", "\x1b[38;5;102m", "\x1b[38;5;103m",
+    "\x1b[38;5;104m", "\x1b[38;5;105m", "\x1b[38;5;106m", "\x1b[38;5;107m",
+    "\x1b[38;5;108m", "\x1b[38;5;109m", "\x1b[38;5;110m", "\x1b[38;5;111m",
+    "\x1b[38;5;112m", "\x1b[38;5;113m", "\x1b[38;5;114m", "\x1b[38;5;115m",
+    "\x1b[38;5;116m", "\x1b[38;5;117m", "\x1b[38;5;118m", "\x1b[38;5;119m",
+    "\x1b[38;5;120m", "\x1b[38;5;121m", "\x1b[38;5;122m", "\x1b[38;5;123m",
+    "\x1b[38;5;124m", "\x1b[38;5;125m", "\x1b[38;5;126m", "\x1b[38;5;127m",
+    "\x1b[38;5;128m", "\x1b[38;5;129m", "\x1b[38;5;130m", "\x1b[38;5;131m",
+    "\x1b[38;5;132m", "\x1b[38;5;133m", "\x1b[38;5;134m", "\x1b[38;5;135m",
+    "\x1b[38;5;136m", "\x1b[38;5;137m", "\x1b[38;5;138m", "\x1b[38;5;139m",
+    "\x1b[38;5;140m", "\x1b[38;5;141m", "\x1b[38;5;142m", "\x1b[38;5;143m",
+    "\x1b[38;5;144m", "\x1b[38;5;145m", "\x1b[38;5;146m", "\x1b[38;5;147m",
+    "\x1b[38;5;148m", "\x1b[38;5;149m", "\x1b[38;5;150m", "\x1b[38;5;151m",
+    "\x1b[38;5;152m", "\x1b[38;5;153m", "\x1b[38;5;154m", "\x1b[38;5;155m",
+    "\x1b[38;5;156m", "\x1b[38;5;157m", "\x1b[38;5;158m", "\x1b[38;5;159m",
+    "\x1b[38;5;160m", "\x1b[38;5;161m", "\x1b[38;5;162m", "\x1b[38;5;163m",
+    "\x1b[38;5;164m", "\x1b[38;5;165m", "\x1b[38;5;166m", "\x1b[38;5;167m",
+    "\x1b[38;5;168m", "\x1b[38;5;169m", "\x1b[38;5;170m", "\x1b[38;5;171m",
+    "\x1b[38;5;172m", "\x1b[38;5;173m", "\x1b[38;5;174m", "\x1b[38;5;175m",
+    "\x1b[38;5;176m", "\x1b[38;5;177m", "\x1b[38;5;178m", "\x1b[38;5;179m",
+    "\x1b[38;5;180m", "\x1b[38;5;181m", "\x1b[38;5;182m", "\x1b[38;5;183m",
+    "\x1b[38;5;184m", "\x1b[38;5;185m", "\x1b[38;5;186m", "\x1b[38;5;187m",
+    "\x1b[38;5;188m", "\x1b[38;5;189m", "\x1b[38;5;190m", "\x1b[38;5;191m",
+    "\x1b[38;5;192m", "\x1b[38;5;193m", "\x1b[38;5;194m", "\x1b[38;5;195m",
+    "\x1b[38;5;196m", "\x1b[38;5;197m", "\x1b[38;5;198m", "\x1b[38;5;199m",
+    "\x1b[38;5;200m", "\x1b[38;5;201m", "\x1b[38;5;202m", "\x1b[38;5;203m",
+    "\x1b[38;5;204m", "\x1b[38;5;205m", "\x1b[38;5;206m", "\x1b[38;5;207m",
+    "\x1b[38;5;208m", "\x1b[38;5;209m", "\x1b[38;5;210m", "\x1b[38;5;211m",
+    "\x1b[38;5;212m", "\x1b[38;5;213m", "\x1b[38;5;214m", "\x1b[38;5;215m",
+    "\x1b[38;5;216m", "\x1b[38;5;217m", "\x1b[38;5;218m", "\x1b[38;5;219m",
+    "\x1b[38;5;220m", "\x1b[38;5;221m", "\x1b[38;5;222m", "\x1b[38;5;223m",
+    "\x1b[38;5;224m", "\x1b[38;5;225m", "\x1b[38;5;226m", "\x1b[38;5;227m",
+    "\x1b[38;5;228m", "\x1b[38;5;229m", "\x1b[38;5;230m", "\x1b[38;5;231m",
+    "\x1b[38;5;232m", "\x1b[38;5;233m", "\x1b[38;5;234m", "\x1b[38;5;235m",
+    "\x1b[38;5;236m", "\x1b[38;5;237m", "\x1b[38;5;238m", "\x1b[38;5;239m",
+    "\x1b[38;5;240m", "\x1b[38;5;241m", "\x1b[38;5;242m", "\x1b[38;5;243m",
+    "\x1b[38;5;244m", "\x1b[38;5;245m", "\x1b[38;5;246m", "\x1b[38;5;247m",
+    "\x1b[38;5;248m", "\x1b[38;5;249m", "\x1b[38;5;250m", "\x1b[38;5;251m",
+    "\x1b[38;5;252m", "\x1b[38;5;253m", "\x1b[38;5;254m", "\x1b[38;5;255m",
+)
+# fmt: on
+
+# fmt: off
+INDEXED_FOREGROUND_PREFIX_BYTES: Tuple[bytes, ...] = (
+    b"\x1b[38;5;0m", b"\x1b[38;5;1m", b"\x1b[38;5;2m", b"\x1b[38;5;3m",
+    b"\x1b[38;5;4m", b"\x1b[38;5;5m", b"\x1b[38;5;6m", b"\x1b[38;5;7m",
+    b"\x1b[38;5;8m", b"\x1b[38;5;9m", b"\x1b[38;5;10m", b"\x1b[38;5;11m",
+    b"\x1b[38;5;12m", b"\x1b[38;5;13m", b"\x1b[38;5;14m", b"\x1b[38;5;15m",
+    b"\x1b[38;5;16m", b"\x1b[38;5;17m", b"\x1b[38;5;18m", b"\x1b[38;5;19m",
+    b"\x1b[38;5;20m", b"\x1b[38;5;21m", b"\x1b[38;5;22m", b"\x1b[38;5;23m",
+    b"\x1b[38;5;24m", b"\x1b[38;5;25m", b"\x1b[38;5;26m", b"\x1b[38;5;27m",
+    b"\x1b[38;5;28m", b"\x1b[38;5;29m", b"\x1b[38;5;30m", b"\x1b[38;5;31m",
+    b"\x1b[38;5;32m", b"\x1b[38;5;33m", b"\x1b[38;5;34m", b"\x1b[38;5;35m",
+    b"\x1b[38;5;36m", b"\x1b[38;5;37m", b"\x1b[38;5;38m", b"\x1b[38;5;39m",
+    b"\x1b[38;5;40m", b"\x1b[38;5;41m", b"\x1b[38;5;42m", b"\x1b[38;5;43m",
+    b"\x1b[38;5;44m", b"\x1b[38;5;45m", b"\x1b[38;5;46m", b"\x1b[38;5;47m",
+    b"\x1b[38;5;48m", b"\x1b[38;5;49m", b"\x1b[38;5;50m", b"\x1b[38;5;51m",
+    b"\x1b[38;5;52m", b"\x1b[38;5;53m", b"\x1b[38;5;54m", b"\x1b[38;5;55m",
+    b"\x1b[38;5;56m", b"\x1b[38;5;57m", b"\x1b[38;5;58m", b"\x1b[38;5;59m",
+    b"\x1b[38;5;60m", b"\x1b[38;5;61m", b"\x1b[38;5;62m", b"\x1b[38;5;63m",
+    b"\x1b[38;5;64m", b"\x1b[38;5;65m", b"\x1b[38;5;66m", b"\x1b[38;5;67m",
+    b"\x1b[38;5;68m", b"\x1b[38;5;69m", b"\x1b[38;5;70m", b"\x1b[38;5;71m",
+    b"\x1b[38;5;72m", b"\x1b[38;5;73m", b"\x1b[38;5;74m", b"\x1b[38;5;75m",
+    b"\x1b[38;5;76m", b"\x1b[38;5;77m", b"\x1b[38;5;78m", b"\x1b[38;5;79m",
+    b"\x1b[38;5;80m", b"\x1b[38;5;81m", b"\x1b[38;5;82m", b"\x1b[38;5;83m",
+    b"\x1b[38;5;84m", b"\x1b[38;5;85m", b"\x1b[38;5;86m", b"\x1b[38;5;87m",
+    b"\x1b[38;5;88m", b"\x1b[38;5;89m", b"\x1b[38;5;90m", b"\x1b[38;5;91m",
+    b"\x1b[38;5;92m", b"\x1b[38;5;93m", b"\x1b[38;5;94m", b"\x1b[38;5;95m",
+    b"\x1b[38;5;96m", b"\x1b[38;5;97m", b"\x1b[38;5;98m", b"\x1b[38;5;99m",
+    b"\x1b[38;5;100m", b"\x1b[38;5;101m", b"\x1b[38;5;102m", b"\x1b[38;5;103m",
+    b"\x1b[38;5;104m", b"\x1b[38;5;105m", b"\x1b[38;5;106m", b"\x1b[38;5;107m",
+    b"\x1b[38;5;108m", b"\x1b[38;5;109m", b"\x1b[38;5;110m", b"\x1b[38;5;111m",
+    b"\x1b[38;5;112m", b"\x1b[38;5;113m", b"\x1b[38;5;114m", b"\x1b[38;5;115m",
+    b"\x1b[38;5;116m", b"\x1b[38;5;117m", b"\x1b[38;5;118m", b"\x1b[38;5;119m",
+    b"\x1b[38;5;120m", b"\x1b[38;5;121m", b"\x1b[38;5;122m", b"\x1b[38;5;123m",
+    b"\x1b[38;5;124m", b"\x1b[38;5;125m", b"\x1b[38;5;126m", b"\x1b[38;5;127m",
+    b"\x1b[38;5;128m", b"\x1b[38;5;129m", b"\x1b[38;5;130m", b"\x1b[38;5;131m",
+    b"\x1b[38;5;132m", b"\x1b[38;5;133m", b"\x1b[38;5;134m", b"\x1b[38;5;135m",
+    b"\x1b[38;5;136m", b"\x1b[38;5;137m", b"\x1b[38;5;138m", b"\x1b[38;5;139m",
+    b"\x1b[38;5;140m", b"\x1b[38;5;141m", b"\x1b[38;5;142m", b"\x1b[38;5;143m",
+    b"\x1b[38;5;144m", b"\x1b[38;5;145m", b"\x1b[38;5;146m", b"\x1b[38;5;147m",
+    b"\x1b[38;5;148m", b"\x1b[38;5;149m", b"\x1b[38;5;150m", b"\x1b[38;5;151m",
+    b"\x1b[38;5;152m", b"\x1b[38;5;153m", b"\x1b[38;5;154m", b"\x1b[38;5;155m",
+    b"\x1b[38;5;156m", b"\x1b[38;5;157m", b"\x1b[38;5;158m", b"\x1b[38;5;159m",
+    b"\x1b[38;5;160m", b"\x1b[38;5;161m", b"\x1b[38;5;162m", b"\x1b[38;5;163m",
+    b"\x1b[38;5;164m", b"\x1b[38;5;165m", b"\x1b[38;5;166m", b"\x1b[38;5;167m",
+    b"\x1b[38;5;168m", b"\x1b[38;5;169m", b"\x1b[38;5;170m", b"\x1b[38;5;171m",
+    b"\x1b[38;5;172m", b"\x1b[38;5;173m", b"\x1b[38;5;174m", b"\x1b[38;5;175m",
+    b"\x1b[38;5;176m", b"\x1b[38;5;177m", b"\x1b[38;5;178m", b"\x1b[38;5;179m",
+    b"\x1b[38;5;180m", b"\x1b[38;5;181m", b"\x1b[38;5;182m", b"\x1b[38;5;183m",
+    b"\x1b[38;5;184m", b"\x1b[38;5;185m", b"\x1b[38;5;186m", b"\x1b[38;5;187m",
+    b"\x1b[38;5;188m", b"\x1b[38;5;189m", b"\x1b[38;5;190m", b"\x1b[38;5;191m",
+    b"\x1b[38;5;192m", b"\x1b[38;5;193m", b"\x1b[38;5;194m", b"\x1b[38;5;195m",
+    b"\x1b[38;5;196m", b"\x1b[38;5;197m", b"\x1b[38;5;198m", b"\x1b[38;5;199m",
+    b"\x1b[38;5;200m", b"\x1b[38;5;201m", b"\x1b[38;5;202m", b"\x1b[38;5;203m",
+    b"\x1b[38;5;204m", b"\x1b[38;5;205m", b"\x1b[38;5;206m", b"\x1b[38;5;207m",
+    b"\x1b[38;5;208m", b"\x1b[38;5;209m", b"\x1b[38;5;210m", b"\x1b[38;5;211m",
+    b"\x1b[38;5;212m", b"\x1b[38;5;213m", b"\x1b[38;5;214m", b"\x1b[38;5;215m",
+    b"\x1b[38;5;216m", b"\x1b[38;5;217m", b"\x1b[38;5;218m", b"\x1b[38;5;219m",
+    b"\x1b[38;5;220m", b"\x1b[38;5;221m", b"\x1b[38;5;222m", b"\x1b[38;5;223m",
+    b"\x1b[38;5;224m", b"\x1b[38;5;225m", b"\x1b[38;5;226m", b"\x1b[38;5;227m",
+    b"\x1b[38;5;228m", b"\x1b[38;5;229m", b"\x1b[38;5;230m", b"\x1b[38;5;231m",
+    b"\x1b[38;5;232m", b"\x1b[38;5;233m", b"\x1b[38;5;234m", b"\x1b[38;5;235m",
+    b"\x1b[38;5;236m", b"\x1b[38;5;237m", b"\x1b[38;5;238m", b"\x1b[38;5;239m",
+    b"\x1b[38;5;240m", b"\x1b[38;5;241m", b"\x1b[38;5;242m", b"\x1b[38;5;243m",
+    b"\x1b[38;5;244m", b"\x1b[38;5;245m", b"\x1b[38;5;246m", b"\x1b[38;5;247m",
+    b"\x1b[38;5;248m", b"\x1b[38;5;249m", b"\x1b[38;5;250m", b"\x1b[38;5;251m",
+    b"\x1b[38;5;252m", b"\x1b[38;5;253m", b"\x1b[38;5;254m", b"\x1b[38;5;255m",
+)
+# fmt: on
+
+# fmt: off
+INDEXED_BACKGROUND_PREFIXES: Tuple[str, ...] = (
+    "\x1b[48;5;0m", "\x1b[48;5;1m", "\x1b[48;5;2m", "\x1b[48;5;3m",
+    "\x1b[48;5;4m", "\x1b[48;5;5m", "\x1b[48;5;6m", "\x1b[48;5;7m",
+    "\x1b[48;5;8m", "\x1b[48;5;9m", "\x1b[48;5;10m", "\x1b[48;5;11m",
+    "\x1b[48;5;12m", "\x1b[48;5;13m", "\x1b[48;5;14m", "\x1b[48;5;15m",
+    "\x1b[48;5;16m", "\x1b[48;5;17m", "\x1b[48;5;18m", "\x1b[48;5;19m",
+    "\x1b[48;5;20m", "\x1b[48;5;21m", "\x1b[48;5;22m", "\x1b[48;5;23m",
+    "\x1b[48;5;24m", "\x1b[48;5;25m", "\x1b[48;5;26m", "\x1b[48;5;27m",
+    "\x1b[48;5;28m", "\x1b[48;5;29m", "\x1b[48;5;30m", "\x1b[48;5;31m",
+    "\x1b[48;5;32m", "\x1b[48;5;33m", "\x1b[48;5;34m", "\x1b[48;5;35m",
+    "\x1b[48;5;36m", "\x1b[48;5;37m", "\x1b[48;5;38m", "\x1b[48;5;39m",
+    "\x1b[48;5;40m", "\x1b[48;5;41m", "\x1b[48;5;42m", "\x1b[48;5;43m",
+    "\x1b[48;5;44m", "\x1b[48;5;45m", "\x1b[48;5;46m", "\x1b[48;5;47m",
+    "\x1b[48;5;48m", "\x1b[48;5;49m", "\x1b[48;5;50m", "\x1b[48;5;51m",
+    "\x1b[48;5;52m", "\x1b[48;5;53m", "\x1b[48;5;54m", "\x1b[48;5;55m",
+    "\x1b[48;5;56m", "\x1b[48;5;57m", "\x1b[48;5;58m", "\x1b[48;5;59m",
+    "\x1b[48;5;60m", "\x1b[48;5;61m", "\x1b[48;5;62m", "\x1b[48;5;63m",
+    "\x1b[48;5;64m", "\x1b[48;5;65m", "\x1b[48;5;66m", "\x1b[48;5;67m",
+    "\x1b[48;5;68m", "\x1b[48;5;69m", "\x1b[48;5;70m", "\x1b[48;5;71m",
+    "\x1b[48;5;72m", "\x1b[48;5;73m", "\x1b[48;5;74m", "\x1b[48;5;75m",
+    "\x1b[48;5;76m", "\x1b[48;5;77m", "\x1b[48;5;78m", "\x1b[48;5;79m",
+    "\x1b[48;5;80m", "\x1b[48;5;81m", "\x1b[48;5;82m", "\x1b[48;5;83m",
+    "\x1b[48;5;84m", "\x1b[48;5;85m", "\x1b[48;5;86m", "\x1b[48;5;87m",
+    "\x1b[48;5;88m", "\x1b[48;5;89m", "\x1b[48;5;90m", "\x1b[48;5;91m",
+    "\x1b[48;5;92m", "\x1b[48;5;93m", "\x1b[48;5;94m", "\x1b[48;5;95m",
+    "\x1b[48;5;96m", "\x1b[48;5;97m", "\x1b[48;5;98m", "\x1b[48;5;99m",
+    "\x1b[48;5;100m", "\x1b[48;5;101m", "\x1b[48;5;102m", "\x1b[48;5;103m",
+    "\x1b[48;5;104m", "\x1b[48;5;105m", "\x1b[48;5;106m", "\x1b[48;5;107m",
+    "\x1b[48;5;108m", "\x1b[48;5;109m", "\x1b[48;5;110m", "\x1b[48;5;111m",
+    "\x1b[48;5;112m", "\x1b[48;5;113m", "\x1b[48;5;114m", "\x1b[48;5;115m",
+    "\x1b[48;5;116m", "\x1b[48;5;117m", "\x1b[48;5;118m", "\x1b[48;5;119m",
+    "\x1b[48;5;120m", "\x1b[48;5;121m", "\x1b[48;5;122m", "\x1b[48;5;123m",
+    "\x1b[48;5;124m", "\x1b[48;5;125m", "\x1b[48;5;126m", "\x1b[48;5;127m",
+    "\x1b[48;5;128m", "\x1b[48;5;129m", "\x1b[48;5;130m", "\x1b[48;5;131m",
+    "\x1b[48;5;132m", "\x1b[48;5;133m", "\x1b[48;5;134m", "\x1b[48;5;135m",
+    "\x1b[48;5;136m", "\x1b[48;5;137m", "\x1b[48;5;138m", "\x1b[48;5;139m",
+    "\x1b[48;5;140m", "\x1b[48;5;141m", "\x1b[48;5;142m", "\x1b[48;5;143m",
+    "\x1b[48;5;144m", "\x1b[48;5;145m", "\x1b[48;5;146m", "\x1b[48;5;147m",
+    "\x1b[48;5;148m", "\x1b[48;5;149m", "\x1b[48;5;150m", "\x1b[48;5;151m",
+    "\x1b[48;5;152m", "\x1b[48;5;153m", "\x1b[48;5;154m", "\x1b[48;5;155m",
+    "\x1b[48;5;156m", "\x1b[48;5;157m", "\x1b[48;5;158m", "\x1b[48;5;159m",
+    "\x1b[48;5;160m", "\x1b[48;5;161m", "\x1b[48;5;162m", "\x1b[48;5;163m",
+    "\x1b[48;5;164m", "\x1b[48;5;165m", "\x1b[48;5;166m", "\x1b[48;5;167m",
+    "\x1b[48;5;168m", "\x1b[48;5;169m", "\x1b[48;5;170m", "\x1b[48;5;171m",
+    "\x1b[48;5;172m", "\x1b[48;5;173m", "\x1b[48;5;174m", "\x1b[48;5;175m",
+    "\x1b[48;5;176m", "\x1b[48;5;177m", "\x1b[48;5;178m", "\x1b[48;5;179m",
+    "\x1b[48;5;180m", "\x1b[48;5;181m", "\x1b[48;5;182m", "\x1b[48;5;183m",
+    "\x1b[48;5;184m", "\x1b[48;5;185m", "\x1b[48;5;186m", "\x1b[48;5;187m",
+    "\x1b[48;5;188m", "\x1b[48;5;189m", "\x1b[48;5;190m", "\x1b[48;5;191m",
+    "\x1b[48;5;192m", "\x1b[48;5;193m", "\x1b[48;5;194m", "\x1b[48;5;195m",
+    "\x1b[48;5;196m", "\x1b[48;5;197m", "\x1b[48;5;198m", "\x1b[48;5;199m",
+    "\x1b[48;5;200m", "\x1b[48;5;201m", "\x1b[48;5;202m", "\x1b[48;5;203m",
+    "\x1b[48;5;204m", "\x1b[48;5;205m", "\x1b[48;5;206m", "\x1b[48;5;207m",
+    "\x1b[48;5;208m", "\x1b[48;5;209m", "\x1b[48;5;210m", "\x1b[48;5;211m",
+    "\x1b[48;5;212m", "\x1b[48;5;213m", "\x1b[48;5;214m", "\x1b[48;5;215m",
+    "\x1b[48;5;216m", "\x1b[48;5;217m", "\x1b[48;5;218m", "\x1b[48;5;219m",
+    "\x1b[48;5;220m", "\x1b[48;5;221m", "\x1b[48;5;222m", "\x1b[48;5;223m",
+    "\x1b[48;5;224m", "\x1b[48;5;225m", "\x1b[48;5;226m", "\x1b[48;5;227m",
+    "\x1b[48;5;228m", "\x1b[48;5;229m", "\x1b[48;5;230m", "\x1b[48;5;231m",
+    "\x1b[48;5;232m", "\x1b[48;5;233m", "\x1b[48;5;234m", "\x1b[48;5;235m",
+    "\x1b[48;5;236m", "\x1b[48;5;237m", "\x1b[48;5;238m", "\x1b[48;5;239m",
+    "\x1b[48;5;240m", "\x1b[48;5;241m", "\x1b[48;5;242m", "\x1b[48;5;243m",
+    "\x1b[48;5;244m", "\x1b[48;5;245m", "\x1b[48;5;246m", "\x1b[48;5;247m",
+    "\x1b[48;5;248m", "\x1b[48;5;249m", "\x1b[48;5;250m", "\x1b[48;5;251m",
+    "\x1b[48;5;252m", "\x1b[48;5;253m", "\x1b[48;5;254m", "\x1b[48;5;255m",
+)
+# fmt: on
+
+# fmt: off
+INDEXED_BACKGROUND_PREFIX_BYTES: Tuple[bytes, ...] = (
+    b"\x1b[48;5;0m", b"\x1b[48;5;1m", b"\x1b[48;5;2m", b"\x1b[48;5;3m",
+    b"\x1b[48;5;4m", b"\x1b[48;5;5m", b"\x1b[48;5;6m", b"\x1b[48;5;7m",
+    b"\x1b[48;5;8m", b"\x1b[48;5;9m", b"\x1b[48;5;10m", b"\x1b[48;5;11m",
+    b"\x1b[48;5;12m", b"\x1b[48;5;13m", b"\x1b[48;5;14m", b"\x1b[48;5;15m",
+    b"\x1b[48;5;16m", b"\x1b[48;5;17m", b"\x1b[48;5;18m", b"\x1b[48;5;19m",
+    b"\x1b[48;5;20m", b"\x1b[48;5;21m", b"\x1b[48;5;22m", b"\x1b[48;5;23m",
+    b"\x1b[48;5;24m", b"\x1b[48;5;25m", b"\x1b[48;5;26m", b"\x1b[48;5;27m",
+    b"\x1b[48;5;28m", b"\x1b[48;5;29m", b"\x1b[48;5;30m", b"\x1b[48;5;31m",
+    b"\x1b[48;5;32m", b"\x1b[48;5;33m", b"\x1b[48;5;34m", b"\x1b[48;5;35m",
+    b"\x1b[48;5;36m", b"\x1b[48;5;37m", b"\x1b[48;5;38m", b"\x1b[48;5;39m",
+    b"\x1b[48;5;40m", b"\x1b[48;5;41m", b"\x1b[48;5;42m", b"\x1b[48;5;43m",
+    b"\x1b[48;5;44m", b"\x1b[48;5;45m", b"\x1b[48;5;46m", b"\x1b[48;5;47m",
+    b"\x1b[48;5;48m", b"\x1b[48;5;49m", b"\x1b[48;5;50m", b"\x1b[48;5;51m",
+    b"\x1b[48;5;52m", b"\x1b[48;5;53m", b"\x1b[48;5;54m", b"\x1b[48;5;55m",
+    b"\x1b[48;5;56m", b"\x1b[48;5;57m", b"\x1b[48;5;58m", b"\x1b[48;5;59m",
+    b"\x1b[48;5;60m", b"\x1b[48;5;61m", b"\x1b[48;5;62m", b"\x1b[48;5;63m",
+    b"\x1b[48;5;64m", b"\x1b[48;5;65m", b"\x1b[48;5;66m", b"\x1b[48;5;67m",
+    b"\x1b[48;5;68m", b"\x1b[48;5;69m", b"\x1b[48;5;70m", b"\x1b[48;5;71m",
+    b"\x1b[48;5;72m", b"\x1b[48;5;73m", b"\x1b[48;5;74m", b"\x1b[48;5;75m",
+    b"\x1b[48;5;76m", b"\x1b[48;5;77m", b"\x1b[48;5;78m", b"\x1b[48;5;79m",
+    b"\x1b[48;5;80m", b"\x1b[48;5;81m", b"\x1b[48;5;82m", b"\x1b[48;5;83m",
+    b"\x1b[48;5;84m", b"\x1b[48;5;85m", b"\x1b[48;5;86m", b"\x1b[48;5;87m",
+    b"\x1b[48;5;88m", b"\x1b[48;5;89m", b"\x1b[48;5;90m", b"\x1b[48;5;91m",
+    b"\x1b[48;5;92m", b"\x1b[48;5;93m", b"\x1b[48;5;94m", b"\x1b[48;5;95m",
+    b"\x1b[48;5;96m", b"\x1b[48;5;97m", b"\x1b[48;5;98m", b"\x1b[48;5;99m",
+    b"\x1b[48;5;100m", b"\x1b[48;5;101m", b"\x1b[48;5;102m", b"\x1b[48;5;103m",
+    b"\x1b[48;5;104m", b"\x1b[48;5;105m", b"\x1b[48;5;106m", b"\x1b[48;5;107m",
+    b"\x1b[48;5;108m", b"\x1b[48;5;109m", b"\x1b[48;5;110m", b"\x1b[48;5;111m",
+    b"\x1b[48;5;112m", b"\x1b[48;5;113m", b"\x1b[48;5;114m", b"\x1b[48;5;115m",
+    b"\x1b[48;5;116m", b"\x1b[48;5;117m", b"\x1b[48;5;118m", b"\x1b[48;5;119m",
+    b"\x1b[48;5;120m", b"\x1b[48;5;121m", b"\x1b[48;5;122m", b"\x1b[48;5;123m",
+    b"\x1b[48;5;124m", b"\x1b[48;5;125m", b"\x1b[48;5;126m", b"\x1b[48;5;127m",
+    b"\x1b[48;5;128m", b"\x1b[48;5;129m", b"\x1b[48;5;130m", b"\x1b[48;5;131m",
+    b"\x1b[48;5;132m", b"\x1b[48;5;133m", b"\x1b[48;5;134m", b"\x1b[48;5;135m",
+    b"\x1b[48;5;136m", b"\x1b[48;5;137m", b"\x1b[48;5;138m", b"\x1b[48;5;139m",
+    b"\x1b[48;5;140m", b"\x1b[48;5;141m", b"\x1b[48;5;142m", b"\x1b[48;5;143m",
+    b"\x1b[48;5;144m", b"\x1b[48;5;145m", b"\x1b[48;5;146m", b"\x1b[48;5;147m",
+    b"\x1b[48;5;148m", b"\x1b[48;5;149m", b"\x1b[48;5;150m", b"\x1b[48;5;151m",
+    b"\x1b[48;5;152m", b"\x1b[48;5;153m", b"\x1b[48;5;154m", b"\x1b[48;5;155m",
+    b"\x1b[48;5;156m", b"\x1b[48;5;157m", b"\x1b[48;5;158m", b"\x1b[48;5;159m",
+    b"\x1b[48;5;160m", b"\x1b[48;5;161m", b"\x1b[48;5;162m", b"\x1b[48;5;163m",
+    b"\x1b[48;5;164m", b"\x1b[48;5;165m", b"\x1b[48;5;166m", b"\x1b[48;5;167m",
+    b"\x1b[48;5;168m", b"\x1b[48;5;169m", b"\x1b[48;5;170m", b"\x1b[48;5;171m",
+    b"\x1b[48;5;172m", b"\x1b[48;5;173m", b"\x1b[48;5;174m", b"\x1b[48;5;175m",
+    b"\x1b[48;5;176m", b"\x1b[48;5;177m", b"\x1b[48;5;178m", b"\x1b[48;5;179m",
+    b"\x1b[48;5;180m", b"\x1b[48;5;181m", b"\x1b[48;5;182m", b"\x1b[48;5;183m",
+    b"\x1b[48;5;184m", b"\x1b[48;5;185m", b"\x1b[48;5;186m", b"\x1b[48;5;187m",
+    b"\x1b[48;5;188m", b"\x1b[48;5;189m", b"\x1b[48;5;190m", b"\x1b[48;5;191m",
+    b"\x1b[48;5;192m", b"\x1b[48;5;193m", b"\x1b[48;5;194m", b"\x1b[48;5;195m",
+    b"\x1b[48;5;196m", b"\x1b[48;5;197m", b"\x1b[48;5;198m", b"\x1b[48;5;199m",
+    b"\x1b[48;5;200m", b"\x1b[48;5;201m", b"\x1b[48;5;202m", b"\x1b[48;5;203m",
+    b"\x1b[48;5;204m", b"\x1b[48;5;205m", b"\x1b[48;5;206m", b"\x1b[48;5;207m",
+    b"\x1b[48;5;208m", b"\x1b[48;5;209m", b"\x1b[48;5;210m", b"\x1b[48;5;211m",
+    b"\x1b[48;5;212m", b"\x1b[48;5;213m", b"\x1b[48;5;214m", b"\x1b[48;5;215m",
+    b"\x1b[48;5;216m", b"\x1b[48;5;217m", b"\x1b[48;5;218m", b"\x1b[48;5;219m",
+    b"\x1b[48;5;220m", b"\x1b[48;5;221m", b"\x1b[48;5;222m", b"\x1b[48;5;223m",
+    b"\x1b[48;5;224m", b"\x1b[48;5;225m", b"\x1b[48;5;226m", b"\x1b[48;5;227m",
+    b"\x1b[48;5;228m", b"\x1b[48;5;229m", b"\x1b[48;5;230m", b"\x1b[48;5;231m",
+    b"\x1b[48;5;232m", b"\x1b[48;5;233m", b"\x1b[48;5;234m", b"\x1b[48;5;235m",
+    b"\x1b[48;5;236m", b"\x1b[48;5;237m", b"\x1b[48;5;238m", b"\x1b[48;5;239m",
+    b"\x1b[48;5;240m", b"\x1b[48;5;241m", b"\x1b[48;5;242m", b"\x1b[48;5;243m",
+    b"\x1b[48;5;244m", b"\x1b[48;5;245m", b"\x1b[48;5;246m", b"\x1b[48;5;247m",
+    b"\x1b[48;5;248m", b"\x1b[48;5;249m", b"\x1b[48;5;250m", b"\x1b[48;5;251m",
+    b"\x1b[48;5;252m", b"\x1b[48;5;253m", b"\x1b[48;5;254m", b"\x1b[48;5;255m",
+)
+# fmt: on
+
+RESET = "\x1b[0m"
+
+RESET_BYTES = b"\x1b[0m"
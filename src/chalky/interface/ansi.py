@@ -4,12 +4,39 @@
 
 """Contains the ANSI interface implementation."""
 
+import re
 import time
-from typing import Optional, Set
-
-from ..color import Color, Color_T, TrueColor
-from ..helpers import int_to_bytes
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from ..color import Color, Color_T, IndexedColor, TrueColor
+from ..helpers import int_to_bytes, supports_synchronized_output
 from ..style import Style
+from ._sequences import (
+    BACKGROUND_PREFIX_BYTES,
+    BACKGROUND_PREFIXES,
+    FOREGROUND_PREFIX_BYTES,
+    FOREGROUND_PREFIXES,
+    INDEXED_BACKGROUND_PREFIX_BYTES,
+    INDEXED_BACKGROUND_PREFIXES,
+    INDEXED_FOREGROUND_PREFIX_BYTES,
+    INDEXED_FOREGROUND_PREFIXES,
+    RESET,
+    RESET_BYTES,
+    STYLE_PREFIX_BYTES,
+    STYLE_PREFIXES,
+)
 from .base import BaseInterface
 
 ESC = b"\x1b"
@@ -73,6 +100,29 @@ STYLE_MAP = {
     Style.NORMAL: b"22",
 }
 
+# SGR codes that turn off previously applied styles
+STYLE_RESET_MAP: Dict[int, Set[Style]] = {
+    22: {Style.BOLD, Style.DIM},
+    23: {Style.ITALIC},
+    24: {Style.UNDERLINE},
+    25: {Style.SLOW_BLINK, Style.RAPID_BLINK},
+    27: {Style.REVERSED},
+    28: {Style.CONCEAL},
+    29: {Style.STRIKETHROUGH},
+}
+
+STYLE_CODE_MAP: Dict[int, Style] = {
+    int(code): style
+    for style, code in STYLE_MAP.items()
+    if style not in (Style.RESET, Style.NORMAL)
+}
+FOREGROUND_CODES = {int(code) for code in FOREGROUND_COLOR_MAP.values()} | {38}
+BACKGROUND_CODES = {int(code) for code in BACKGROUND_COLOR_MAP.values()} | {48}
+FOREGROUND_RESET_CODE = 39
+BACKGROUND_RESET_CODE = 49
+
+SGR_PATTERN = re.compile(r"\x1b\[([0-9;:]*)m")
+
 
 def build_escape_sequence(code: bytes) -> bytes:
     """Build the escape sequence for some given sequence code.
@@ -101,11 +151,7 @@ def build_style(style: Style) -> bytes:
             The proper escape sequence for styling text with the given style.
     """
 
-    style_code = STYLE_MAP.get(style)
-    if style_code is None:
-        return b""
-
-    return build_escape_sequence(style_code)
+    return STYLE_PREFIX_BYTES.get(style, b"")
 
 
 def build_truecolor(color: TrueColor, background: bool = False) -> bytes:
@@ -148,13 +194,269 @@ def build_color(color: Color_T, background: bool = False) -> bytes:
 
     if isinstance(color, TrueColor):
         return build_truecolor(color, background=background)
+    if isinstance(color, IndexedColor):
+        return (
+            INDEXED_BACKGROUND_PREFIX_BYTES
+            if background
+            else INDEXED_FOREGROUND_PREFIX_BYTES
+        )[color.index]
+
+    prefixes = BACKGROUND_PREFIX_BYTES if background else FOREGROUND_PREFIX_BYTES
+    return prefixes.get(color, b"")
+
+
+def build_sequence(
+    style: AbstractSet[Style],
+    background: Optional[Color_T],
+    foreground: Optional[Color_T],
+) -> bytes:
+    """Build the escape sequences for a given set of styles and colors.
+
+    Args:
+        style (AbstractSet[:class:`~style.Style`]):
+            The set of styles to build escape sequences for.
+        background (Optional[:class:`~color.Color_T`]):
+            The background color to build the escape sequence for.
+        foreground (Optional[:class:`~color.Color_T`]):
+            The foreground color to build the escape sequence for.
+
+    Returns:
+        bytes:
+            The proper escape sequences for styling text with the given styles and
+            colors.
+    """
+
+    escape_sequence = b"".join(map(build_style, style))
+    if background:
+        escape_sequence += build_color(background, background=True)
+    if foreground:
+        escape_sequence += build_color(foreground)
+
+    return escape_sequence
+
+
+@lru_cache(maxsize=1024)
+def get_prefix(
+    style: FrozenSet[Style],
+    background: Optional[Color_T],
+    foreground: Optional[Color_T],
+) -> str:
+    """Get the escape sequences for a given set of styles and colors as a string.
+
+    Named styles, named colors and indexed colors are read from the precomputed
+    tables, only truecolors are built, and the result is cached for repeated
+    applications of the same chalk.
+    Styles are always emitted in the order of :data:`~.interface.ansi.STYLE_MAP`, so
+    a reset in the set of styles never clears the other styles.
+
+    Args:
+        style (FrozenSet[:class:`~style.Style`]):
+            The set of styles to get escape sequences for.
+        background (Optional[:class:`~color.Color_T`]):
+            The background color to get the escape sequence for.
+        foreground (Optional[:class:`~color.Color_T`]):
+            The foreground color to get the escape sequence for.
+
+    Returns:
+        str:
+            The escape sequences for styling text with the given styles and colors.
+    """
+
+    prefix = "".join(
+        sequence for value, sequence in STYLE_PREFIXES.items() if value in style
+    )
+    if background:
+        if isinstance(background, TrueColor):
+            prefix += build_truecolor(background, background=True).decode("ascii")
+        elif isinstance(background, IndexedColor):
+            prefix += INDEXED_BACKGROUND_PREFIXES[background.index]
+        else:
+            prefix += BACKGROUND_PREFIXES.get(background, "")
+    if foreground:
+        if isinstance(foreground, TrueColor):
+            prefix += build_truecolor(foreground).decode("ascii")
+        elif isinstance(foreground, IndexedColor):
+            prefix += INDEXED_FOREGROUND_PREFIXES[foreground.index]
+        else:
+            prefix += FOREGROUND_PREFIXES.get(foreground, "")
+
+    return prefix
+
+
+def get_color_code(color: Color_T, background: bool = False) -> bytes:
+    """Get the SGR code for a given color without the surrounding escape sequence.
+
+    Args:
+        color (:attr:`~color.Color_T`):
+            The color to get the code for.
+        background (bool, optional):
+            True if the color should be used as a background color.
+            Defaults to False.
+
+    Returns:
+        bytes:
+            The SGR code of the color.
+    """
+
+    if isinstance(color, TrueColor):
+        return (b"48" if background else b"38") + b";2;" + b";".join(color.to_bytes())
+    if isinstance(color, IndexedColor):
+        return (b"48" if background else b"38") + b";5;" + int_to_bytes(color.index)
 
     color_map = BACKGROUND_COLOR_MAP if background else FOREGROUND_COLOR_MAP
-    color_code = color_map.get(color)
-    if color_code is None:
+    return color_map.get(color, b"")
+
+
+def build_combined_sequence(
+    style: AbstractSet[Style],
+    background: Optional[Color_T],
+    foreground: Optional[Color_T],
+) -> bytes:
+    """Build a single escape sequence for a given set of styles and colors.
+
+    Args:
+        style (AbstractSet[:class:`~style.Style`]):
+            The set of styles to build the escape sequence for.
+        background (Optional[:class:`~color.Color_T`]):
+            The background color to build the escape sequence for.
+        foreground (Optional[:class:`~color.Color_T`]):
+            The foreground color to build the escape sequence for.
+
+    Returns:
+        bytes:
+            The combined escape sequence, empty if there is nothing to apply.
+    """
+
+    codes = [code for value, code in STYLE_MAP.items() if value in style]
+    if background:
+        codes.append(get_color_code(background, background=True))
+    if foreground:
+        codes.append(get_color_code(foreground))
+
+    codes = [code for code in codes if code]
+    if not codes:
         return b""
 
-    return build_escape_sequence(color_code)
+    return build_escape_sequence(b";".join(codes))
+
+
+def build_restore(
+    params: str,
+    style: AbstractSet[Style],
+    background: Optional[Color_T],
+    foreground: Optional[Color_T],
+) -> bytes:
+    """Build the escape sequence restoring outer attributes cleared by a reset.
+
+    Only the outer styles and colors cleared by a reset (``0``) in the SGR parameters
+    that are not explicitly set again by the following parameters are restored.
+    Other codes that turn off styles or colors are intentional choices of the nested
+    value and are left alone.
+
+    Args:
+        params (str):
+            The parameters of the SGR sequence, such as ``"0"`` or ``"0;1;31"``.
+        style (AbstractSet[:class:`~style.Style`]):
+            The set of outer styles.
+        background (Optional[:class:`~color.Color_T`]):
+            The outer background color.
+        foreground (Optional[:class:`~color.Color_T`]):
+            The outer foreground color.
+
+    Returns:
+        bytes:
+            The escape sequence restoring the lost attributes, empty if nothing was
+            lost.
+    """
+
+    lost_style: Set[Style] = set()
+    lost_background = lost_foreground = False
+
+    codes = params.split(";")
+    index = 0
+    while index < len(codes):
+        subparams = codes[index].split(":")
+        code = int(subparams[0]) if subparams[0].isdigit() else 0
+        index += 1
+
+        if code == 0:
+            lost_style = {value for value in style if value in STYLE_CODE_MAP.values()}
+            lost_background = background is not None
+            lost_foreground = foreground is not None
+        elif code in STYLE_CODE_MAP:
+            lost_style.discard(STYLE_CODE_MAP[code])
+        elif code in STYLE_RESET_MAP:
+            lost_style -= STYLE_RESET_MAP[code]
+        elif code == FOREGROUND_RESET_CODE or code in FOREGROUND_CODES:
+            lost_foreground = False
+        elif code == BACKGROUND_RESET_CODE or code in BACKGROUND_CODES:
+            lost_background = False
+
+        # skip the semicolon separated components of extended colors
+        if code in (38, 48) and len(subparams) == 1 and index < len(codes):
+            index += {"5": 2, "2": 4}.get(codes[index], 1)
+
+    return build_combined_sequence(
+        lost_style,
+        background if lost_background else None,
+        foreground if lost_foreground else None,
+    )
+
+
+def build_nested(
+    value: str,
+    style: AbstractSet[Style],
+    background: Optional[Color_T],
+    foreground: Optional[Color_T],
+) -> str:
+    """Restore the outer styles and colors after each nested reset of a value.
+
+    Adjacent SGR sequences are treated as one, so a nested reset that is immediately
+    followed by the nested value restoring its own styles only restores what is still
+    missing.
+
+    Args:
+        value (str):
+            The value that may contain nested SGR sequences.
+        style (AbstractSet[:class:`~style.Style`]):
+            The set of outer styles.
+        background (Optional[:class:`~color.Color_T`]):
+            The outer background color.
+        foreground (Optional[:class:`~color.Color_T`]):
+            The outer foreground color.
+
+    Returns:
+        str:
+            The value with the lost outer attributes restored.
+    """
+
+    pieces: List[str] = []
+    params: List[str] = []
+    last = 0
+    length = len(value)
+    matches = SGR_PATTERN.finditer(value)
+    match = next(matches, None)
+    while match is not None:
+        params.append(match.group(1) or "0")
+        end = match.end()
+        match = next(matches, None)
+        if match is not None and match.start() == end:
+            continue
+
+        if end < length:
+            restore = build_restore(";".join(params), style, background, foreground)
+            if restore:
+                pieces.append(value[last:end])
+                pieces.append(restore.decode("ascii"))
+                last = end
+
+        params.clear()
+
+    if not pieces:
+        return value
+
+    pieces.append(value[last:])
+    return "".join(pieces)
 
 
 def get_clear_mode(keep_head: bool, keep_tail: bool) -> Optional[int]:
@@ -235,7 +537,7 @@ def build_reset() -> bytes:
             The proper escape sequence to reset the terminal text style and color.
     """
 
-    return build_escape_sequence(STYLE_MAP.get(Style.RESET, b"0"))
+    return RESET_BYTES
 
 
 def build_position_cursor(x: int, y: int) -> bytes:
@@ -262,6 +564,50 @@ def build_position_cursor(x: int, y: int) -> bytes:
     return CSI + int_to_bytes(y) + b";" + int_to_bytes(x) + b"H"
 
 
+def build_cursor_up(count: int) -> bytes:
+    """Build the appropriate escape sequence to move the terminal cursor up.
+
+    Args:
+        count (int):
+            The number of rows to move the cursor up.
+
+    Raises:
+        ValueError:
+            When the given count is less than or equal to 0.
+
+    Returns:
+        bytes:
+            The appropriate escape sequence to move the terminal cursor up.
+    """
+
+    if count <= 0:
+        raise ValueError(f"Cursor movements must be positive, received {count}")
+
+    return CSI + int_to_bytes(count) + b"A"
+
+
+def build_cursor_down(count: int) -> bytes:
+    """Build the appropriate escape sequence to move the terminal cursor down.
+
+    Args:
+        count (int):
+            The number of rows to move the cursor down.
+
+    Raises:
+        ValueError:
+            When the given count is less than or equal to 0.
+
+    Returns:
+        bytes:
+            The appropriate escape sequence to move the terminal cursor down.
+    """
+
+    if count <= 0:
+        raise ValueError(f"Cursor movements must be positive, received {count}")
+
+    return CSI + int_to_bytes(count) + b"B"
+
+
 def build_video(normal: bool) -> bytes:
     """Build the appropriate escape sequence to control the terminal video state.
 
@@ -292,6 +638,21 @@ def build_cursor(show: bool) -> bytes:
     return CSI + b"?25" + (b"h" if show else b"l")
 
 
+def build_synchronized_update(begin: bool) -> bytes:
+    """Build the appropriate escape sequence to control synchronized terminal updates.
+
+    Args:
+        begin (bool):
+            True if the synchronized update should begin, False if it should end.
+
+    Returns:
+        bytes:
+            The proper escape sequence to control synchronized terminal updates.
+    """
+
+    return CSI + b"?2026" + (b"h" if begin else b"l")
+
+
 def build_set_title(title: str) -> bytes:
     """Build the appropriate escape sequence for setting the terminal title.
 
@@ -310,8 +671,19 @@ def build_set_title(title: str) -> bytes:
 class AnsiInterface(BaseInterface):
     """The interface to control ANSI terminals."""
 
-    def _write(self, content: bytes):
-        """Write the given bytes and immediately flush them.
+    def __init__(self, io: TextIO):
+        """Initialize the interface with some text io buffer.
+
+        Args:
+            io (:class:`~typing.TextIO`):
+                The text io buffer to write to.
+        """
+
+        super().__init__(io)
+        self._batch: Optional[List[bytes]] = None
+
+    def _emit(self, content: bytes):
+        """Write the given bytes to the ANSI text io and immediately flush them.
 
         Args:
             content (bytes):
@@ -319,7 +691,86 @@ class AnsiInterface(BaseInterface):
         """
 
         self.io.write(content.decode(self.io.encoding))
-        self.io.flush()
+        self.flush()
+
+    def _write(self, content: bytes):
+        """Write the given bytes or collect them if a batch is active.
+
+        Args:
+            content (bytes):
+                The bytes to write to the ANSI text io.
+        """
+
+        if self._batch is not None:
+            self._batch.append(content)
+            return
+
+        self._emit(content)
+
+    def write_text(self, text: str):
+        """Write some text or collect it if a batch is active.
+
+        Unlike control sequences, text is not flushed, just like :func:`print`.
+
+        Args:
+            text (str):
+                The text to write.
+        """
+
+        if self._batch is not None:
+            self._batch.append(text.encode(self.io.encoding))
+            return
+
+        self.io.write(text)
+
+    @contextmanager
+    def batch(self, synchronized: Optional[bool] = None) -> Iterator[None]:
+        """Collect all output written within the context and write it at once.
+
+        Nested batches are collected into the outermost batch.
+        Text printed with :func:`chalky.print` to the io buffer of this interface is
+        collected in order with the control sequences, while text written to the io
+        buffer directly, such as with the builtin :func:`print`, is not collected and
+        is written before the batch.
+        A :meth:`~.AnsiInterface.flash` within the batch writes the output collected
+        so far so the flash is visible.
+
+        Examples:
+            Hiding the cursor, clearing the screen and setting the title only writes
+            to the terminal once:
+
+            >>> interface = get_interface()
+            >>> with interface.batch():
+            ...     interface.hide_cursor()
+            ...     interface.clear_screen()
+            ...     interface.set_title("Dashboard")
+
+        Args:
+            synchronized (Optional[bool], optional):
+                If True, will wrap the batch in a synchronized update so the terminal
+                displays it at once.
+                Defaults to wrapping the batch only if the terminal supports it.
+        """
+
+        if self._batch is not None:
+            yield
+            return
+
+        batch: List[bytes] = []
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+            if batch:
+                if synchronized is None:
+                    synchronized = self.io.isatty() and supports_synchronized_output()
+
+                if synchronized:
+                    batch.insert(0, build_synchronized_update(True))
+                    batch.append(build_synchronized_update(False))
+
+                self._emit(b"".join(batch))
 
     def clear_screen(
         self,
@@ -421,23 +872,35 @@ class AnsiInterface(BaseInterface):
                 The delay in seconds the flash should last.
         """
 
-        self.reverse_video()
-        time.sleep(duration)
-        self.normal_video()
+        batch, self._batch = self._batch, None
+        if batch:
+            # the flash is only visible if the output collected so far is written first
+            self._emit(b"".join(batch))
+            batch.clear()
+
+        try:
+            self.reverse_video()
+            time.sleep(duration)
+            self.normal_video()
+        finally:
+            self._batch = batch
 
     def apply(
         self,
         value: str,
-        style: Set[Style],
+        style: AbstractSet[Style],
         background: Optional[Color_T],
         foreground: Optional[Color_T],
     ) -> str:
         """Apply some style and color to a string for ANSI terminals.
 
+        Styled values can be nested, the outer styles and colors cleared by the
+        sequences of a nested value are restored right after those sequences.
+
         Args:
             value (str):
                 The string value to apply styles to.
-            style (Set[:class:`~style.Style`]):
+            style (AbstractSet[:class:`~style.Style`]):
                 The set of styles to apply to the given string.
             background (Optional[:class:`~color.Color_T`]):
                 The background color to apply to the given string.
@@ -448,14 +911,37 @@ class AnsiInterface(BaseInterface):
             str: The styled string value.
         """
 
-        escape_sequence = b"".join(map(build_style, style))
-        if background:
-            escape_sequence += build_color(background, background=True)
-        if foreground:
-            escape_sequence += build_color(foreground)
+        prefix = get_prefix(frozenset(style), background, foreground)
+        if prefix and "\x1b[" in value:
+            value = build_nested(value, style, background, foreground)
 
-        return (
-            escape_sequence.decode(self.io.encoding)
-            + value
-            + build_reset().decode(self.io.encoding)
-        )
+        return prefix + value + RESET
+
+    def get_affixes(
+        self,
+        style: AbstractSet[Style],
+        background: Optional[Color_T],
+        foreground: Optional[Color_T],
+    ) -> Tuple[str, str]:
+        """Get the strings to place around a value to style it for ANSI terminals.
+
+        Args:
+            style (AbstractSet[:class:`~style.Style`]):
+                The set of styles to apply.
+            background (Optional[:class:`~color.Color_T`]):
+                The background color to apply.
+            foreground (Optional[:class:`~color.Color_T`]):
+                The foreground color to apply.
+
+        Returns:
+            Tuple[str, str]:
+                The escape sequence to place before a value and the reset sequence to
+                place after it.
+                Both are empty if there is nothing to apply.
+        """
+
+        prefix = get_prefix(frozenset(style), background, foreground)
+        if not prefix:
+            return ("", "")
+
+        return (prefix, RESET)
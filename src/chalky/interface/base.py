@@ -5,11 +5,21 @@
 """Contains the base abstract interface to inherit from."""
 
 import abc
-from typing import Optional, Set, TextIO
+from typing import TYPE_CHECKING, AbstractSet, Iterable, List, Optional, TextIO, Tuple
 
 from ..color import Color_T
+from ..constants import is_disabled
 from ..style import Style
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ..chalk import Chalk
+
+# Pieces at least this long are written on their own rather than joined with others.
+WRITE_THRESHOLD = 4096
+
+# Value styled by the default implementation of get_affixes to find the affixes.
+AFFIX_PLACEHOLDER = "\x00"
+
 
 class BaseInterface(abc.ABC):
     """The base abstract interface to inherit from."""
@@ -110,7 +120,7 @@ class BaseInterface(abc.ABC):
     def apply(
         self,
         value: str,
-        style: Set[Style],
+        style: AbstractSet[Style],
         background: Optional[Color_T],
         foreground: Optional[Color_T],
     ) -> str:  # pragma: no cover
@@ -119,7 +129,7 @@ class BaseInterface(abc.ABC):
         Args:
             value (str):
                 The string to apply styles and colors to.
-            style (Set[:class:`~style.Style`]):
+            style (AbstractSet[:class:`~style.Style`]):
                 The set of styles to apply to the string value.
             background (Optional[:class:`~color.Color_T`]):
                 The background color to apply to the given string.
@@ -132,3 +142,110 @@ class BaseInterface(abc.ABC):
         """
 
         ...
+
+    def get_affixes(
+        self,
+        style: AbstractSet[Style],
+        background: Optional[Color_T],
+        foreground: Optional[Color_T],
+    ) -> Tuple[str, str]:
+        """Get the strings to place around a value to apply some styles and colors.
+
+        By default the affixes are found by applying the styles and colors to a
+        placeholder value, interfaces should override this if they can build the
+        affixes directly.
+
+        Args:
+            style (AbstractSet[:class:`~style.Style`]):
+                The set of styles to apply.
+            background (Optional[:class:`~color.Color_T`]):
+                The background color to apply.
+            foreground (Optional[:class:`~color.Color_T`]):
+                The foreground color to apply.
+
+        Raises:
+            ValueError:
+                When applying styles and colors does not preserve the placeholder.
+
+        Returns:
+            Tuple[str, str]:
+                The prefix and suffix to place before and after a value.
+        """
+
+        prefix, placeholder, suffix = self.apply(
+            AFFIX_PLACEHOLDER, style, background, foreground
+        ).partition(AFFIX_PLACEHOLDER)
+        if not placeholder:
+            raise ValueError(f"{self.__class__.__name__} does not preserve values")
+
+        return (prefix, suffix)
+
+    def flush(self):
+        """Flush the io buffer."""
+
+        self.io.flush()
+
+    def write_text(self, text: str):
+        """Write some unstyled text to the io buffer as is.
+
+        Args:
+            text (str):
+                The text to write.
+        """
+
+        self.io.write(text)
+
+    def writelines(self, pieces: Iterable[str]):
+        """Write some pieces of text to the io buffer.
+
+        Pieces of at least :data:`~.interface.base.WRITE_THRESHOLD` characters are
+        written directly instead of being copied into a joined string, smaller pieces
+        are joined as a single write is cheaper than copying them.
+
+        Args:
+            pieces (Iterable[str]):
+                The pieces of text to write.
+        """
+
+        write = self.write_text
+        pending: List[str] = []
+        for piece in pieces:
+            if len(piece) < WRITE_THRESHOLD:
+                pending.append(piece)
+                continue
+
+            if pending:
+                write("".join(pending))
+                pending.clear()
+            write(piece)
+
+        if pending:
+            write("".join(pending))
+
+    def write(self, value: str, chalk: Optional["Chalk"] = None):
+        """Write a string styled by some chalk to the io buffer.
+
+        The affixes and the value are written as pieces, so large values are never
+        copied into a styled string.
+        The value is written without any styles if chalky is disabled.
+
+        Args:
+            value (str):
+                The string value to write.
+            chalk (Optional[:class:`~.chalk.Chalk`], optional):
+                The chalk to apply to the given string.
+                Defaults to None.
+        """
+
+        if chalk is None or is_disabled():
+            self.write_text(value)
+            return
+
+        style, background, foreground = chalk.style, chalk.background, chalk.foreground
+        if "\x1b[" in value:
+            # nested values need the outer styles restored by the interface
+            self.writelines((self.apply(value, style, background, foreground),))
+            return
+
+        prefix, suffix = self.get_affixes(style, background, foreground)
+        self.writelines((prefix, value, suffix))
@@ -0,0 +1,413 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains the HTML interface implementation.
+
+Styled text is rendered as ``<span>`` elements that reference a deduplicated
+stylesheet containing a single CSS class for each distinct combination of styles and
+colors:
+
+>>> import io
+>>> from chalky import Color, Style
+>>> from chalky.interface.html import HtmlInterface
+>>> interface = HtmlInterface(io.StringIO())
+>>> interface.apply("Error", {Style.BOLD}, None, Color.RED)
+'<span class="chalky-0">Error</span>'
+>>> interface.stylesheet()
+'.chalky-0 { font-weight: bold; color: #cd0000; }'
+
+Large documents, such as colored build logs, can be streamed straight to the io buffer.
+The rules of classes generated before :meth:`~.HtmlInterface.begin` are emitted in a
+single stylesheet ahead of the output, rules of classes first used while streaming
+are emitted in a single stylesheet after it.
+Adjacent writes with the same style are merged into a single span:
+
+>>> with open("build.html", "w") as html_io:
+...     interface = HtmlInterface(html_io)
+...     interface.begin(title="build")
+...     for chunk in iter(lambda: process.stdout.read(65536), b""):
+...         interface.feed(chunk)
+...     interface.end()
+
+.. important::
+    The strings given to :meth:`~.HtmlInterface.apply` are escaped, so chalk applied
+    to text that was already styled by this interface will escape the inner spans.
+"""
+
+from html import escape
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, TextIO, Tuple, Union
+
+from ..chalk import Chalk
+from ..color import XTERM_SYSTEM_COLORS, Color, Color_T, IndexedColor, TrueColor
+from ..constants import is_disabled
+from ..parser import AnsiParser, Event_T, Segment
+from ..style import Style
+from .base import BaseInterface
+
+Key_T = Tuple[FrozenSet[Style], Optional[Color_T], Optional[Color_T]]
+
+COLOR_MAP: Dict[Color, str] = {
+    color: "#{:02x}{:02x}{:02x}".format(*rgb)
+    for color, rgb in zip(Color, XTERM_SYSTEM_COLORS)
+}
+
+STYLE_MAP: Dict[Style, str] = {
+    Style.BOLD: "font-weight: bold",
+    Style.DIM: "opacity: 0.5",
+    Style.ITALIC: "font-style: italic",
+    Style.CONCEAL: "visibility: hidden",
+}
+
+DECORATION_MAP: Dict[Style, str] = {
+    Style.UNDERLINE: "underline",
+    Style.SLOW_BLINK: "blink",
+    Style.RAPID_BLINK: "blink",
+    Style.STRIKETHROUGH: "line-through",
+}
+
+DEFAULT_FOREGROUND = "var(--chalky-foreground, #ffffff)"
+DEFAULT_BACKGROUND = "var(--chalky-background, #000000)"
+
+
+def build_color(color: Color_T) -> str:
+    """Build the CSS color value for a given color.
+
+    Args:
+        color (:attr:`~color.Color_T`):
+            The color to build the CSS color value for.
+
+    Returns:
+        str:
+            The CSS color value.
+    """
+
+    if isinstance(color, IndexedColor):
+        color = color.to_true_color()
+    if isinstance(color, TrueColor):
+        return f"#{color.red:02x}{color.green:02x}{color.blue:02x}"
+
+    return COLOR_MAP[color]
+
+
+def build_declarations(
+    style: AbstractSet[Style],
+    background: Optional[Color_T],
+    foreground: Optional[Color_T],
+) -> str:
+    """Build the CSS declarations for a given set of styles and colors.
+
+    Args:
+        style (AbstractSet[:class:`~style.Style`]):
+            The set of styles to build declarations for.
+        background (Optional[:class:`~color.Color_T`]):
+            The background color to build the declaration for.
+        foreground (Optional[:class:`~color.Color_T`]):
+            The foreground color to build the declaration for.
+
+    Returns:
+        str:
+            The CSS declarations, empty if nothing needs to be styled.
+    """
+
+    declarations = [STYLE_MAP[value] for value in STYLE_MAP if value in style]
+
+    decorations = []
+    for value, decoration in DECORATION_MAP.items():
+        if value in style and decoration not in decorations:
+            decorations.append(decoration)
+    if decorations:
+        declarations.append(f"text-decoration: {' '.join(decorations)}")
+
+    color = build_color(foreground) if foreground else None
+    background_color = build_color(background) if background else None
+    if Style.REVERSED in style:
+        color, background_color = (
+            background_color or DEFAULT_BACKGROUND,
+            color or DEFAULT_FOREGROUND,
+        )
+
+    if color:
+        declarations.append(f"color: {color}")
+    if background_color:
+        declarations.append(f"background-color: {background_color}")
+
+    return "; ".join(declarations)
+
+
+class HtmlInterface(BaseInterface):
+    """The interface for rendering styled text as HTML.
+
+    Terminal control methods such as :meth:`~.HtmlInterface.clear_screen` have no
+    meaning in a document and do nothing.
+
+    Parameters:
+        io (:class:`~typing.TextIO`):
+            The text io buffer to stream documents to.
+        prefix (str, optional):
+            The prefix of generated CSS class names.
+            Defaults to "chalky-".
+    """
+
+    def __init__(self, io: TextIO, prefix: str = "chalky-"):
+        """Initialize the interface with some text io buffer."""
+
+        super().__init__(io)
+        self.prefix = prefix
+
+        self._classes: Dict[Key_T, str] = {}
+        self._rules: List[str] = []
+        self._emitted = 0
+        self._current: Optional[str] = None
+        self._parser: Optional[AnsiParser] = None
+        self._title: Optional[str] = None
+
+    def get_class(
+        self,
+        style: AbstractSet[Style],
+        background: Optional[Color_T],
+        foreground: Optional[Color_T],
+    ) -> str:
+        """Get the CSS class name for a given set of styles and colors.
+
+        Classes are generated once for each distinct combination.
+
+        Args:
+            style (AbstractSet[:class:`~style.Style`]):
+                The set of styles of the class.
+            background (Optional[:class:`~color.Color_T`]):
+                The background color of the class.
+            foreground (Optional[:class:`~color.Color_T`]):
+                The foreground color of the class.
+
+        Returns:
+            str:
+                The class name, empty if nothing needs to be styled.
+        """
+
+        key = (frozenset(style), background, foreground)
+        class_name = self._classes.get(key)
+        if class_name is None:
+            declarations = build_declarations(style, background, foreground)
+            class_name = ""
+            if declarations:
+                class_name = f"{self.prefix}{len(self._rules)}"
+                self._rules.append(f".{class_name} {{ {declarations}; }}")
+
+            self._classes[key] = class_name
+
+        return class_name
+
+    def get_rule(self, class_name: str) -> str:
+        """Get the CSS rule of a generated class.
+
+        Args:
+            class_name (str):
+                The generated class name.
+
+        Returns:
+            str:
+                The CSS rule of the class.
+        """
+
+        return self._rules[int(class_name[len(self.prefix) :])]
+
+    def _write_stylesheet(self):
+        if len(self._rules) > self._emitted:
+            rules = "\n".join(self._rules[self._emitted :])
+            self.io.write(f"<style>\n{rules}\n</style>\n")
+            self._emitted = len(self._rules)
+
+    def stylesheet(self) -> str:
+        """Build the stylesheet of all classes generated so far.
+
+        Returns:
+            str:
+                The CSS rules of all generated classes.
+        """
+
+        return "\n".join(self._rules)
+
+    def clear_screen(
+        self,
+        reset_position: bool = True,
+        keep_head: bool = False,
+        keep_tail: bool = False,
+    ):
+        """Do nothing, documents have no screen to clear."""
+
+    def clear_line(self, keep_head: bool = False, keep_tail: bool = False):
+        """Do nothing, documents have no line to clear."""
+
+    def set_title(self, title: str):
+        """Do nothing, use :meth:`~.HtmlInterface.begin` to title documents."""
+
+    def reset(self):
+        """Close the currently open span of the streamed document."""
+
+        if self._current:
+            self.io.write("</span>")
+        self._current = None
+
+    def hide_cursor(self):
+        """Do nothing, documents have no cursor."""
+
+    def show_cursor(self):
+        """Do nothing, documents have no cursor."""
+
+    def flash(self, duration: float):
+        """Do nothing, documents cannot flash."""
+
+    def apply(
+        self,
+        value: str,
+        style: AbstractSet[Style],
+        background: Optional[Color_T],
+        foreground: Optional[Color_T],
+    ) -> str:
+        """Apply some style and color to an escaped string as a span.
+
+        Args:
+            value (str):
+                The string value to apply styles to.
+            style (AbstractSet[:class:`~style.Style`]):
+                The set of styles to apply to the given string.
+            background (Optional[:class:`~color.Color_T`]):
+                The background color to apply to the given string.
+            foreground (Optional[:class:`~color.Color_T`]):
+                The foreground color to apply to the given string.
+
+        Returns:
+            str: The span containing the escaped string.
+        """
+
+        prefix, suffix = self.get_affixes(style, background, foreground)
+        return prefix + escape(value, quote=False) + suffix
+
+    def get_affixes(
+        self,
+        style: AbstractSet[Style],
+        background: Optional[Color_T],
+        foreground: Optional[Color_T],
+    ) -> Tuple[str, str]:
+        """Get the span tags to place around a value to apply some styles and colors.
+
+        Args:
+            style (AbstractSet[:class:`~style.Style`]):
+                The set of styles to apply.
+            background (Optional[:class:`~color.Color_T`]):
+                The background color to apply.
+            foreground (Optional[:class:`~color.Color_T`]):
+                The foreground color to apply.
+
+        Returns:
+            Tuple[str, str]:
+                The opening and closing span tags.
+        """
+
+        class_name = self.get_class(style, background, foreground)
+        if not class_name:
+            return ("", "")
+
+        return (f'<span class="{class_name}">', "</span>")
+
+    def begin(self, title: Optional[str] = None):
+        """Start streaming a document to the io buffer.
+
+        The rules of all classes generated so far are written before the output.
+
+        Args:
+            title (Optional[str], optional):
+                If given, will stream a full HTML page with the given title.
+                Defaults to None.
+        """
+
+        self._emitted = 0
+        if title is not None:
+            self.io.write(
+                '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+                f"<title>{escape(title)}</title>\n"
+            )
+            self._write_stylesheet()
+            self.io.write("</head>\n<body>\n")
+        else:
+            self._write_stylesheet()
+        self.io.write(f'<pre class="{self.prefix}output">')
+        self._title = title
+
+    def write(self, value: str, chalk: Optional[Chalk] = None):
+        """Stream some text styled by some chalk to the io buffer.
+
+        Text written with the same style as the previous write continues the open span.
+        The text is written without any styles if chalky is disabled.
+
+        Args:
+            value (str):
+                The string value to write.
+            chalk (Optional[:class:`~.chalk.Chalk`], optional):
+                The chalk to apply to the given string.
+                Defaults to None.
+        """
+
+        if not value:
+            return
+
+        class_name = ""
+        if chalk is not None and not is_disabled():
+            class_name = self.get_class(chalk.style, chalk.background, chalk.foreground)
+        if class_name != self._current:
+            self.reset()
+            if class_name:
+                self.io.write(f'<span class="{class_name}">')
+            self._current = class_name
+
+        self.io.write(escape(value, quote=False))
+
+    def write_text(self, text: str):
+        """Stream some unstyled text to the io buffer.
+
+        Args:
+            text (str):
+                The text to write.
+        """
+
+        self.write(text)
+
+    def feed(self, chunk: Union[str, bytes]):
+        """Stream a chunk of text containing ANSI escape sequences as HTML.
+
+        Escape sequences split across chunks are handled, non-styling sequences are
+        dropped.
+
+        Args:
+            chunk (Union[str, bytes]):
+                The next chunk of text to stream.
+        """
+
+        if self._parser is None:
+            self._parser = AnsiParser()
+
+        self._write_segments(self._parser.feed(chunk))
+
+    def _write_segments(self, events: List[Event_T]):
+        for event in events:
+            if isinstance(event, Segment):
+                self.write(event.text, event.chalk)
+
+    def end(self):
+        """Finish streaming a document to the io buffer.
+
+        The rules of classes first used while streaming are written after the output.
+        """
+
+        if self._parser is not None:
+            self._write_segments(self._parser.close())
+            self._parser = None
+
+        self.reset()
+        self.io.write("</pre>\n")
+        self._write_stylesheet()
+        if self._title is not None:
+            self.io.write("</body>\n</html>\n")
+        self._title = None
+        self.flush()
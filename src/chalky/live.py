@@ -0,0 +1,310 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains rate-limited live regions of the terminal that are redrawn in place.
+
+A :class:`~.live.LiveRegion` owns a number of lines below the current cursor position.
+Lines can be updated as often as needed, the region is only redrawn at the configured
+frame rate and only the lines that changed since the last frame are rewritten:
+
+>>> from chalky.live import LiveRegion
+>>> with LiveRegion(fps=10) as region:
+...     index = region.append("Starting...")
+...     for count in range(100_000):
+...         region.update(index, f"Processed {count} items")
+
+Multiple progress bars can be displayed through :class:`~.live.Progress`:
+
+>>> from chalky import fg
+>>> from chalky.live import Progress
+>>> with Progress() as progress:
+...     downloads = progress.add("downloads", total=1000, chalk=fg.green)
+...     for _ in range(1000):
+...         progress.advance(downloads)
+
+.. important::
+    Lines written to a live region should not be wider than the terminal.
+    Lines that wrap will cause the region to redraw over the wrong rows.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .chalk import Chalk
+from .interface import get_interface
+from .interface.ansi import (
+    MODE_KEEP_NONE,
+    AnsiInterface,
+    build_clear_line,
+    build_cursor_down,
+    build_cursor_up,
+)
+
+
+class LiveRegion:
+    """A group of terminal lines that are redrawn in place at a limited frame rate.
+
+    Parameters:
+        lines (Optional[List[str]], optional):
+            The initial lines of the region.
+            Defaults to an empty region.
+        fps (float, optional):
+            The maximum number of times the region is redrawn per second.
+            Defaults to 10.
+        interface (Optional[:class:`~.interface.ansi.AnsiInterface`], optional):
+            The interface to draw the region with.
+            Defaults to the interface for :data:`sys.stdout`.
+
+    Raises:
+        ValueError:
+            When the given frame rate is less than or equal to 0.
+    """
+
+    def __init__(
+        self,
+        lines: Optional[List[str]] = None,
+        fps: float = 10.0,
+        interface: Optional[AnsiInterface] = None,
+    ):
+        """Initialize the region without drawing anything to the terminal."""
+
+        if fps <= 0:
+            raise ValueError(f"Frame rate must be positive, received {fps}")
+
+        self.lines: List[str] = list(lines or [])
+        self.interval = 1.0 / fps
+        self.interface = interface or get_interface()
+
+        self._rendered: List[str] = []
+        self._cursor = 0
+        self._last_refresh = float("-inf")
+
+    def __enter__(self) -> "LiveRegion":
+        """Start the region when entering a context."""
+
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        """Stop the region when exiting a context."""
+
+        self.stop()
+
+    def start(self):
+        """Hide the terminal cursor and draw the initial state of the region."""
+
+        with self.interface.batch():
+            self.interface.hide_cursor()
+            self.refresh()
+
+    def stop(self):
+        """Draw the final state of the region and show the terminal cursor."""
+
+        with self.interface.batch():
+            self.refresh()
+            self.interface.show_cursor()
+
+    def append(self, value: str) -> int:
+        """Add a new line to the bottom of the region.
+
+        Args:
+            value (str):
+                The content of the new line.
+
+        Returns:
+            int:
+                The index of the new line.
+        """
+
+        self.lines.append(value)
+        self.tick()
+        return len(self.lines) - 1
+
+    def update(self, index: int, value: str):
+        """Update the content of a line in the region.
+
+        The line is drawn on the next frame, the call is cheap between frames.
+
+        Args:
+            index (int):
+                The index of the line to update.
+            value (str):
+                The new content of the line.
+        """
+
+        self.lines[index] = value
+        self.tick()
+
+    def tick(self):
+        """Redraw the region only if the frame interval has elapsed."""
+
+        if time.monotonic() - self._last_refresh >= self.interval:
+            self.refresh()
+
+    def render(self) -> bytes:
+        """Build the content needed to draw the changes of the region.
+
+        Returns:
+            bytes:
+                The content to write to the terminal to update the region.
+        """
+
+        encoding = self.interface.io.encoding
+        rendered = self._rendered
+        height = len(rendered)
+
+        content: List[bytes] = []
+        for index in range(min(height, len(self.lines))):
+            value = self.lines[index]
+            if value == rendered[index]:
+                continue
+
+            if self._cursor > index:
+                content.append(build_cursor_up(self._cursor - index))
+            elif self._cursor < index:
+                content.append(build_cursor_down(index - self._cursor))
+
+            content.append(b"\r" + build_clear_line(MODE_KEEP_NONE))
+            content.append(value.encode(encoding))
+            rendered[index] = value
+            self._cursor = index
+
+        if self._cursor < height:
+            content.append(build_cursor_down(height - self._cursor) + b"\r")
+            self._cursor = height
+
+        for value in self.lines[height:]:
+            content.append(value.encode(encoding) + b"\n")
+            rendered.append(value)
+            self._cursor += 1
+
+        return b"".join(content)
+
+    def refresh(self):
+        """Immediately draw the changes of the region to the terminal."""
+
+        self._last_refresh = time.monotonic()
+        content = self.render()
+        if content:
+            with self.interface.batch():
+                self.interface._write(content)
+
+
+@dataclass
+class ProgressBar:
+    """Describes a single progress bar.
+
+    Parameters:
+        label (str):
+            The label displayed before the bar.
+        total (int):
+            The amount of work needed to complete the bar.
+        completed (int, optional):
+            The amount of work completed.
+            Defaults to 0.
+        width (int, optional):
+            The number of characters used to draw the bar.
+            Defaults to 30.
+        chalk (Optional[:class:`~.chalk.Chalk`], optional):
+            The chalk to draw the completed portion of the bar with.
+            Defaults to None.
+    """
+
+    label: str
+    total: int
+    completed: int = field(default=0)
+    width: int = field(default=30)
+    chalk: Optional[Chalk] = field(default=None)
+
+    def render(self) -> str:
+        """Render the current state of the bar.
+
+        Returns:
+            str:
+                The rendered bar.
+        """
+
+        ratio = min(max(self.completed / self.total, 0.0), 1.0) if self.total else 1.0
+        filled = int(self.width * ratio)
+        bar = "#" * filled
+        if self.chalk is not None and filled > 0:
+            bar = self.chalk | bar
+
+        return (
+            f"{self.label} [{bar}{'-' * (self.width - filled)}] "
+            f"{ratio * 100:3.0f}% {self.completed}/{self.total}"
+        )
+
+
+class Progress(LiveRegion):
+    """A live region displaying multiple progress bars.
+
+    Bars are only rendered when the region is redrawn, so advancing a bar between
+    frames only costs an addition.
+    """
+
+    def __init__(
+        self,
+        fps: float = 10.0,
+        interface: Optional[AnsiInterface] = None,
+    ):
+        """Initialize the progress region without any bars."""
+
+        super().__init__(fps=fps, interface=interface)
+        self.bars: List[ProgressBar] = []
+        self._indexes: List[int] = []
+
+    def add(
+        self,
+        label: str,
+        total: int,
+        width: int = 30,
+        chalk: Optional[Chalk] = None,
+    ) -> ProgressBar:
+        """Add a new progress bar to the bottom of the region.
+
+        Args:
+            label (str):
+                The label displayed before the bar.
+            total (int):
+                The amount of work needed to complete the bar.
+            width (int, optional):
+                The number of characters used to draw the bar.
+                Defaults to 30.
+            chalk (Optional[:class:`~.chalk.Chalk`], optional):
+                The chalk to draw the completed portion of the bar with.
+                Defaults to None.
+
+        Returns:
+            :class:`~.live.ProgressBar`:
+                The newly added progress bar.
+        """
+
+        bar = ProgressBar(label=label, total=total, width=width, chalk=chalk)
+        self.bars.append(bar)
+        self._indexes.append(self.append(bar.render()))
+        return bar
+
+    def advance(self, bar: ProgressBar, amount: int = 1):
+        """Advance the completed work of a progress bar.
+
+        Args:
+            bar (:class:`~.live.ProgressBar`):
+                The progress bar to advance.
+            amount (int, optional):
+                The amount of work completed.
+                Defaults to 1.
+        """
+
+        bar.completed += amount
+        self.tick()
+
+    def refresh(self):
+        """Render all progress bars and draw the changes to the terminal."""
+
+        for index, bar in zip(self._indexes, self.bars):
+            self.lines[index] = bar.render()
+
+        super().refresh()
@@ -0,0 +1,101 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a print function that writes styled values without joining them first.
+
+Values are passed just like :func:`print`, values that should be styled are passed as
+a pair of the chalk and the value:
+
+>>> import chalky
+>>> from chalky import fg, sty
+>>> chalky.print("status:", (sty.bold & fg.green, "OK"), "in", (fg.cyan, 35), "ms")
+
+The escape sequences and values are handed to the io buffer as pieces, large values
+are written directly instead of being copied into styled strings and a joined line.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, TextIO, Tuple
+
+from .chalk import Chalk
+from .constants import is_disabled
+from .interface import get_interface
+from .interface.base import WRITE_THRESHOLD, BaseInterface
+
+
+@lru_cache(maxsize=256)
+def _get_affixes(interface: BaseInterface, chalk: Chalk) -> Tuple[str, str]:
+    # interned chalk hash by identity, which is much cheaper than hashing their styles
+    return interface.get_affixes(chalk.style, chalk.background, chalk.foreground)
+
+
+def print(
+    *parts: Any,
+    sep: Optional[str] = " ",
+    end: Optional[str] = "\n",
+    file: Optional[TextIO] = None,
+    flush: bool = False,
+):
+    """Print some values, styling the values given as a pair of chalk and value.
+
+    Args:
+        parts (~typing.Any):
+            The values to print, either plain values or a tuple of a
+            :class:`~.chalk.Chalk` and the value to style with it.
+        sep (Optional[str], optional):
+            The string placed between values.
+            Defaults to a space.
+        end (Optional[str], optional):
+            The string written after the last value.
+            Defaults to a newline.
+        file (Optional[:class:`~typing.TextIO`], optional):
+            The text io buffer to write to.
+            Defaults to :data:`sys.stdout`.
+        flush (bool, optional):
+            If True, will flush the io buffer after writing.
+            Defaults to False.
+    """
+
+    interface = get_interface(file)
+    disabled = is_disabled()
+    separator = " " if sep is None else sep
+
+    pieces: List[str] = []
+    size = 0
+    for part in parts:
+        if type(part) is tuple and len(part) == 2 and isinstance(part[0], Chalk):
+            chalk, value = part
+            value = value if type(value) is str else str(value)
+            size += len(value)
+            if disabled:
+                pieces.append(value)
+            elif "\x1b[" in value:
+                pieces.append(
+                    interface.apply(
+                        value, chalk.style, chalk.background, chalk.foreground
+                    )
+                )
+            else:
+                prefix, suffix = _get_affixes(interface, chalk)
+                pieces += (prefix, value, suffix)
+        else:
+            value = part if type(part) is str else str(part)
+            size += len(value)
+            pieces.append(value)
+        pieces.append(separator)
+
+    # the separator after the last value is replaced by the end
+    ending = "\n" if end is None else end
+    if pieces:
+        pieces[-1] = ending
+    else:
+        pieces.append(ending)
+
+    # the size of the values is already known, so small lines skip checking pieces
+    if size < WRITE_THRESHOLD:
+        interface.write_text("".join(pieces))
+    else:
+        interface.writelines(pieces)
+    if flush:
+        interface.flush()
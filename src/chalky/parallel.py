@@ -0,0 +1,123 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains tools to style large inputs using multiple processes.
+
+Lines are split into chunks that are styled by a pool of workers.
+The styled lines are yielded in their original order and only a bounded number of
+chunks are held in memory at any time:
+
+>>> from chalky import fg
+>>> from chalky.parallel import render_lines
+>>> def rule(line: str) -> str:
+...     return (fg.red | line) if "ERROR" in line else line
+>>> with open("build.log", "r") as log_file:
+...     for line in render_lines(log_file, rule, workers=4):
+...         print(line, end="")
+
+.. important::
+    The given rule function is sent to worker processes so it must be picklable.
+    Define it at the top level of a module rather than using a lambda or closure.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, List, Optional
+
+from .constants import configure, is_disabled
+from .helpers import supports_free_threading
+
+Rule_T = Callable[[str], str]
+
+
+def _initialize_worker(disabled: bool):
+    configure(disable=disabled)
+
+
+def _render_chunk(rule_fn: Rule_T, chunk: List[str]) -> List[str]:
+    return [rule_fn(line) for line in chunk]
+
+
+def _iter_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _build_executor(workers: int) -> Executor:
+    if supports_free_threading():
+        return ThreadPoolExecutor(max_workers=workers)
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(is_disabled(),),
+    )
+
+
+def render_lines(
+    lines: Iterable[str],
+    rule_fn: Rule_T,
+    workers: Optional[int] = None,
+    chunk_size: int = 10_000,
+    prefetch: int = 2,
+) -> Iterator[str]:
+    """Style the given lines in parallel and yield them in their original order.
+
+    A :class:`~concurrent.futures.ProcessPoolExecutor` is used to style the chunks
+    unless the interpreter is a free-threaded build, in which case threads are used.
+
+    Args:
+        lines (Iterable[str]):
+            The lines to style.
+        rule_fn (Callable[[str], str]):
+            The picklable function used to style a single line.
+        workers (Optional[int], optional):
+            The number of workers to style chunks with.
+            Defaults to the number of available CPUs.
+        chunk_size (int, optional):
+            The number of lines sent to a worker at once.
+            Defaults to 10,000.
+        prefetch (int, optional):
+            The number of chunks queued per worker.
+            At most ``workers * prefetch`` chunks are held in memory.
+            Defaults to 2.
+
+    Raises:
+        ValueError:
+            When the given chunk size or prefetch is less than or equal to 0.
+
+    Yields:
+        str:
+            The styled lines in the order they were given.
+    """
+
+    if chunk_size <= 0 or prefetch <= 0:
+        raise ValueError(
+            "Chunk size and prefetch must be positive, "
+            f"received chunk_size={chunk_size}, prefetch={prefetch}"
+        )
+
+    workers = workers or os.cpu_count() or 1
+    chunks = _iter_chunks(lines, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _render_chunk(rule_fn, chunk)
+        return
+
+    pending: Deque[Future] = deque()
+    with _build_executor(workers) as executor:
+        for chunk in chunks:
+            pending.append(executor.submit(_render_chunk, rule_fn, chunk))
+            if len(pending) >= workers * prefetch:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,381 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+r"""Contains an incremental parser for text containing ANSI escape sequences.
+
+The parser accepts arbitrary chunks of text (or bytes) and produces styled text
+segments and control events.
+Escape sequences that are split across chunks are handled transparently:
+
+>>> from chalky.parser import AnsiParser
+>>> parser = AnsiParser()
+>>> [segment.text for segment in parser.feed("plain \x1b[1;3")]
+['plain ']
+>>> [segment.text for segment in parser.feed("1mbold red\x1b[0m")]
+['bold red']
+
+SGR codes are mapped back to :class:`~.style.Style`, :class:`~.color.Color`,
+:class:`~.color.IndexedColor` and :class:`~.color.TrueColor` by inverting the tables of
+:mod:`~.interface.ansi`.
+"""
+
+import codecs
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .chalk import Chalk
+from .color import Color, Color_T, IndexedColor, TrueColor
+from .interface.ansi import (
+    BACKGROUND_COLOR_MAP,
+    BACKGROUND_RESET_CODE,
+    FOREGROUND_COLOR_MAP,
+    FOREGROUND_RESET_CODE,
+    STYLE_CODE_MAP,
+    STYLE_RESET_MAP,
+)
+from .style import Style
+
+FOREGROUND_COLOR_CODES: Dict[int, Color] = {
+    int(code): color for color, code in FOREGROUND_COLOR_MAP.items()
+}
+BACKGROUND_COLOR_CODES: Dict[int, Color] = {
+    int(code): color for color, code in BACKGROUND_COLOR_MAP.items()
+}
+
+STATE_GROUND = 0
+STATE_ESCAPE = 1
+STATE_CSI = 2
+STATE_OSC = 3
+STATE_OSC_ESCAPE = 4
+
+ESC = "\x1b"
+BEL = "\a"
+
+
+class Segment(NamedTuple):
+    """Describes some text and the chalk it is styled with.
+
+    Parameters:
+        text (str):
+            The text of the segment.
+        chalk (:class:`~.chalk.Chalk`):
+            The chalk the text is styled with.
+    """
+
+    text: str
+    chalk: Chalk
+
+
+class Control(NamedTuple):
+    """Describes a non-styling escape sequence.
+
+    Parameters:
+        sequence (str):
+            The full escape sequence.
+        final (str):
+            The final character of the sequence (``]`` for OSC sequences).
+        params (str):
+            The parameters of the sequence.
+    """
+
+    sequence: str
+    final: str
+    params: str
+
+
+Event_T = Union[Segment, Control]
+
+
+def _to_int(value: str) -> int:
+    return int(value) if value.isdigit() else 0
+
+
+def _parse_color(codes: List[str], index: int) -> Tuple[Optional[Color_T], int]:
+    """Parse a semicolon separated extended color following a ``38`` or ``48`` code."""
+
+    mode = codes[index] if index < len(codes) else ""
+    if mode == "5" and index + 1 < len(codes):
+        return _get_indexed_color(_to_int(codes[index + 1])), index + 2
+
+    if mode == "2" and index + 3 < len(codes):
+        return _get_true_color(codes[index + 1 : index + 4]), index + 4
+
+    return None, len(codes)
+
+
+def _parse_subparam_color(subparams: List[str]) -> Optional[Color_T]:
+    """Parse a colon separated extended color such as ``38:2::255:0:0``."""
+
+    mode = subparams[1] if len(subparams) > 1 else ""
+    if mode == "5" and len(subparams) > 2:
+        return _get_indexed_color(_to_int(subparams[2]))
+
+    if mode == "2" and len(subparams) > 4:
+        # the ITU form includes a color space identifier before the components
+        components = subparams[3:6] if len(subparams) > 5 else subparams[2:5]
+        return _get_true_color(components)
+
+    return None
+
+
+def _get_indexed_color(index: int) -> IndexedColor:
+    return IndexedColor(min(index, 255))
+
+
+def _get_true_color(components: List[str]) -> TrueColor:
+    red, green, blue = (min(_to_int(value), 255) for value in components)
+    return TrueColor(red, green, blue)
+
+
+class AnsiParser:
+    """Incrementally parse text containing ANSI escape sequences.
+
+    Parameters:
+        encoding (str, optional):
+            The encoding used to decode chunks given as bytes.
+            Defaults to "utf-8".
+        errors (str, optional):
+            The error handling used to decode chunks given as bytes.
+            Defaults to "replace".
+    """
+
+    def __init__(self, encoding: str = "utf-8", errors: str = "replace"):
+        """Initialize the parser in its default state."""
+
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        self._state = STATE_GROUND
+        self._text: List[str] = []
+        self._sequence: List[str] = []
+
+        self.style: Set[Style] = set()
+        self.foreground: Optional[Color_T] = None
+        self.background: Optional[Color_T] = None
+        self._chalk: Optional[Chalk] = None
+
+    @property
+    def chalk(self) -> Chalk:
+        """The chalk of the currently active styles and colors.
+
+        Returns:
+            :class:`~.chalk.Chalk`:
+                The currently active chalk.
+        """
+
+        if self._chalk is None:
+            self._chalk = Chalk(
+                style=set(self.style),
+                foreground=self.foreground,
+                background=self.background,
+            )
+
+        return self._chalk
+
+    def _flush_text(self, events: List[Event_T]):
+        if self._text:
+            events.append(Segment("".join(self._text), self.chalk))
+            self._text.clear()
+
+    def _set_color(self, code: int, color: Optional[Color_T]):
+        if color is None:
+            return
+
+        if code == 38:
+            self.foreground = color
+        else:
+            self.background = color
+
+    def _apply_sgr(self, params: str):
+        codes = params.split(";") if params else ["0"]
+        index = 0
+        while index < len(codes):
+            code_value = codes[index]
+            index += 1
+
+            if ":" in code_value:
+                subparams = code_value.split(":")
+                code = _to_int(subparams[0])
+                if code in (38, 48):
+                    self._set_color(code, _parse_subparam_color(subparams))
+                    continue
+            else:
+                code = _to_int(code_value)
+
+            if code == 0:
+                self.style.clear()
+                self.foreground = None
+                self.background = None
+            elif code in STYLE_CODE_MAP:
+                self.style.add(STYLE_CODE_MAP[code])
+            elif code in STYLE_RESET_MAP:
+                self.style.difference_update(STYLE_RESET_MAP[code])
+            elif code in FOREGROUND_COLOR_CODES:
+                self.foreground = FOREGROUND_COLOR_CODES[code]
+            elif code in BACKGROUND_COLOR_CODES:
+                self.background = BACKGROUND_COLOR_CODES[code]
+            elif code == FOREGROUND_RESET_CODE:
+                self.foreground = None
+            elif code == BACKGROUND_RESET_CODE:
+                self.background = None
+            elif code in (38, 48):
+                color, index = _parse_color(codes, index)
+                self._set_color(code, color)
+
+        self._chalk = None
+
+    def _finish_csi(self, events: List[Event_T], final: str):
+        params = "".join(self._sequence[2:])
+        self._flush_text(events)
+        if final == "m":
+            self._apply_sgr(params)
+        else:
+            events.append(Control("".join(self._sequence) + final, final, params))
+
+        self._sequence.clear()
+        self._state = STATE_GROUND
+
+    def _finish_osc(self, events: List[Event_T], terminator: str):
+        self._flush_text(events)
+        params = "".join(self._sequence[2:])
+        events.append(Control("".join(self._sequence) + terminator, "]", params))
+        self._sequence.clear()
+        self._state = STATE_GROUND
+
+    def _feed_ground(self, chunk: str, index: int, events: List[Event_T]) -> int:
+        escape = chunk.find(ESC, index)
+        if escape < 0:
+            self._text.append(chunk[index:])
+            return len(chunk)
+
+        if escape > index:
+            self._text.append(chunk[index:escape])
+        self._sequence.append(ESC)
+        self._state = STATE_ESCAPE
+        return escape + 1
+
+    def _feed_escape(self, chunk: str, index: int, events: List[Event_T]) -> int:
+        character = chunk[index]
+        introducer = len(self._sequence) == 1
+        self._sequence.append(character)
+        if "\x20" <= character <= "\x2f":
+            # intermediate characters, such as the "(" of "ESC ( B", precede the final
+            return index + 1
+
+        if introducer and character == "[":
+            self._state = STATE_CSI
+        elif introducer and character == "]":
+            self._state = STATE_OSC
+        else:
+            self._flush_text(events)
+            events.append(Control("".join(self._sequence), character, ""))
+            self._sequence.clear()
+            self._state = STATE_GROUND
+
+        return index + 1
+
+    def _feed_csi(self, chunk: str, index: int, events: List[Event_T]) -> int:
+        start, length = index, len(chunk)
+        while index < length and not ("\x40" <= chunk[index] <= "\x7e"):
+            index += 1
+
+        if index > start:
+            self._sequence.append(chunk[start:index])
+        if index < length:
+            self._finish_csi(events, chunk[index])
+            index += 1
+
+        return index
+
+    def _feed_osc(self, chunk: str, index: int, events: List[Event_T]) -> int:
+        bell = chunk.find(BEL, index)
+        escape = chunk.find(ESC, index)
+        end = min(
+            (position for position in (bell, escape) if position >= 0), default=-1
+        )
+        if end < 0:
+            self._sequence.append(chunk[index:])
+            return len(chunk)
+
+        if end > index:
+            self._sequence.append(chunk[index:end])
+        if chunk[end] == BEL:
+            self._finish_osc(events, BEL)
+        else:
+            self._state = STATE_OSC_ESCAPE
+
+        return end + 1
+
+    def _feed_osc_escape(self, chunk: str, index: int, events: List[Event_T]) -> int:
+        if chunk[index] == "\\":
+            self._finish_osc(events, ESC + "\\")
+            return index + 1
+
+        self._finish_osc(events, "")
+        self._sequence.append(ESC)
+        self._state = STATE_ESCAPE
+        return index
+
+    def feed(self, chunk: Union[str, bytes]) -> List[Event_T]:
+        """Parse the next chunk of text.
+
+        Args:
+            chunk (Union[str, bytes]):
+                The next chunk of text to parse.
+
+        Returns:
+            List[Union[:class:`~.parser.Segment`, :class:`~.parser.Control`]]:
+                The segments and control events completed by the chunk.
+        """
+
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+
+        events: List[Event_T] = []
+        index, length = 0, len(chunk)
+        while index < length:
+            state = self._state
+            if state == STATE_GROUND:
+                index = self._feed_ground(chunk, index, events)
+            elif state == STATE_ESCAPE:
+                index = self._feed_escape(chunk, index, events)
+            elif state == STATE_CSI:
+                index = self._feed_csi(chunk, index, events)
+            elif state == STATE_OSC:
+                index = self._feed_osc(chunk, index, events)
+            else:
+                index = self._feed_osc_escape(chunk, index, events)
+
+        self._flush_text(events)
+        return events
+
+    def close(self) -> List[Event_T]:
+        """Finish parsing, emitting any incomplete escape sequence as text.
+
+        Returns:
+            List[Union[:class:`~.parser.Segment`, :class:`~.parser.Control`]]:
+                The remaining segments.
+        """
+
+        events = self.feed(self._decoder.decode(b"", final=True))
+        if self._sequence:
+            self._text.append("".join(self._sequence))
+            self._sequence.clear()
+            self._state = STATE_GROUND
+            self._flush_text(events)
+
+        return events
+
+
+def parse(value: Union[str, bytes]) -> List[Event_T]:
+    """Parse a complete string containing ANSI escape sequences.
+
+    Args:
+        value (Union[str, bytes]):
+            The string to parse.
+
+    Returns:
+        List[Union[:class:`~.parser.Segment`, :class:`~.parser.Control`]]:
+            The parsed segments and control events.
+    """
+
+    parser = AnsiParser()
+    return parser.feed(value) + parser.close()
@@ -0,0 +1,211 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a table of chalk identified by small integers for sharing across processes.
+
+Chalk already pickle as a single packed integer, a :class:`~.registry.StyleTable`
+goes further by letting processes that share the same table send the index of a
+chalk instead.
+Tables are pickled as the packed integers of their chalk, so a table can be sent to
+each worker once through the ``initializer`` of a process pool.
+Functions run in other processes must be importable, such as from a ``workers``
+module:
+
+.. code-block:: python
+
+    # workers.py
+    from chalky import StyleTable
+
+    table = StyleTable()
+
+    def set_table(shared: StyleTable):
+        global table
+        table = shared
+
+    def render(row):
+        return "".join(table[index] | value for index, value in row)
+
+.. code-block:: python
+
+    from concurrent.futures import ProcessPoolExecutor
+    from chalky import StyleTable, fg, sty
+    import workers
+
+    table = StyleTable([sty.bold & fg.red, fg.green])
+    with ProcessPoolExecutor(initializer=workers.set_table, initargs=(table,)) as pool:
+        lines = list(pool.map(workers.render, [[(0, "FAIL"), (1, " test_parse")]]))
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    overload,
+)
+
+from .chalk import Chalk
+
+
+class StyleTable(Sequence[Chalk]):
+    """Describes a table of chalk where each chalk is identified by its index.
+
+    Parameters:
+        chalks (Iterable[:class:`~.chalk.Chalk`], optional):
+            The chalk to register in order.
+            Defaults to an empty table.
+    """
+
+    def __init__(self, chalks: Iterable[Chalk] = ()):
+        """Initialize the table by registering the given chalk."""
+
+        self._chalks: List[Chalk] = []
+        self._indexes: Dict[Chalk, int] = {}
+        self._lock = threading.Lock()
+        for chalk in chalks:
+            self.register(chalk)
+
+    def register(self, chalk: Chalk) -> int:
+        """Register a chalk, chalk that are already registered keep their index.
+
+        Args:
+            chalk (:class:`~.chalk.Chalk`):
+                The chalk to register.
+
+        Returns:
+            int:
+                The index of the chalk.
+        """
+
+        index = self._indexes.get(chalk)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self._indexes.get(chalk)
+            if index is None:
+                index = len(self._chalks)
+                self._chalks.append(chalk)
+                self._indexes[chalk] = index
+
+        return index
+
+    def index(self, chalk: Any, start: int = 0, stop: Optional[int] = None) -> int:
+        """Get the index of a registered chalk.
+
+        Args:
+            chalk (:class:`~.chalk.Chalk`):
+                The chalk to get the index of.
+            start (int, optional):
+                Ignored, as chalk are only registered once.
+                Defaults to 0.
+            stop (Optional[int], optional):
+                Ignored, as chalk are only registered once.
+                Defaults to None.
+
+        Raises:
+            ValueError:
+                When the chalk is not registered.
+
+        Returns:
+            int:
+                The index of the chalk.
+        """
+
+        index = self._indexes.get(chalk)
+        if index is None:
+            raise ValueError(f"{chalk!r} is not registered")
+
+        return index
+
+    def __contains__(self, chalk: Any) -> bool:
+        """Check if a chalk is registered.
+
+        Args:
+            chalk (:class:`~.chalk.Chalk`):
+                The chalk to check.
+
+        Returns:
+            bool:
+                True if the chalk is registered, otherwise False.
+        """
+
+        return chalk in self._indexes
+
+    @overload
+    def __getitem__(self, index: int) -> Chalk:  # noqa: D105
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Chalk]:  # noqa: D105
+        ...  # pragma: no cover
+
+    def __getitem__(self, index):
+        """Get the chalk of an index.
+
+        Args:
+            index (Union[int, slice]):
+                The index of the chalk.
+
+        Raises:
+            IndexError:
+                When no chalk is registered at the index.
+
+        Returns:
+            Union[:class:`~.chalk.Chalk`, Sequence[:class:`~.chalk.Chalk`]]:
+                The chalk of the index.
+        """
+
+        return self._chalks[index]
+
+    def __iter__(self) -> Iterator[Chalk]:
+        """Iterate over the registered chalk in order.
+
+        Returns:
+            Iterator[:class:`~.chalk.Chalk`]:
+                An iterator over the registered chalk.
+        """
+
+        return iter(self._chalks)
+
+    def __len__(self) -> int:
+        """Get the number of registered chalk.
+
+        Returns:
+            int:
+                The number of registered chalk.
+        """
+
+        return len(self._chalks)
+
+    def __repr__(self) -> str:
+        """Get a short representation of the table.
+
+        Returns:
+            str:
+                The representation of the table.
+        """
+
+        return f"{self.__class__.__name__}({self._chalks!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Reduce the table to the packed integers of its chalk.
+
+        Returns:
+            Tuple[Any, ...]:
+                The callable and arguments that recreate the table.
+        """
+
+        return (_unpack, (tuple(chalk.pack() for chalk in self._chalks),))
+
+
+def _unpack(values: Tuple[int, ...]) -> StyleTable:
+    return StyleTable(Chalk.unpack(value) for value in values)
@@ -0,0 +1,305 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a double-buffered screen that only redraws the cells that changed.
+
+Draw to the screen with :meth:`~.screen.Screen.write` and send the changes to the
+terminal with :meth:`~.screen.Screen.refresh`:
+
+>>> from chalky import fg
+>>> from chalky.screen import Screen
+>>> screen = Screen(80, 24)
+>>> screen.write(0, 0, "Status: ")
+>>> screen.write(8, 0, "OK", fg.green)
+>>> screen.refresh()
+
+Only the cells that differ from what was previously sent to the terminal are redrawn
+on following refreshes.
+"""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .chalk import Chalk
+from .color import Color_T
+from .constants import is_disabled
+from .interface import get_interface
+from .interface.ansi import (
+    AnsiInterface,
+    build_position_cursor,
+    build_reset,
+    get_prefix,
+)
+from .width import get_clusters
+
+StyleKey = Tuple[FrozenSet, Optional[Color_T], Optional[Color_T]]
+
+# Changed cells separated by at most this many unchanged cells are redrawn as one run
+# as rewriting the unchanged cells is cheaper than repositioning the cursor.
+RUN_GAP = 4
+
+
+class Screen:
+    """A front and back grid of cells that are diffed to minimize terminal output.
+
+    Each cell is a single character and the id of the style it is drawn with.
+    Style id ``0`` is reserved for unstyled cells.
+    Wide characters such as CJK ideographs and emoji occupy two cells, the second of
+    which is left empty.
+
+    Parameters:
+        width (int):
+            The number of columns in the screen.
+        height (int):
+            The number of rows in the screen.
+        interface (Optional[:class:`~.interface.ansi.AnsiInterface`], optional):
+            The interface to draw the screen with.
+            Defaults to the interface for :data:`sys.stdout`.
+
+    Raises:
+        ValueError:
+            When either of the given dimensions are less than or equal to 0.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        interface: Optional[AnsiInterface] = None,
+    ):
+        """Initialize the screen with blank front and back grids."""
+
+        if width <= 0 or height <= 0:
+            raise ValueError(
+                f"Screen dimensions must be positive, received {width}x{height}"
+            )
+
+        self.width = width
+        self.height = height
+        self.interface = interface or get_interface()
+
+        self._styles: List[Chalk] = []
+        self._style_ids: Dict[StyleKey, int] = {}
+
+        size = width * height
+        self._back_chars: List[str] = [" "] * size
+        self._back_styles: List[int] = [0] * size
+        self._front_chars: List[Optional[str]] = [None] * size
+        self._front_styles: List[int] = [0] * size
+
+    def get_style_id(self, chalk: Optional[Chalk]) -> int:
+        """Get the id of a given chalk, registering it if it has not been seen yet.
+
+        Args:
+            chalk (Optional[:class:`~.chalk.Chalk`]):
+                The chalk to get the id of.
+
+        Returns:
+            int:
+                The id of the chalk within the screen.
+        """
+
+        if chalk is None:
+            return 0
+
+        key = (frozenset(chalk.style), chalk.foreground, chalk.background)
+        style_id = self._style_ids.get(key)
+        if style_id is None:
+            style_id = self._style_ids[key] = len(self._styles) + 1
+            self._styles.append(chalk)
+
+        return style_id
+
+    def write(self, x: int, y: int, value: str, chalk: Optional[Chalk] = None):
+        """Draw a string into the back grid.
+
+        Characters that fall outside of the screen are clipped, wide characters that
+        are cut by the edges of the screen are replaced by spaces.
+
+        Args:
+            x (int):
+                The starting column of the string (0-indexed).
+            y (int):
+                The row of the string (0-indexed).
+            value (str):
+                The string to draw.
+            chalk (Optional[:class:`~.chalk.Chalk`], optional):
+                The chalk to draw the string with.
+                Defaults to None.
+        """
+
+        if not (0 <= y < self.height) or x >= self.width:
+            return
+
+        if value.isascii():
+            cells = list(value)
+        else:
+            cells = []
+            for cluster, width in get_clusters(value):
+                if width == 0:
+                    # zero width characters are drawn with the preceding character
+                    if cells:
+                        cells[-2 if cells[-1] == "" else -1] += cluster
+                    continue
+
+                cells.append(cluster)
+                if width == 2:
+                    cells.append("")
+
+        if x < 0:
+            cells = cells[-x:]
+            x = 0
+            if cells and cells[0] == "":
+                cells[0] = " "
+
+        limit = self.width - x
+        if len(cells) > limit and cells[limit] == "":
+            cells[limit - 1] = " "
+        cells = cells[:limit]
+        if not cells:
+            return
+
+        start = y * self.width + x
+        end = start + len(cells)
+        row_end = (y + 1) * self.width
+
+        # replace the halves of wide characters that are partially overwritten
+        if start % self.width and self._back_chars[start] == "":
+            self._back_chars[start - 1] = " "
+        if end < row_end and self._back_chars[end] == "":
+            self._back_chars[end] = " "
+
+        self._back_chars[start:end] = cells
+        self._back_styles[start:end] = [self.get_style_id(chalk)] * len(cells)
+
+    def fill(self, chalk: Optional[Chalk] = None, char: str = " "):
+        """Fill the entire back grid with a single character.
+
+        Args:
+            chalk (Optional[:class:`~.chalk.Chalk`], optional):
+                The chalk to fill the grid with.
+                Defaults to None.
+            char (str, optional):
+                The character to fill the grid with.
+                Defaults to a space.
+        """
+
+        size = self.width * self.height
+        self._back_chars[:] = [char] * size
+        self._back_styles[:] = [self.get_style_id(chalk)] * size
+
+    def clear(self):
+        """Clear the back grid to blank unstyled cells."""
+
+        self.fill()
+
+    def invalidate(self):
+        """Forget the state of the front grid so the next refresh redraws every cell."""
+
+        self._front_chars[:] = [None] * (self.width * self.height)
+
+    def _get_prefixes(self, encoding: str) -> List[bytes]:
+        if is_disabled():
+            return [b""] * (len(self._styles) + 1)
+
+        return [b""] + [
+            get_prefix(chalk.style, chalk.background, chalk.foreground).encode(encoding)
+            for chalk in self._styles
+        ]
+
+    def _get_runs(self, start: int, end: int) -> List[Tuple[int, int]]:
+        back_chars, front_chars = self._back_chars, self._front_chars
+        back_styles, front_styles = self._back_styles, self._front_styles
+
+        runs: List[Tuple[int, int]] = []
+        run_start: Optional[int] = None
+        run_end = 0
+        for index in range(start, end):
+            if (
+                back_chars[index] == front_chars[index]
+                and back_styles[index] == front_styles[index]
+            ):
+                continue
+
+            # the second half of a wide character is redrawn with the first half
+            cell = index - 1 if back_chars[index] == "" and index > start else index
+            if run_start is None:
+                run_start = cell
+            elif cell - run_end > RUN_GAP:
+                runs.append((run_start, run_end))
+                run_start = cell
+
+            run_end = index + 1
+
+        if run_start is not None:
+            runs.append((run_start, run_end))
+
+        return runs
+
+    def diff(self) -> bytes:
+        """Build the escape sequences and text to draw the changes of the back grid.
+
+        Returns:
+            bytes:
+                The content to write to the terminal to match the back grid.
+        """
+
+        encoding = self.interface.io.encoding
+        prefixes = self._get_prefixes(encoding)
+        reset = b"" if is_disabled() else build_reset()
+
+        content: List[bytes] = []
+        cursor: Optional[int] = None
+        current_style = 0
+
+        for y in range(self.height):
+            start = y * self.width
+            end = start + self.width
+            if (
+                self._back_chars[start:end] == self._front_chars[start:end]
+                and self._back_styles[start:end] == self._front_styles[start:end]
+            ):
+                continue
+
+            for run_start, run_end in self._get_runs(start, end):
+                if cursor != run_start:
+                    content.append(build_position_cursor(run_start - start + 1, y + 1))
+
+                index = run_start
+                while index < run_end:
+                    style_id = self._back_styles[index]
+                    segment_end = index + 1
+                    while (
+                        segment_end < run_end
+                        and self._back_styles[segment_end] == style_id
+                    ):
+                        segment_end += 1
+
+                    if style_id != current_style:
+                        if current_style != 0:
+                            content.append(reset)
+                        content.append(prefixes[style_id])
+                        current_style = style_id
+
+                    content.append(
+                        "".join(self._back_chars[index:segment_end]).encode(encoding)
+                    )
+                    index = segment_end
+
+                # the cursor position is ambiguous after writing to the last column
+                cursor = run_end if run_end < end else None
+
+        if current_style != 0:
+            content.append(reset)
+
+        return b"".join(content)
+
+    def refresh(self):
+        """Draw the changes of the back grid to the terminal and swap the grids."""
+
+        content = self.diff()
+        if content:
+            self.interface._write(content)
+
+        self._front_chars[:] = self._back_chars
+        self._front_styles[:] = self._back_styles
@@ -4,8 +4,10 @@
 
 """Predefined background (bg) chalk colors."""
 
+from functools import lru_cache
+
 from ..chalk import Chalk
-from ..color import Color
+from ..color import Color, IndexedColor
 
 black = Chalk(background=Color.BLACK)
 red = Chalk(background=Color.RED)
@@ -21,6 +23,26 @@ bright_red = Chalk(background=Color.BRIGHT_RED)
 bright_green = Chalk(background=Color.BRIGHT_GREEN)
 bright_yellow = Chalk(background=Color.BRIGHT_YELLOW)
 bright_blue = Chalk(background=Color.BRIGHT_BLUE)
-bright_magenta = Chalk(background=Color.MAGENTA)
+bright_magenta = Chalk(background=Color.BRIGHT_MAGENTA)
 bright_cyan = Chalk(background=Color.BRIGHT_CYAN)
 bright_white = Chalk(background=Color.BRIGHT_WHITE)
+
+
+@lru_cache(maxsize=256)
+def index(value: int) -> Chalk:
+    """Get the chalk of a background color of the xterm 256 color palette.
+
+    Args:
+        value (int):
+            The index of the color in the palette (0-255).
+
+    Raises:
+        ValueError:
+            If the given index is outside of the palette.
+
+    Returns:
+        :class:`~.chalk.Chalk`:
+            The chalk instance.
+    """
+
+    return Chalk(background=IndexedColor(value))
@@ -0,0 +1,194 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a streaming renderer for tables of styled text.
+
+Rows are rendered one line at a time, cells are padded by their visible width so
+cells that are already styled stay aligned:
+
+>>> from chalky import fg, sty, table
+>>> rows = [("api", fg.green | "up", 12), ("worker", fg.red | "down", 7)]
+>>> for line in table(rows, columns=["name", "status", "jobs"], styles=[sty.bold]):
+...     print(line)
+
+Column widths are computed from the first ``sample`` rows, the remaining rows are
+streamed without being buffered.
+Pass fixed ``widths`` to stream every row immediately:
+
+>>> for line in table(read_rows(), widths=[20, 8, 6], align="<<>"):
+...     print(line)
+
+.. important::
+    Cells wider than their column are not truncated and will push the following
+    columns of that line to the right.
+"""
+
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .chalk import Chalk
+from .constants import is_disabled
+from .interface import get_interface
+from .interface.base import BaseInterface
+from .text import visible_width
+
+ALIGNMENTS = ("<", ">", "^")
+
+
+def _group_columns(rows: Sequence[Sequence[str]]) -> List[List[str]]:
+    columns: List[List[str]] = []
+    for row in rows:
+        for index, value in enumerate(row):
+            if index == len(columns):
+                columns.append([])
+            columns[index].append(value)
+
+    return columns
+
+
+class _Column:
+    """Precompiled styling and alignment of a single table column."""
+
+    def __init__(
+        self,
+        chalk: Optional[Chalk],
+        alignment: str,
+        width: int,
+        interface: BaseInterface,
+    ):
+        self.chalk = chalk
+        self.alignment = alignment
+        self.width = width
+        self.interface = interface
+        self.prefix, self.suffix = chalk.affixes(interface) if chalk else ("", "")
+
+    def render(self, value: str, last: bool = False) -> str:
+        padding = self.width - visible_width(value)
+        if self.prefix:
+            if "\x1b[" in value and self.chalk is not None:
+                value = self.interface.apply(
+                    value,
+                    self.chalk.style,
+                    self.chalk.background,
+                    self.chalk.foreground,
+                )
+            else:
+                value = self.prefix + value + self.suffix
+
+        if padding <= 0:
+            return value
+
+        if self.alignment == ">":
+            return " " * padding + value
+        if self.alignment == "^":
+            left = padding // 2
+            return " " * left + value + ("" if last else " " * (padding - left))
+
+        return value if last else value + " " * padding
+
+
+def table(
+    rows: Iterable[Sequence[Any]],
+    columns: Optional[Sequence[str]] = None,
+    styles: Optional[Sequence[Optional[Chalk]]] = None,
+    widths: Optional[Sequence[int]] = None,
+    align: Optional[Sequence[str]] = None,
+    sample: Optional[int] = 1000,
+    separator: str = "  ",
+    header_style: Optional[Chalk] = None,
+    interface: Optional[BaseInterface] = None,
+) -> Iterator[str]:
+    """Render rows of values as the aligned lines of a table.
+
+    Args:
+        rows (Iterable[Sequence[Any]]):
+            The rows of the table, values are converted with :func:`str`.
+        columns (Optional[Sequence[str]], optional):
+            The headers of the columns.
+            Defaults to no header line.
+        styles (Optional[Sequence[Optional[:class:`~.chalk.Chalk`]]], optional):
+            The chalk to style the cells of each column with.
+            Defaults to no styles.
+        widths (Optional[Sequence[int]], optional):
+            Fixed widths of the columns.
+            Defaults to computing widths from the sampled rows.
+        align (Optional[Sequence[str]], optional):
+            The alignment of each column, one of ``<``, ``>`` or ``^``.
+            Defaults to left aligning all columns.
+        sample (Optional[int], optional):
+            The number of rows used to compute column widths, None uses all rows.
+            Defaults to 1000.
+        separator (str, optional):
+            The string placed between columns.
+            Defaults to two spaces.
+        header_style (Optional[:class:`~.chalk.Chalk`], optional):
+            The chalk to style the headers with.
+            Defaults to None.
+        interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+            The interface to style cells for.
+            Defaults to the interface for :data:`sys.stdout`.
+
+    Raises:
+        ValueError:
+            When an alignment is not one of ``<``, ``>`` or ``^``.
+
+    Yields:
+        str:
+            The lines of the table, without line endings.
+    """
+
+    if align is not None and any(value not in ALIGNMENTS for value in align):
+        raise ValueError(
+            f"Alignments must be one of {ALIGNMENTS!r}, received {align!r}"
+        )
+
+    iterator: Iterator[Tuple[str, ...]] = (tuple(map(str, row)) for row in rows)
+    headers = tuple(columns or ())
+
+    column_widths = list(widths or ())
+    if widths is None:
+        sampled = list(islice(iterator, sample) if sample is not None else iterator)
+        column_widths = [
+            max(map(visible_width, values))
+            for values in _group_columns(([headers] if headers else []) + sampled)
+        ]
+        iterator = chain(sampled, iterator)
+
+    if is_disabled():
+        styles, header_style = None, None
+
+    interface = interface or get_interface()
+
+    def build_column(index: int, chalk: Optional[Chalk]) -> _Column:
+        return _Column(
+            chalk,
+            align[index] if align and index < len(align) else "<",
+            column_widths[index] if index < len(column_widths) else 0,
+            interface,
+        )
+
+    if headers:
+        last = len(headers) - 1
+        yield separator.join(
+            build_column(index, header_style).render(value, index == last)
+            for index, value in enumerate(headers)
+        )
+
+    compiled: List[_Column] = []
+    for row in iterator:
+        count = len(row)
+        for index in range(len(compiled), count):
+            compiled.append(
+                build_column(
+                    index, styles[index] if styles and index < len(styles) else None
+                )
+            )
+
+        last = count - 1
+        yield separator.join(
+            [
+                compiled[index].render(value, index == last)
+                for index, value in enumerate(row)
+            ]
+        )
@@ -0,0 +1,371 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+r"""Contains helpers for measuring and cutting text that may contain ANSI escapes.
+
+>>> from chalky import fg
+>>> from chalky.text import strip, visible_width
+>>> value = fg.red | "error"
+>>> strip(value)
+'error'
+>>> visible_width(value)
+5
+
+Styled text can be wrapped, truncated and sliced by the cells it occupies.
+The styles that are active at a cut are carried over, so every resulting string
+renders correctly on its own:
+
+>>> from chalky.text import slice, truncate, wrap
+>>> wrap(fg.red | "a long error message", 10)
+['\x1b[31ma long\x1b[0m', '\x1b[31merror\x1b[0m', '\x1b[31mmessage\x1b[0m']
+>>> truncate(fg.red | "a long error message", 10)
+'\x1b[31ma long er…\x1b[0m'
+>>> slice(fg.red | "a long error message", 2, 6)
+'\x1b[31mlong\x1b[0m'
+
+Each of these scans the text once and escape sequences are never split apart.
+Like :func:`chalky.print`, :func:`~.text.slice` is available as ``chalky.slice`` but
+is left out of ``from chalky import *`` so it never shadows the builtin.
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+from .chalk import Chalk
+from .interface._sequences import RESET
+from .interface.ansi import get_prefix
+from .parser import AnsiParser
+from .width import cell_width, get_clusters
+
+ESCAPE_PATTERN = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)?|[0-~])"
+)
+
+DEFAULT_CHALK = Chalk()
+
+
+def strip(value: str) -> str:
+    """Remove all ANSI escape sequences from a string.
+
+    Args:
+        value (str):
+            The string to remove escape sequences from.
+
+    Returns:
+        str:
+            The string without any escape sequences.
+    """
+
+    if "\x1b" not in value:
+        return value
+
+    return ESCAPE_PATTERN.sub("", value)
+
+
+def visible_width(value: str) -> int:
+    """Get the number of columns a string occupies when displayed.
+
+    Escape sequences do not occupy any columns, wide characters such as CJK
+    ideographs and emoji occupy two columns.
+
+    Args:
+        value (str):
+            The string to measure.
+
+    Returns:
+        int:
+            The number of columns the string occupies.
+    """
+
+    return cell_width(strip(value))
+
+
+def _iter_text(value: str) -> Iterator[Tuple[str, int]]:
+    if value.isascii():
+        for character in value:
+            yield character, 1
+    else:
+        yield from get_clusters(value)
+
+
+def _iter_cells(value: str) -> Iterator[Tuple[str, int]]:
+    """Iterate over the clusters and escape sequences of a string.
+
+    Escape sequences are given a width of ``-1``.
+    """
+
+    position = 0
+    for match in ESCAPE_PATTERN.finditer(value):
+        if match.start() > position:
+            yield from _iter_text(value[position : match.start()])
+        yield match.group(0), -1
+        position = match.end()
+
+    if position < len(value):
+        yield from _iter_text(value[position:])
+
+
+def _update_state(parser: AnsiParser, sequence: str):
+    if sequence.startswith("\x1b[") and sequence.endswith("m"):
+        parser.feed(sequence)
+
+
+def _get_prefix(chalk: Chalk) -> str:
+    if chalk is DEFAULT_CHALK:
+        return ""
+
+    return get_prefix(chalk.style, chalk.background, chalk.foreground)
+
+
+def _get_suffix(chalk: Chalk) -> str:
+    return "" if chalk is DEFAULT_CHALK else RESET
+
+
+def slice(value: str, start: int = 0, stop: Optional[int] = None) -> str:
+    """Get the part of a string displayed within a range of columns.
+
+    Wide characters that are cut by the range are replaced by spaces.
+
+    Args:
+        value (str):
+            The string to slice.
+        start (int, optional):
+            The first column to include.
+            Defaults to 0.
+        stop (Optional[int], optional):
+            The column to stop before, None includes all remaining columns.
+            Defaults to None.
+
+    Raises:
+        ValueError:
+            When either of the given columns are negative.
+
+    Returns:
+        str:
+            The part of the string displayed within the columns.
+    """
+
+    if start < 0 or (stop is not None and stop < 0):
+        raise ValueError(f"Columns must not be negative, received {start}:{stop}")
+
+    if value.isascii() and "\x1b" not in value:
+        return value[start:stop]
+
+    parser = AnsiParser()
+    content: List[str] = []
+    started = False
+    position = 0
+    for token, width in _iter_cells(value):
+        if width < 0:
+            if stop is not None and position >= stop:
+                break
+
+            _update_state(parser, token)
+            if started:
+                content.append(token)
+            continue
+
+        end = position + width
+        if stop is not None and end > stop:
+            if started and position < stop:
+                content.append(" " * (stop - position))
+            break
+
+        if end > start or (width == 0 and position >= start):
+            if not started:
+                content.append(_get_prefix(parser.chalk))
+                started = True
+            content.append(token if position >= start else " " * (end - start))
+
+        position = end
+
+    if started:
+        content.append(_get_suffix(parser.chalk))
+
+    return "".join(content)
+
+
+def truncate(value: str, width: int, ellipsis: str = "…") -> str:
+    """Truncate a string to be displayed within a number of columns.
+
+    The ellipsis is styled like the text it follows.
+
+    Args:
+        value (str):
+            The string to truncate.
+        width (int):
+            The maximum number of columns to display the string in.
+        ellipsis (str, optional):
+            The string to end truncated strings with.
+            Defaults to "…".
+
+    Raises:
+        ValueError:
+            When the width is less than the width of the ellipsis.
+
+    Returns:
+        str:
+            The given string if it fits within the width, otherwise the truncated
+            string ending with the ellipsis.
+    """
+
+    limit = width - cell_width(ellipsis)
+    if limit < 0:
+        raise ValueError(f"Width {width} is too small to fit ellipsis {ellipsis!r}")
+
+    if value.isascii() and "\x1b" not in value:
+        return value if len(value) <= width else value[:limit] + ellipsis
+
+    parser = AnsiParser()
+    content: List[str] = []
+    position = 0
+    cut: Optional[Tuple[int, Chalk]] = None
+    for token, token_width in _iter_cells(value):
+        if token_width < 0:
+            _update_state(parser, token)
+            content.append(token)
+            continue
+
+        end = position + token_width
+        if cut is None and end > limit:
+            cut = (len(content), parser.chalk)
+        if end > width and cut is not None:
+            index, chalk = cut
+            return "".join(content[:index]) + ellipsis + _get_suffix(chalk)
+
+        content.append(token)
+        position = end
+
+    return value
+
+
+def wrap(value: str, width: int) -> List[str]:
+    """Wrap a string into lines displayed within a number of columns.
+
+    Lines are broken at the last space that fits, the space is removed.
+    Words wider than the width are broken at the width and newlines always start a
+    new line.
+
+    Args:
+        value (str):
+            The string to wrap.
+        width (int):
+            The maximum number of columns of each line.
+
+    Raises:
+        ValueError:
+            When the width is less than 1.
+
+    Returns:
+        List[str]:
+            The wrapped lines, without line endings.
+    """
+
+    if width < 1:
+        raise ValueError(f"Width must be positive, received {width}")
+
+    wrapper = _LineWrapper(width)
+    for token, token_width in _iter_cells(value):
+        wrapper.feed(token, token_width)
+
+    return wrapper.finish()
+
+
+class _LineWrapper:
+    """Describes the state of wrapping a string into lines.
+
+    Parameters:
+        width (int):
+            The maximum number of columns of each line.
+    """
+
+    def __init__(self, width: int):
+        """Initialize the wrapper with a single empty line."""
+
+        self.width = width
+        self.parser = AnsiParser()
+        self.lines: List[str] = []
+        self.line: List[str] = []
+        self.line_width = 0
+        # the index, column and chalk of the start of the last run of spaces
+        self.space: Optional[Tuple[int, int, Chalk]] = None
+        self.after_space = False
+        # spaces at the start of a line that was broken are dropped
+        self.broken = False
+
+    def feed(self, token: str, token_width: int):
+        """Add a token of the string to the lines.
+
+        Args:
+            token (str):
+                The grapheme cluster or escape sequence to add.
+            token_width (int):
+                The number of columns of the token, negative for escape sequences.
+        """
+
+        if token_width < 0:
+            _update_state(self.parser, token)
+            self.line.append(token)
+            return
+
+        if token == " " and self.broken and self.line_width == 0:
+            return
+
+        if token == "\n" or (token == " " and self.line_width + 1 > self.width):
+            self._end_line(token)
+            return
+
+        if self.line_width + token_width > self.width and self.line_width > 0:
+            self._break_line(token_width)
+
+        if token == " ":
+            if not self.after_space:
+                self.space = (len(self.line), self.line_width, self.parser.chalk)
+            self.after_space = True
+        else:
+            self.after_space = False
+
+        self.line.append(token)
+        self.line_width += token_width
+
+    def finish(self) -> List[str]:
+        """End the last line.
+
+        Returns:
+            List[str]:
+                The wrapped lines, without line endings.
+        """
+
+        self._append(self.line, self.parser.chalk)
+        return self.lines
+
+    def _append(self, content: List[str], chalk: Chalk):
+        self.lines.append("".join(content) + _get_suffix(chalk))
+
+    def _end_line(self, token: str):
+        if token == "\n" and self.broken and self.line_width == 0:
+            pass  # the line only held the spaces of the preceding break
+        elif token == "\n" or self.space is None or not self.after_space:
+            self._append(self.line, self.parser.chalk)
+        elif self.space[1] > 0:
+            self._append(self.line[: self.space[0]], self.space[2])
+
+        self.line, self.line_width = [_get_prefix(self.parser.chalk)], 0
+        self.space, self.after_space, self.broken = None, False, token == " "
+
+    def _break_line(self, token_width: int):
+        if self.space is not None:
+            index, space_width, chalk = self.space
+            if space_width > 0:
+                self._append(self.line[:index], chalk)
+            rest = [piece for piece in self.line[index:] if piece != " "]
+            self.line_width -= space_width + len(self.line) - index - len(rest)
+            self.line = [_get_prefix(chalk)] + rest
+            self.space = None
+
+        if self.line_width + token_width > self.width and self.line_width > 0:
+            self._append(self.line, self.parser.chalk)
+            self.line, self.line_width = [_get_prefix(self.parser.chalk)], 0
+            self.space = None
+        self.broken = True
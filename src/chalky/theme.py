@@ -0,0 +1,318 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains themes mapping semantic names to precompiled styles.
+
+Themes are usually loaded from a TOML file mapping names to descriptions accepted by
+:meth:`~.chalk.Chalk.from_string`, tables are flattened into dotted names:
+
+.. code-block:: toml
+
+    error = "bold red"
+    warning = "yellow"
+
+    [log]
+    key = "cyan"
+    value = "bright_white on #202020"
+
+>>> from chalky import Theme
+>>> theme = Theme.load("theme.toml")
+>>> print(theme["error"] | "failed to connect")
+>>> print(theme["log.key"] | "host", theme["log.value"] | "localhost")
+
+Every entry is compiled to its escape sequences once, so looking up and applying a
+style is a dictionary lookup and a string concatenation.
+Themes loaded from a file check the modification time of the file at most once every
+``interval`` seconds and are reloaded when the file changes.
+Readers never wait for a reload, they keep using the previous styles until the new
+styles are swapped in.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Union
+
+from .chalk import Chalk
+from .constants import is_disabled
+from .interface import get_interface
+from .interface.base import BaseInterface
+
+try:
+    from tomllib import loads as load_toml
+except ImportError:  # pragma: no cover
+    try:
+        from toml import loads as load_toml  # type: ignore
+    except ImportError:
+        load_toml = None  # type: ignore
+
+
+class ThemeStyle:
+    """Describes a theme entry compiled to the affixes of its chalk.
+
+    Parameters:
+        chalk (:class:`~.chalk.Chalk`):
+            The chalk of the entry.
+        interface (:class:`~.interface.base.BaseInterface`):
+            The interface to compile the affixes for.
+    """
+
+    __slots__ = ("chalk", "interface", "prefix", "suffix")
+
+    def __init__(self, chalk: Chalk, interface: BaseInterface):
+        """Initialize the style by building the affixes of the chalk."""
+
+        self.chalk = chalk
+        self.interface = interface
+        self.prefix, self.suffix = interface.get_affixes(
+            style=chalk.style,
+            background=chalk.background,
+            foreground=chalk.foreground,
+        )
+
+    def __repr__(self) -> str:
+        """Get a short representation of the style.
+
+        Returns:
+            str:
+                The representation of the style.
+        """
+
+        return f"{self.__class__.__name__}({self.chalk!r})"
+
+    def __or__(self, value: Any) -> str:
+        """Style some given value with the compiled affixes.
+
+        Args:
+            value (~typing.Any):
+                The value to style, converted with :func:`str`.
+
+        Returns:
+            str:
+                The newly styled string.
+        """
+
+        value = str(value)
+        if is_disabled() or not self.prefix:
+            return value
+
+        if "\x1b[" in value:
+            # nested styles need the outer style restored after their resets
+            return self.interface.apply(
+                value, self.chalk.style, self.chalk.background, self.chalk.foreground
+            )
+
+        return self.prefix + value + self.suffix
+
+    def __call__(self, value: Any) -> str:
+        """Handle applying the style to strings.
+
+        Args:
+            value (~typing.Any):
+                The value to style.
+
+        Returns:
+            str:
+                The newly styled string.
+        """
+
+        return self | value
+
+
+def _flatten(entries: Mapping[str, Any], prefix: str = "") -> Iterator[Tuple[str, str]]:
+    for name, value in entries.items():
+        if isinstance(value, Mapping):
+            yield from _flatten(value, f"{prefix}{name}.")
+        elif isinstance(value, str):
+            yield f"{prefix}{name}", value
+        else:
+            raise ValueError(f"Theme entry {prefix}{name} is not a string or table")
+
+
+def compile_theme(
+    entries: Mapping[str, Any], interface: BaseInterface
+) -> Dict[str, ThemeStyle]:
+    """Compile the descriptions of theme entries to styles.
+
+    Args:
+        entries (Mapping[str, ~typing.Any]):
+            The descriptions of the entries, nested mappings are flattened into
+            dotted names.
+        interface (:class:`~.interface.base.BaseInterface`):
+            The interface to compile the styles for.
+
+    Raises:
+        ValueError:
+            When an entry is not a string or contains an unknown style or color.
+
+    Returns:
+        Dict[str, :class:`~.theme.ThemeStyle`]:
+            The compiled styles keyed by their name.
+    """
+
+    return {
+        name: ThemeStyle(Chalk.from_string(spec), interface)
+        for name, spec in _flatten(entries)
+    }
+
+
+class Theme(Mapping[str, ThemeStyle]):
+    """Describes a mapping of semantic names to precompiled styles.
+
+    Parameters:
+        entries (Mapping[str, ~typing.Any]):
+            The descriptions of the entries, nested mappings are flattened into
+            dotted names.
+        interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+            The interface to compile styles for.
+            Defaults to the interface for :data:`sys.stdout`.
+
+    Raises:
+        ValueError:
+            When an entry is not a string or contains an unknown style or color.
+    """
+
+    def __init__(
+        self,
+        entries: Mapping[str, Any],
+        interface: Optional[BaseInterface] = None,
+    ):
+        """Initialize the theme by compiling all of its entries."""
+
+        self.interface = interface or get_interface()
+        self.path: Optional[Path] = None
+        self.interval = 0.0
+
+        self._styles = compile_theme(entries, self.interface)
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        interval: float = 1.0,
+        interface: Optional[BaseInterface] = None,
+    ) -> Theme:
+        """Load a theme from a TOML file that is reloaded when it changes.
+
+        Args:
+            path (Union[str, :class:`~pathlib.Path`]):
+                The path of the TOML theme file.
+            interval (float, optional):
+                The minimum number of seconds between checks of the modification
+                time of the file.
+                Defaults to 1.0.
+            interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+                The interface to compile styles for.
+                Defaults to the interface for :data:`sys.stdout`.
+
+        Raises:
+            ImportError:
+                When no TOML parser is available, Python versions before 3.11
+                require the ``theme`` extra (``pip install chalky[theme]``).
+            ValueError:
+                When an entry is not a string or contains an unknown style or color.
+
+        Returns:
+            :class:`~.theme.Theme`:
+                The loaded theme.
+        """
+
+        path = Path(path)
+        mtime, entries = cls._read(path)
+        theme = cls(entries, interface=interface)
+        theme.path = path
+        theme.interval = interval
+        theme._mtime = mtime
+        theme._checked_at = time.monotonic()
+        return theme
+
+    @staticmethod
+    def _read(path: Path) -> Tuple[int, Dict[str, Any]]:
+        if load_toml is None:  # pragma: no cover
+            raise ImportError(
+                "Loading themes requires toml, install it with `pip install "
+                "chalky[theme]`"
+            )
+
+        # the modification time is read first so a change during the read is reloaded
+        mtime = path.stat().st_mtime_ns
+        return mtime, load_toml(path.read_text("utf-8"))
+
+    def reload(self) -> bool:
+        """Reload the theme file if it changed since it was last loaded.
+
+        The new styles are compiled before being swapped in with a single assignment,
+        so lookups from other threads never observe a partially loaded theme.
+        If another thread is already reloading, this returns immediately.
+        A file that fails to load keeps the previous styles and is retried on the
+        next check.
+
+        Returns:
+            bool:
+                True if the theme was reloaded, otherwise False.
+        """
+
+        if self.path is None or not self._reload_lock.acquire(blocking=False):
+            return False
+
+        try:
+            self._checked_at = time.monotonic()
+            if self.path.stat().st_mtime_ns == self._mtime:
+                return False
+
+            mtime, entries = self._read(self.path)
+            self._styles = compile_theme(entries, self.interface)
+            self._mtime = mtime
+            return True
+        except (OSError, ValueError):
+            return False
+        finally:
+            self._reload_lock.release()
+
+    def __getitem__(self, name: str) -> ThemeStyle:
+        """Get the style of a given name.
+
+        Args:
+            name (str):
+                The name of the style.
+
+        Raises:
+            KeyError:
+                When the theme has no style of the given name.
+
+        Returns:
+            :class:`~.theme.ThemeStyle`:
+                The compiled style.
+        """
+
+        if self.path is not None:
+            if time.monotonic() - self._checked_at >= self.interval:
+                self.reload()
+
+        return self._styles[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the styles.
+
+        Returns:
+            Iterator[str]:
+                An iterator over the names of the styles.
+        """
+
+        return iter(self._styles)
+
+    def __len__(self) -> int:
+        """Get the number of styles in the theme.
+
+        Returns:
+            int:
+                The number of styles.
+        """
+
+        return len(self._styles)
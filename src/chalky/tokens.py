@@ -0,0 +1,201 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains a renderer for streams of typed tokens, such as syntax highlighted code.
+
+Token types are either dotted strings (``"name.function"``) or tuples of names, such
+as the token types of `Pygments <https://pygments.org>`_.
+A token type inherits the styles of its parent types, the styles of the more
+specific types are composed over the styles of their parents:
+
+>>> from chalky import fg, render_tokens, sty
+>>> style_map = {"keyword": fg.magenta, "name": fg.blue, "name.function": sty.bold}
+>>> tokens = [("keyword", "def"), ("text", " "), ("name.function", "main")]
+>>> print(render_tokens(tokens, style_map))
+
+The affixes of every token type are resolved once and adjacent tokens that share a
+style are written within a single pair of affixes.
+Use a :class:`~.tokens.TokenRenderer` to keep the resolved affixes between renders.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .chalk import Chalk
+from .constants import is_disabled
+from .interface import get_interface
+from .interface.base import BaseInterface
+
+TokenType_T = Hashable
+Token_T = Tuple[TokenType_T, str]
+StyleMap_T = Mapping[TokenType_T, Union[Chalk, str]]
+
+Affixes_T = Tuple[str, str]
+NO_AFFIXES: Affixes_T = ("", "")
+
+
+def get_token_parts(token_type: TokenType_T) -> Tuple[str, ...]:
+    """Get the names of a token type from the most general to the most specific.
+
+    Args:
+        token_type (~typing.Hashable):
+            The token type, either a dotted string or a tuple of names.
+
+    Returns:
+        Tuple[str, ...]:
+            The names of the token type.
+    """
+
+    if isinstance(token_type, str):
+        return tuple(part for part in token_type.split(".") if part)
+
+    return tuple(token_type)  # type: ignore
+
+
+class TokenRenderer:
+    """Renders tokens with the affixes of their precompiled token type styles.
+
+    Parameters:
+        style_map (Mapping[~typing.Hashable, Union[:class:`~.chalk.Chalk`, str]]):
+            The chalk (or description of the chalk) of token types.
+        interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+            The interface to render tokens for.
+            Defaults to the interface for :data:`sys.stdout`.
+
+    Raises:
+        ValueError:
+            When a description of a chalk contains an unknown style or color.
+    """
+
+    def __init__(
+        self,
+        style_map: StyleMap_T,
+        interface: Optional[BaseInterface] = None,
+    ):
+        """Initialize the renderer by compiling the styles of the style map."""
+
+        self.interface = interface or get_interface()
+        self._styles: Dict[Tuple[str, ...], Chalk] = {
+            get_token_parts(token_type): (
+                Chalk.from_string(chalk) if isinstance(chalk, str) else chalk
+            )
+            for token_type, chalk in style_map.items()
+        }
+        self._affixes: Dict[TokenType_T, Affixes_T] = {}
+        self._chalk_affixes: Dict[Chalk, Affixes_T] = {}
+
+    def get_chalk(self, token_type: TokenType_T) -> Optional[Chalk]:
+        """Get the chalk of a token type, composed with the chalk of its parents.
+
+        Args:
+            token_type (~typing.Hashable):
+                The token type to get the chalk of.
+
+        Returns:
+            Optional[:class:`~.chalk.Chalk`]:
+                The chalk of the token type, None if neither the token type nor any
+                of its parents are styled.
+        """
+
+        parts = get_token_parts(token_type)
+        chalk: Optional[Chalk] = None
+        for index in range(len(parts) + 1):
+            parent_chalk = self._styles.get(parts[:index])
+            if parent_chalk is not None:
+                chalk = parent_chalk if chalk is None else chalk & parent_chalk
+
+        return chalk
+
+    def get_affixes(self, token_type: TokenType_T) -> Affixes_T:
+        """Get the prefix and suffix to place around tokens of a token type.
+
+        Token types that resolve to the same chalk share the same affixes instance.
+
+        Args:
+            token_type (~typing.Hashable):
+                The token type to get the affixes of.
+
+        Returns:
+            Tuple[str, str]:
+                The prefix and suffix of the token type.
+        """
+
+        affixes = self._affixes.get(token_type)
+        if affixes is None:
+            chalk = self.get_chalk(token_type)
+            affixes = NO_AFFIXES
+            if chalk is not None:
+                affixes = self._chalk_affixes.get(chalk, NO_AFFIXES)
+                if affixes is NO_AFFIXES:
+                    prefix, suffix = self.interface.get_affixes(
+                        style=chalk.style,
+                        background=chalk.background,
+                        foreground=chalk.foreground,
+                    )
+                    if prefix or suffix:
+                        affixes = self._chalk_affixes[chalk] = (prefix, suffix)
+
+            self._affixes[token_type] = affixes
+
+        return affixes
+
+    def render(self, tokens: Iterable[Token_T]) -> str:
+        """Render a stream of tokens.
+
+        Args:
+            tokens (Iterable[Tuple[~typing.Hashable, str]]):
+                The token types and text of the tokens.
+
+        Returns:
+            str:
+                The styled text of the tokens.
+        """
+
+        if is_disabled():
+            return "".join(text for _, text in tokens)
+
+        get_affixes = self._affixes.get
+        content: List[str] = []
+        append = content.append
+        current = NO_AFFIXES
+        for token_type, text in tokens:
+            if not text:
+                continue
+
+            affixes = get_affixes(token_type) or self.get_affixes(token_type)
+            if affixes is not current:
+                append(current[1])
+                append(affixes[0])
+                current = affixes
+            append(text)
+
+        append(current[1])
+        return "".join(content)
+
+
+def render_tokens(
+    tokens: Iterable[Token_T],
+    style_map: StyleMap_T,
+    interface: Optional[BaseInterface] = None,
+) -> str:
+    """Render a stream of tokens with the styles of their token types.
+
+    Args:
+        tokens (Iterable[Tuple[~typing.Hashable, str]]):
+            The token types and text of the tokens.
+        style_map (Mapping[~typing.Hashable, Union[:class:`~.chalk.Chalk`, str]]):
+            The chalk (or description of the chalk) of token types.
+        interface (Optional[:class:`~.interface.base.BaseInterface`], optional):
+            The interface to render tokens for.
+            Defaults to the interface for :data:`sys.stdout`.
+
+    Raises:
+        ValueError:
+            When a description of a chalk contains an unknown style or color.
+
+    Returns:
+        str:
+            The styled text of the tokens.
+    """
+
+    return TokenRenderer(style_map, interface=interface).render(tokens)
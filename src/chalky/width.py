@@ -0,0 +1,132 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains helpers for measuring the number of terminal cells text occupies.
+
+East Asian wide characters and emoji occupy two cells, combining marks and other
+zero width characters occupy none:
+
+>>> from chalky.width import cell_width
+>>> cell_width("chalky")
+6
+>>> cell_width("漢字")
+4
+>>> cell_width("👩‍💻")
+2
+
+Widths are looked up in the ranges of :mod:`~._width_table`, which is generated from
+the Unicode database by ``invoke codegen.generate``.
+ASCII strings are measured by their length and the widths of repeated strings are
+cached, so measuring every cell of a table or screen is cheap.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Tuple
+
+from ._width_table import ENDS, STARTS, WIDTHS
+
+ZERO_WIDTH_JOINER = 0x200D
+VARIATION_SELECTOR_16 = 0xFE0F
+EMOJI_MODIFIERS = range(0x1F3FB, 0x1F400)
+REGIONAL_INDICATORS = range(0x1F1E6, 0x1F200)
+
+
+def get_codepoint_width(codepoint: int) -> int:
+    """Get the number of cells a single codepoint occupies.
+
+    Args:
+        codepoint (int):
+            The codepoint to measure.
+
+    Returns:
+        int:
+            The number of cells the codepoint occupies (0-2).
+    """
+
+    if 0x20 <= codepoint < 0x7F:
+        return 1
+
+    index = bisect_right(STARTS, codepoint) - 1
+    if index >= 0 and codepoint <= ENDS[index]:
+        return WIDTHS[index]
+
+    return 1
+
+
+def get_clusters(value: str) -> List[Tuple[str, int]]:
+    """Split a string into the grapheme clusters drawn in terminal cells.
+
+    Zero width characters are kept with the cluster they follow.
+    Emoji joined by a zero width joiner, emoji followed by a skin tone modifier and
+    pairs of regional indicators (flags) are kept as a single cluster.
+
+    Args:
+        value (str):
+            The string to split.
+
+    Returns:
+        List[Tuple[str, int]]:
+            The clusters of the string and the number of cells each occupies.
+    """
+
+    clusters: List[Tuple[str, int]] = []
+    joined = False
+    regional = False
+    for character in value:
+        codepoint = ord(character)
+        if clusters:
+            cluster, width = clusters[-1]
+            if (
+                joined
+                or codepoint == ZERO_WIDTH_JOINER
+                or (codepoint in EMOJI_MODIFIERS and width == 2)
+                or (regional and codepoint in REGIONAL_INDICATORS)
+            ):
+                clusters[-1] = (cluster + character, width)
+                joined = codepoint == ZERO_WIDTH_JOINER
+                regional = False
+                continue
+
+            if codepoint == VARIATION_SELECTOR_16:
+                # emoji presentation turns narrow symbols such as ❤ into emoji
+                clusters[-1] = (cluster + character, 2)
+                continue
+
+        width = get_codepoint_width(codepoint)
+        if codepoint in REGIONAL_INDICATORS:
+            width, regional = 2, True
+        elif width == 0 and clusters:
+            cluster, previous = clusters[-1]
+            clusters[-1] = (cluster + character, previous)
+            continue
+        else:
+            regional = False
+
+        clusters.append((character, width))
+
+    return clusters
+
+
+@lru_cache(maxsize=4096)
+def _measure(value: str) -> int:
+    return sum(width for _, width in get_clusters(value))
+
+
+def cell_width(value: str) -> int:
+    """Get the number of terminal cells a string occupies.
+
+    Args:
+        value (str):
+            The string to measure, should not contain escape sequences.
+
+    Returns:
+        int:
+            The number of cells the string occupies.
+    """
+
+    if value.isascii():
+        return len(value)
+
+    return _measure(value)
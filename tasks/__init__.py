@@ -9,7 +9,7 @@ import pathlib
 import invoke
 import toml
 
-from . import docs, linter, package
+from . import codegen, docs, linter, package
 from .utils import report
 
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
@@ -82,7 +82,9 @@ def lint(ctx):
     report.success(ctx, "lint", "linting project")
 
 
-namespace = invoke.Collection(build, clean, test, lint, docs, package, profile, linter)
+namespace = invoke.Collection(
+    build, clean, test, lint, codegen, docs, package, profile, linter
+)
 namespace.configure(
     {
         "metadata": metadata,
@@ -0,0 +1,248 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://opensource.org/licenses/isc>
+
+"""Contains Invoke task functions for generating source modules."""
+
+import importlib
+import pathlib
+import sys
+import unicodedata
+
+import invoke
+
+from .utils import report
+
+SEQUENCES_PATH = pathlib.Path("interface", "_sequences.py")
+WIDTH_TABLE_PATH = pathlib.Path("_width_table.py")
+
+SEQUENCES_TEMPLATE = '''# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains precomputed escape sequences for named colors, indexed colors and styles.
+
+.. important::
+    This module is generated from the maps in :mod:`~.interface.ansi` by running
+    ``invoke codegen.generate``, do not edit it by hand.
+"""
+
+from typing import Dict, Tuple
+
+from ..color import Color
+from ..style import Style
+
+{tables}
+'''
+
+WIDTH_TABLE_TEMPLATE = '''# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""Contains the ranges of non-ASCII characters that do not occupy a single cell.
+
+.. important::
+    This module is generated from :mod:`unicodedata` by running
+    ``invoke codegen.generate``, do not edit it by hand.
+"""
+
+from typing import Tuple
+
+UNICODE_VERSION = "{version}"
+
+{tables}
+'''
+
+# unassigned codepoints in the ideographic planes default to wide
+WIDE_PLANES = range(0x20000, 0x40000)
+ZERO_WIDTH_CATEGORIES = ("Mn", "Me", "Cf", "Cc")
+# hangul medial vowels and final consonants combine with the preceding jamo
+HANGUL_JAMO = range(0x1160, 0x1200)
+SOFT_HYPHEN = 0xAD
+ZERO_WIDTH_SPACE = 0x200B
+
+
+def _import_package(ctx):
+    source_dir = ctx.package.directory.parent.as_posix()
+    if source_dir not in sys.path:
+        sys.path.insert(0, source_dir)
+
+    return (
+        importlib.import_module(f"{ctx.package.name}.interface.ansi"),
+        importlib.import_module(ctx.package.name),
+    )
+
+
+def _render_literal(value):
+    return '"' + value.replace("\x1b", "\\x1b") + '"'
+
+
+def _render_table(name, key_type, value_type, entries):
+    lines = [f"{name}: Dict[{key_type}, {value_type}] = {{"]
+    for key, value in entries:
+        literal = _render_literal(value)
+        if value_type == "bytes":
+            literal = "b" + literal
+        lines.append(f"    {key_type}.{key.name}: {literal},")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def render_sequences(ansi):
+    """Render the precomputed sequences module from the maps of the ANSI interface."""
+
+    tables = []
+    for name, key_type, source in (
+        ("FOREGROUND", "Color", ansi.FOREGROUND_COLOR_MAP),
+        ("BACKGROUND", "Color", ansi.BACKGROUND_COLOR_MAP),
+        ("STYLE", "Style", ansi.STYLE_MAP),
+    ):
+        entries = [
+            (key, ansi.build_escape_sequence(code).decode("ascii"))
+            for key, code in source.items()
+        ]
+        for suffix, value_type in (("PREFIXES", "str"), ("PREFIX_BYTES", "bytes")):
+            tables.append(
+                _render_table(f"{name}_{suffix}", key_type, value_type, entries)
+            )
+
+    for name, background in (("FOREGROUND", False), ("BACKGROUND", True)):
+        sequences = [
+            ansi.build_escape_sequence(
+                ansi.get_color_code(ansi.IndexedColor(index), background=background)
+            ).decode("ascii")
+            for index in range(256)
+        ]
+        tables.append(
+            _render_tuple(
+                f"INDEXED_{name}_PREFIXES",
+                [_render_literal(sequence) for sequence in sequences],
+                4,
+                value_type="str",
+            )
+        )
+        tables.append(
+            _render_tuple(
+                f"INDEXED_{name}_PREFIX_BYTES",
+                ["b" + _render_literal(sequence) for sequence in sequences],
+                4,
+                value_type="bytes",
+            )
+        )
+
+    reset = ansi.build_escape_sequence(ansi.STYLE_MAP[ansi.Style.RESET])
+    tables.append(f"RESET = {_render_literal(reset.decode('ascii'))}")
+    tables.append(f"RESET_BYTES = b{_render_literal(reset.decode('ascii'))}")
+    return SEQUENCES_TEMPLATE.format(tables="\n\n".join(tables))
+
+
+def get_character_width(codepoint):
+    """Get the number of cells a single codepoint occupies in a terminal."""
+
+    character = chr(codepoint)
+    category = unicodedata.category(character)
+    if codepoint == SOFT_HYPHEN:
+        return 1
+    if (
+        category in ZERO_WIDTH_CATEGORIES
+        or codepoint in HANGUL_JAMO
+        or codepoint == ZERO_WIDTH_SPACE
+    ):
+        return 0
+    if category == "Cn":
+        return 2 if codepoint in WIDE_PLANES else 1
+    if unicodedata.east_asian_width(character) in ("W", "F"):
+        return 2
+
+    return 1
+
+
+def _render_tuple(name, values, columns, value_type="int"):
+    # packed rows keep the tables short, so black is told to leave them alone
+    lines = ["# fmt: off", f"{name}: Tuple[{value_type}, ...] = ("]
+    for index in range(0, len(values), columns):
+        lines.append(
+            "    " + " ".join(f"{value}," for value in values[index : index + columns])
+        )
+    lines.extend((")", "# fmt: on"))
+    return "\n".join(lines)
+
+
+def render_width_table():
+    """Render the width table module from the installed Unicode database."""
+
+    ranges = []
+    for codepoint in range(0x80, sys.maxunicode + 1):
+        width = get_character_width(codepoint)
+        if width == 1:
+            continue
+
+        if ranges and ranges[-1][1] == codepoint - 1 and ranges[-1][2] == width:
+            ranges[-1][1] = codepoint
+        else:
+            ranges.append([codepoint, codepoint, width])
+
+    starts, ends, widths = zip(*ranges)
+    tables = [
+        _render_tuple("STARTS", [f"0x{value:X}" for value in starts], 8),
+        _render_tuple("ENDS", [f"0x{value:X}" for value in ends], 8),
+        _render_tuple("WIDTHS", [str(value) for value in widths], 24),
+    ]
+    return WIDTH_TABLE_TEMPLATE.format(
+        version=unicodedata.unidata_version, tables="\n\n".join(tables)
+    )
+
+
+def check_shortcuts(package):
+    """Find shortcuts whose names disagree with the color or style they apply."""
+
+    errors = []
+    for module, attribute, enum in (
+        (package.fg, "foreground", package.Color),
+        (package.bg, "background", package.Color),
+    ):
+        for name in enum.__members__:
+            chalk = getattr(module, name.lower(), None)
+            if chalk is None or getattr(chalk, attribute) != enum[name]:
+                errors.append(f"{module.__name__}.{name.lower()} is not {enum[name]}")
+
+    for name in package.Style.__members__:
+        chalk = getattr(package.sty, name.lower(), None)
+        if chalk is not None and chalk.style != {package.Style[name]}:
+            errors.append(f"sty.{name.lower()} is not {package.Style[name]!s}")
+
+    return errors
+
+
+@invoke.task
+def generate(ctx):
+    """Generate the precomputed escape sequences and width table modules."""
+
+    ansi, _ = _import_package(ctx)
+    for filepath, content in (
+        (ctx.package.directory / SEQUENCES_PATH, render_sequences(ansi)),
+        (ctx.package.directory / WIDTH_TABLE_PATH, render_width_table()),
+    ):
+        report.info(ctx, "codegen.generate", f"generating {filepath.as_posix()!s}")
+        filepath.write_text(content, encoding="utf-8")
+
+
+@invoke.task
+def check(ctx):
+    """Check that generated modules and shortcuts match the source maps."""
+
+    ansi, package = _import_package(ctx)
+    errors = check_shortcuts(package)
+    for filepath, content in (
+        (ctx.package.directory / SEQUENCES_PATH, render_sequences(ansi)),
+        (ctx.package.directory / WIDTH_TABLE_PATH, render_width_table()),
+    ):
+        if filepath.read_text(encoding="utf-8") != content:
+            errors.append(f"{filepath.as_posix()!s} is stale, run codegen.generate")
+
+    for error in errors:
+        report.error(ctx, "codegen.check", error)
+    if errors:
+        raise invoke.Exit(code=1)
+
+    report.success(ctx, "codegen.check", "generated sources are up to date")
@@ -5,13 +5,15 @@
 """
 """
 
+import io
 import sys
+from dataclasses import replace
 from string import printable
 from typing import Optional
 from unittest.mock import patch
 
 import pytest
-from hypothesis import given
+from hypothesis import assume, given
 from hypothesis.strategies import (
     binary,
     booleans,
@@ -24,7 +26,9 @@ from hypothesis.strategies import (
 )
 
 from chalky.chalk import Chalk
-from chalky.color import Color, Color_T, TrueColor
+from chalky.color import Color, Color_T, IndexedColor, TrueColor
+from chalky.constants import configure
+from chalky.interface import get_interface as get_shared_interface
 from chalky.interface.ansi import (
     MODE_KEEP_HEAD,
     MODE_KEEP_NONE,
@@ -33,20 +37,32 @@ from chalky.interface.ansi import (
     build_clear_line,
     build_clear_screen,
     build_color,
+    build_combined_sequence,
     build_cursor,
+    build_cursor_down,
+    build_cursor_up,
     build_escape_sequence,
+    build_nested,
     build_position_cursor,
     build_reset,
+    build_restore,
+    build_sequence,
     build_set_title,
     build_style,
+    build_synchronized_update,
     build_truecolor,
     build_video,
     get_clear_mode,
+    get_color_code,
+    get_prefix,
 )
+from chalky.interface.base import WRITE_THRESHOLD, BaseInterface
+from chalky.output import print as chalky_print
+from chalky.parser import Segment, parse
 from chalky.style import Style
 
 from ..test_chalk import chalk
-from ..test_color import true_color
+from ..test_color import indexed_color, true_color
 
 
 def get_interface() -> AnsiInterface:
@@ -82,7 +98,7 @@ def test_build_truecolor(color: TrueColor, background: bool):
         assert len(color_sequence) > 0
 
 
-@given(one_of(sampled_from(Color), true_color(), none()), booleans())
+@given(one_of(sampled_from(Color), true_color(), indexed_color(), none()), booleans())
 def test_build_color(color: Optional[Color_T], background: bool):
     escape_sequence = build_color(color, background=background)  # type: ignore
     assert isinstance(escape_sequence, bytes)
@@ -90,6 +106,84 @@ def test_build_color(color: Optional[Color_T], background: bool):
         assert len(escape_sequence) > 0
 
 
+@given(indexed_color(), booleans())
+def test_build_color_indexed(color: IndexedColor, background: bool):
+    layer = b"48" if background else b"38"
+    expected = b"\x1b[" + layer + b";5;" + str(color.index).encode() + b"m"
+    assert build_color(color, background=background) == expected
+    assert get_color_code(color, background=background) == expected[2:-1]
+    assert (
+        get_prefix(
+            frozenset(),
+            color if background else None,
+            None if background else color,
+        )
+        == expected.decode("ascii")
+    )
+
+
+@given(chalk())
+def test_build_sequence(chalk: Chalk):
+    escape_sequence = build_sequence(chalk.style, chalk.background, chalk.foreground)
+    assert isinstance(escape_sequence, bytes)
+    if chalk.foreground is not None:
+        assert build_color(chalk.foreground) in escape_sequence
+
+
+@given(chalk())
+def test_build_combined_sequence(chalk: Chalk):
+    escape_sequence = build_combined_sequence(
+        chalk.style, chalk.background, chalk.foreground
+    )
+    assert escape_sequence.count(b"\x1b[") <= 1
+    segments = parse(escape_sequence + b"a")
+    assert segments[-1].chalk.foreground == chalk.foreground
+    assert segments[-1].chalk.background == chalk.background
+
+
+def test_build_restore():
+    style = {Style.BOLD, Style.RESET}
+    assert build_restore("0", style, None, Color.RED) == b"\x1b[1;31m"
+    assert build_restore("0;31", style, Color.BLUE, Color.RED) == b"\x1b[1;44m"
+    assert build_restore("0;38;5;1;1", style, None, Color.RED) == b""
+    assert build_restore("22", style, None, Color.RED) == b""
+    assert build_restore("34", style, None, Color.RED) == b""
+
+
+def test_build_nested_merges_adjacent_sequences():
+    value = "a\x1b[1mb\x1b[0m\x1b[34mc\x1b[0m"
+    assert build_nested(value, set(), None, Color.RED) == (
+        "a\x1b[1mb\x1b[0m\x1b[34mc\x1b[0m"
+    )
+    assert build_nested("a\x1b[1mb\x1b[0mc", set(), None, Color.RED) == (
+        "a\x1b[1mb\x1b[0m\x1b[31mc"
+    )
+
+
+@given(chalk(), chalk())
+def test_apply_restores_outer_chalk(outer: Chalk, inner: Chalk):
+    outer = replace(outer, style=outer.style - {Style.RESET, Style.NORMAL})
+    inner = replace(inner, style=inner.style - {Style.RESET, Style.NORMAL})
+    interface = get_interface()
+    value = interface.apply(
+        "x"
+        + interface.apply("y", inner.style, inner.background, inner.foreground)
+        + "z",
+        outer.style,
+        outer.background,
+        outer.foreground,
+    )
+
+    characters = {
+        character: segment.chalk
+        for segment in parse(value)
+        if isinstance(segment, Segment)
+        for character in segment.text
+    }
+    if outer.style or outer.background or outer.foreground:
+        assert characters["z"] == characters["x"] == outer
+
+
 @given(booleans(), booleans())
 def test_get_clear_mode(keep_head: bool, keep_tail: bool):
     # XXX: this test is testing the explicit implementation of this function
@@ -139,6 +233,21 @@ def test_build_position_cursor(x: int, y: int):
     assert len(escape_sequence) > 0
 
 
+@given(integers(max_value=0))
+def test_build_cursor_movement_raises_ValueError(count: int):
+    with pytest.raises(ValueError):
+        build_cursor_up(count)
+
+    with pytest.raises(ValueError):
+        build_cursor_down(count)
+
+
+@given(integers(min_value=1))
+def test_build_cursor_movement(count: int):
+    assert build_cursor_up(count).endswith(b"A")
+    assert build_cursor_down(count).endswith(b"B")
+
+
 @given(booleans())
 def test_build_video(normal: bool):
     escape_sequence = build_video(normal)
@@ -164,6 +273,15 @@ def test_build_set_title(title: str):
     assert len(escape_sequence) > 0
 
 
+@given(booleans())
+def test_build_synchronized_update(begin: bool):
+    escape_sequence = build_synchronized_update(begin)
+    assert isinstance(escape_sequence, bytes)
+    assert b"2026" in escape_sequence
+
+    assert escape_sequence.endswith(b"h" if begin else b"l")
+
+
 def test_write():
     with patch("sys.stdout", wraps=sys.stdout) as mocked_stdout:
         mocked_stdout.encoding = "utf-8"
@@ -175,6 +293,151 @@ def test_write():
         mocked_stdout.flush.assert_called()
 
 
+def test_batch():
+    with patch("chalky.interface.ansi.AnsiInterface._emit") as mocked_emit:
+        interface = get_interface()
+        with interface.batch(synchronized=False):
+            interface.hide_cursor()
+            with interface.batch():
+                interface.clear_line()
+            interface.set_title("test")
+            mocked_emit.assert_not_called()
+
+        mocked_emit.assert_called_once_with(
+            build_cursor(False)
+            + build_clear_line(MODE_KEEP_NONE)
+            + build_set_title("test")
+        )
+
+
+def test_batch_synchronized():
+    with patch("chalky.interface.ansi.AnsiInterface._emit") as mocked_emit:
+        interface = get_interface()
+        with interface.batch(synchronized=True):
+            interface.reset()
+
+        mocked_emit.assert_called_once_with(
+            build_synchronized_update(True)
+            + build_reset()
+            + build_synchronized_update(False)
+        )
+
+
+def test_batch_collects_chalky_print():
+    buffer = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    interface = get_shared_interface(buffer)
+    with interface.batch(synchronized=False):
+        interface.hide_cursor()
+        chalky_print((Chalk(foreground=Color.RED), "a"), file=buffer)
+        interface.show_cursor()
+
+    buffer.flush()
+    assert buffer.buffer.getvalue() == (
+        build_cursor(False)
+        + interface.apply("a", set(), None, Color.RED).encode("utf-8")
+        + b"\n"
+        + build_cursor(True)
+    )
+
+
+def test_batch_flash_writes_collected_output():
+    with patch("chalky.interface.ansi.AnsiInterface._emit") as mocked_emit:
+        interface = get_interface()
+        with interface.batch(synchronized=False):
+            interface.hide_cursor()
+            interface.flash(0)
+            assert mocked_emit.call_count == 3
+            interface.show_cursor()
+
+        assert mocked_emit.call_args_list[0][0][0] == build_cursor(False)
+        mocked_emit.assert_called_with(build_cursor(True))
+
+
+def test_batch_does_nothing_if_empty():
+    with patch("chalky.interface.ansi.AnsiInterface._emit") as mocked_emit:
+        interface = get_interface()
+        with interface.batch():
+            pass
+
+        mocked_emit.assert_not_called()
+
+
+@given(chalk(), text(printable))
+def test_AnsiInterface_write_matches_apply(test_chalk: Chalk, value: str):
+    assume(test_chalk is not Chalk())
+    buffer = io.StringIO()
+    interface = AnsiInterface(buffer)
+    interface.write(value, test_chalk)
+    assert buffer.getvalue() == interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+
+
+@given(chalk())
+def test_BaseInterface_get_affixes_matches_AnsiInterface(test_chalk: Chalk):
+    assume(test_chalk is not Chalk())
+    interface = AnsiInterface(io.StringIO())
+    arguments = (test_chalk.style, test_chalk.background, test_chalk.foreground)
+    assert BaseInterface.get_affixes(interface, *arguments) == (
+        interface.get_affixes(*arguments)
+    )
+
+
+def test_BaseInterface_get_affixes_raises_ValueError():
+    interface = AnsiInterface(io.StringIO())
+    with patch.object(interface, "apply", return_value=""):
+        with pytest.raises(ValueError):
+            BaseInterface.get_affixes(interface, {Style.BOLD}, None, None)
+
+
+def test_AnsiInterface_write_nested():
+    buffer = io.StringIO()
+    interface = AnsiInterface(buffer)
+    nested = interface.apply("inner", {Style.BOLD}, None, None)
+    interface.write(f"outer {nested}", Chalk(foreground=Color.RED))
+    assert buffer.getvalue() == interface.apply(
+        f"outer {nested}", set(), None, Color.RED
+    )
+
+
+def test_AnsiInterface_write_disabled():
+    buffer = io.StringIO()
+    interface = AnsiInterface(buffer)
+    try:
+        configure(disable=True)
+        interface.write("value", Chalk(style={Style.BOLD}, foreground=Color.RED))
+    finally:
+        configure(disable=False)
+
+    interface.write(" plain")
+    assert buffer.getvalue() == "value plain"
+
+
+def test_AnsiInterface_writelines_joins_small_pieces():
+    buffer = io.StringIO()
+    interface = AnsiInterface(buffer)
+    large = "x" * WRITE_THRESHOLD
+    with patch.object(buffer, "write", wraps=buffer.write) as mocked_write:
+        interface.writelines(("a", "b", large, "c"))
+
+    assert [call.args[0] for call in mocked_write.call_args_list] == [
+        "ab",
+        large,
+        "c",
+    ]
+    assert buffer.getvalue() == f"ab{large}c"
+
+
+def test_AnsiInterface_writelines_within_batch():
+    with patch("chalky.interface.ansi.AnsiInterface._emit") as mocked_emit:
+        interface = get_interface()
+        with interface.batch(synchronized=False):
+            interface.hide_cursor()
+            interface.writelines(("a", "b"))
+
+        mocked_emit.assert_called_once_with(build_cursor(False) + b"ab")
+
+
 @given(booleans())
 def test_clear_screen(reset_position: bool):
     with patch("chalky.interface.ansi.AnsiInterface._write") as mocked_write:
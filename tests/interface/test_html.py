@@ -0,0 +1,133 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from string import printable
+
+from hypothesis import given
+from hypothesis.strategies import integers, text
+
+from chalky.chalk import Chalk
+from chalky.color import Color, TrueColor
+from chalky.constants import configure
+from chalky.interface.html import HtmlInterface, build_color, build_declarations
+from chalky.style import Style
+
+from ..test_chalk import chalk
+from ..test_color import true_color
+
+BOLD = Chalk(style={Style.BOLD})
+
+
+def get_interface() -> HtmlInterface:
+    return HtmlInterface(io.StringIO())
+
+
+@given(true_color())
+def test_build_color_truecolor(color: TrueColor):
+    css_color = build_color(color)
+    assert css_color.startswith("#") and len(css_color) == 7
+    assert int(css_color[1:], 16) == (color.red << 16) | (color.green << 8) | color.blue
+
+
+def test_build_declarations():
+    assert build_declarations(set(), None, None) == ""
+    assert build_declarations(
+        {Style.UNDERLINE, Style.STRIKETHROUGH}, Color.BLACK, None
+    ) == ("text-decoration: underline line-through; background-color: #000000")
+    assert "color: #000000" in build_declarations({Style.REVERSED}, Color.BLACK, None)
+
+
+@given(chalk())
+def test_HtmlInterface_get_class_deduplicates(test_chalk: Chalk):
+    interface = get_interface()
+    first = interface.get_class(
+        test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    second = interface.get_class(
+        set(test_chalk.style), test_chalk.background, test_chalk.foreground
+    )
+    assert first == second
+    assert len(interface._rules) == (1 if first else 0)
+
+
+@given(text(printable))
+def test_HtmlInterface_apply_escapes(value: str):
+    interface = get_interface()
+    applied = interface.apply(value, {Style.BOLD}, None, None)
+    assert applied.startswith('<span class="chalky-0">')
+    assert applied.endswith("</span>")
+    assert "<" not in applied[len('<span class="chalky-0">') : -len("</span>")]
+
+
+def test_HtmlInterface_apply_without_style():
+    assert get_interface().apply("a&b", set(), None, None) == "a&amp;b"
+
+
+def test_HtmlInterface_write_merges_adjacent_spans():
+    interface = get_interface()
+    interface.begin()
+    interface.write("a", BOLD)
+    interface.write("b", BOLD)
+    interface.write("c")
+    interface.write("d", BOLD)
+    interface.end()
+
+    assert interface.io.getvalue() == (
+        '<pre class="chalky-output">'
+        '<span class="chalky-0">ab</span>c<span class="chalky-0">d</span></pre>\n'
+        "<style>\n.chalky-0 { font-weight: bold; }\n</style>\n"
+    )
+
+
+def test_HtmlInterface_write_disabled():
+    interface = get_interface()
+    try:
+        configure(disable=True)
+        interface.write("<a>", BOLD)
+    finally:
+        configure(disable=False)
+
+    assert interface.io.getvalue() == "&lt;a&gt;"
+    assert interface.stylesheet() == ""
+
+
+def test_HtmlInterface_begin_writes_known_rules_before_output():
+    interface = get_interface()
+    interface.get_class({Style.BOLD}, None, None)
+    interface.begin(title="log")
+    interface.write("a", BOLD)
+    interface.write("b", Chalk(style={Style.ITALIC}))
+    interface.end()
+
+    content = interface.io.getvalue()
+    head, _, body = content.partition("</head>")
+    assert "<style>\n.chalky-0 { font-weight: bold; }\n</style>" in head
+    assert content.count("<style>") == 2
+    assert body.index("</pre>") < body.index(".chalky-1 { font-style: italic; }")
+    assert "<style>" not in body[body.index("<pre") : body.index("</pre>")]
+
+
+@given(integers(min_value=1, max_value=8))
+def test_HtmlInterface_feed_split_chunks(size: int):
+    value = "plain \x1b[1;31merror\x1b[0m <done>\x1b[2K\n".encode("utf-8")
+    interface = get_interface()
+    interface.begin(title="log")
+    for start in range(0, len(value), size):
+        interface.feed(value[start : start + size])
+    interface.end()
+
+    content = interface.io.getvalue()
+    assert content.startswith("<!DOCTYPE html>")
+    assert content.endswith("</html>\n")
+    assert '<span class="chalky-0">error</span> &lt;done&gt;\n</pre>\n' in content
+
+
+def test_HtmlInterface_writelines_escapes():
+    interface = get_interface()
+    interface.writelines(("<a>", " & ", "b"))
+    assert interface.io.getvalue() == "&lt;a&gt; &amp; b"
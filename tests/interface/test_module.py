@@ -19,3 +19,8 @@ def test_get_interface():
     stderr_interface = get_interface(sys.stderr)
     assert stderr_interface.io == sys.stderr
     assert isinstance(stderr_interface, AnsiInterface)
+
+
+def test_get_interface_shares_default_interface():
+    assert get_interface() is get_interface(sys.stdout)
+    assert get_interface(sys.stderr) is get_interface(sys.stderr)
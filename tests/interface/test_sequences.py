@@ -0,0 +1,62 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+from hypothesis import given
+from hypothesis.strategies import frozensets, none, one_of, sampled_from
+
+from chalky.color import Color, Color_T
+from chalky.interface import _sequences
+from chalky.interface.ansi import (
+    BACKGROUND_COLOR_MAP,
+    FOREGROUND_COLOR_MAP,
+    SGR_PATTERN,
+    STYLE_MAP,
+    build_escape_sequence,
+    build_reset,
+    build_sequence,
+    get_prefix,
+)
+from chalky.style import Style
+
+from ..test_color import true_color
+
+
+def test_tables_match_source_maps():
+    for source, prefixes, prefix_bytes in (
+        (
+            FOREGROUND_COLOR_MAP,
+            _sequences.FOREGROUND_PREFIXES,
+            _sequences.FOREGROUND_PREFIX_BYTES,
+        ),
+        (
+            BACKGROUND_COLOR_MAP,
+            _sequences.BACKGROUND_PREFIXES,
+            _sequences.BACKGROUND_PREFIX_BYTES,
+        ),
+        (STYLE_MAP, _sequences.STYLE_PREFIXES, _sequences.STYLE_PREFIX_BYTES),
+    ):
+        assert prefix_bytes == {
+            key: build_escape_sequence(code) for key, code in source.items()
+        }
+        assert prefixes == {key: value.decode() for key, value in prefix_bytes.items()}
+
+    assert _sequences.RESET_BYTES == build_reset()
+    assert _sequences.RESET == build_reset().decode()
+
+
+@given(
+    frozensets(sampled_from(Style)),
+    one_of(none(), sampled_from(Color), true_color()),
+    one_of(none(), sampled_from(Color), true_color()),
+)
+def test_get_prefix(style, background: Color_T, foreground: Color_T):
+    prefix = get_prefix(style, background, foreground)
+    assert sorted(SGR_PATTERN.findall(prefix)) == sorted(
+        SGR_PATTERN.findall(build_sequence(set(style), background, foreground).decode())
+    )
+    if Style.RESET in style:
+        assert prefix.startswith(_sequences.RESET)
@@ -0,0 +1,95 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, lists, text
+
+from chalky.color import TrueColor
+from chalky.interface.ansi import get_color_code
+
+from .test_color import hex_color, true_color
+
+numpy = pytest.importorskip("numpy")
+from chalky.array import TrueColorArray  # noqa: E402 isort:skip
+
+
+@given(lists(hex_color()))
+def test_TrueColorArray_from_hex_matches_TrueColor(colors: List[str]):
+    assert list(TrueColorArray.from_hex(colors)) == [
+        TrueColor.from_hex(color) for color in colors
+    ]
+
+
+@given(text().filter(lambda value: len(value.lstrip("#")) not in (3, 6)))
+def test_TrueColorArray_from_hex_raises_ValueError(color: str):
+    with pytest.raises(ValueError):
+        TrueColorArray.from_hex([color])
+
+
+@pytest.mark.parametrize("values", [[[1, 2]], [[0, 0, 256]], [[-1, 0, 0]], [1, 2, 3]])
+def test_TrueColorArray_raises_ValueError(values):
+    with pytest.raises(ValueError):
+        TrueColorArray(values)
+
+
+@given(lists(true_color()))
+def test_TrueColorArray_round_trips(colors: List[TrueColor]):
+    array = TrueColorArray.from_colors(colors)
+    assert len(array) == len(colors)
+    assert list(array) == colors
+    assert [array[index] for index in range(len(colors))] == colors
+    assert list(TrueColorArray.from_hex(array.to_hex())) == colors
+
+
+@given(lists(true_color()))
+def test_TrueColorArray_to_color_codes(colors: List[TrueColor]):
+    array = TrueColorArray.from_colors(colors)
+    for background in (False, True):
+        assert array.to_color_codes(background) == [
+            get_color_code(color, background) for color in colors
+        ]
+
+
+@given(lists(true_color(), min_size=1), floats(min_value=0, max_value=1))
+def test_TrueColorArray_blend_bounds(colors: List[TrueColor], ratio: float):
+    array = TrueColorArray.from_colors(colors)
+    assert list(array.blend(array, ratio)) == colors
+    assert list(array.lighten(0)) == colors
+    assert list(array.darken(1)) == [TrueColor(0, 0, 0)] * len(colors)
+    assert list(array.lighten(1)) == [TrueColor(255, 255, 255)] * len(colors)
+    assert numpy.all(array.lighten(ratio).values >= array.values)
+    assert numpy.all(array.darken(ratio).values <= array.values)
+
+
+def test_TrueColorArray_blend_per_color_ratio():
+    array = TrueColorArray.from_hex(["#000000", "#000000"])
+    blended = array.blend(TrueColor(200, 100, 0), [0.5, 1.0])
+    assert list(blended) == [TrueColor(100, 50, 0), TrueColor(200, 100, 0)]
+
+    with pytest.raises(ValueError):
+        array.blend(array, 1.5)
+
+
+@given(lists(true_color(), min_size=1))
+def test_TrueColorArray_contrast(colors: List[TrueColor]):
+    array = TrueColorArray.from_colors(colors)
+    contrast = array.contrast(TrueColor(0, 0, 0))
+    assert numpy.all((contrast >= 1) & (contrast <= 21))
+    assert numpy.allclose(array.contrast(array), 1)
+
+
+def test_TrueColorArray_contrast_black_and_white():
+    array = TrueColorArray.from_hex(["#000", "#fff"])
+    assert array.contrast(TrueColor(255, 255, 255)).round(2).tolist() == [21.0, 1.0]
+
+
+def test_TrueColorArray_from_hex_rejects_whitespace():
+    with pytest.raises(ValueError):
+        TrueColorArray.from_hex(["#ff 000"])
@@ -0,0 +1,104 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from string import printable
+
+from hypothesis import given
+from hypothesis.strategies import text
+
+from chalky.cache import RenderCache, render_cache
+from chalky.chalk import Chalk
+from chalky.constants import configure, is_cached
+from chalky.interface.ansi import AnsiInterface
+from chalky.interface.html import HtmlInterface
+
+from .test_chalk import chalk
+
+
+def get_interface() -> AnsiInterface:
+    return AnsiInterface(io.StringIO())
+
+
+@given(chalk(), text(printable, max_size=128))
+def test_RenderCache_matches_apply(test_chalk: Chalk, value: str):
+    cache, interface = RenderCache(), get_interface()
+    expected = interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    first = cache.render(interface, test_chalk, value)
+    assert first == expected
+    assert cache.render(interface, test_chalk, value) is first
+    assert cache.cache_info() == (1, 1, cache.maxsize, 1)
+
+
+def test_RenderCache_evicts_least_recently_used():
+    cache, interface = RenderCache(maxsize=2), get_interface()
+    red = Chalk.from_string("red")
+    cache.render(interface, red, "a")
+    cache.render(interface, red, "b")
+    cache.render(interface, red, "a")
+    cache.render(interface, red, "c")
+    assert len(cache) == 2
+    assert cache.misses == 3
+
+    cache.render(interface, red, "a")
+    cache.render(interface, red, "b")
+    assert cache.misses == 4
+
+
+def test_RenderCache_limits_memory():
+    cache, interface = RenderCache(maxmemory=1024), get_interface()
+    red = Chalk.from_string("red")
+    for index in range(100):
+        cache.render(interface, red, str(index))
+
+    assert 0 < len(cache) < 100
+    assert 0 < cache.memory <= 1024
+
+
+def test_RenderCache_skips_long_values():
+    cache, interface = RenderCache(maxlength=4), get_interface()
+    red = Chalk.from_string("red")
+    assert cache.render(interface, red, "long value") == red | "long value"
+    assert len(cache) == 0
+
+
+def test_RenderCache_keys_by_interface():
+    cache, red = RenderCache(), Chalk.from_string("red")
+    ansi = cache.render(get_interface(), red, "value")
+    html = cache.render(HtmlInterface(io.StringIO()), red, "value")
+    assert ansi != html
+    assert len(cache) == 2
+
+
+def test_RenderCache_clear():
+    cache = RenderCache()
+    cache.render(get_interface(), Chalk.from_string("red"), "value")
+    cache.clear()
+    assert len(cache) == 0 and cache.memory == 0
+    assert cache.cache_info() == (0, 0, cache.maxsize, 0)
+
+
+def test_configure_cache():
+    red = Chalk.from_string("red")
+    assert not is_cached()
+    try:
+        configure(cache=True)
+        assert is_cached()
+        assert (red | "value") is (red | "value")
+        assert render_cache.hits == 1
+
+        configure(disable=True)
+        assert is_cached()
+        assert len(render_cache) == 0
+        assert red | "value" == "value"
+    finally:
+        configure(disable=False, cache=False)
+
+    assert not is_cached()
+    assert len(render_cache) == 0
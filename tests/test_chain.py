@@ -22,7 +22,7 @@ from hypothesis.strategies._internal.core import sampled_from
 
 from chalky.chain import Chain
 from chalky.chalk import Chalk
-from chalky.color import Color, Color_T, TrueColor
+from chalky.color import Color, Color_T, IndexedColor, TrueColor
 from chalky.style import Style
 
 from .test_chalk import chalk
@@ -90,6 +90,15 @@ def test_Chain_hex(chain: Chain, color: str):
     assert isinstance(updated.chalk.foreground, TrueColor)
 
 
+@given(
+    chain(chalk_strategy=chalk(foreground_strategy=none())),
+    integers(min_value=0, max_value=255),
+)
+def test_Chain_index(chain: Chain, index: int):
+    updated = chain.index(index)
+    assert updated.chalk.foreground == IndexedColor(index)
+
+
 @given(chain())
 def test_Chain_bg(chain: Chain):
     chain.fg
@@ -114,14 +123,29 @@ def test_Chain_applies_Style(chain: Chain, style: Style):
 
 @given(chain(), one_of(sampled_from(Color), true_color()), booleans())
 def test_Chain_applies_Color(chain: Chain, color: Color_T, background: bool):
-    if background:
-        chain.bg
-    else:
-        chain.fg
-
-    updated = chain._handle_color(color)
+    updated = (chain.bg if background else chain.fg)._handle_color(color)
 
     if background:
         assert updated.chalk.background == color
     else:
         assert updated.chalk.foreground == color
+
+
+@given(chain(), text(printable))
+def test_Chain_attribute_paths_are_cached(chain: Chain, value: str):
+    first = chain.bold.bg.red.fg.blue
+    assert chain.bold.bg.red.fg.blue is first
+    assert first.chalk == Chalk(
+        style=chain.chalk.style | {Style.BOLD},
+        foreground=Color.BLUE,
+        background=Color.RED,
+    )
+    assert first | value == first.chalk | value
+
+
+def test_Chain_nodes_are_not_consumed():
+    root = Chain()
+    bold = root.bold
+    bold | "value"
+    assert bold.chalk == Chalk(style={Style.BOLD})
+    assert root.chalk == Chalk()
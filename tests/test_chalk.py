@@ -5,9 +5,14 @@
 """
 """
 
+import copy
+import gc
+import pickle
+from dataclasses import FrozenInstanceError
 from string import printable
 from typing import Optional, Set
 
+import pytest
 from hypothesis import given
 from hypothesis.strategies import (
     SearchStrategy,
@@ -21,10 +26,11 @@ from hypothesis.strategies import (
 )
 
 from chalky.chalk import Chalk
-from chalky.color import Color, Color_T
+from chalky.color import Color, Color_T, TrueColor
+from chalky.constants import configure
 from chalky.style import Style
 
-from .test_color import true_color
+from .test_color import indexed_color, true_color
 
 
 @composite
@@ -35,7 +41,9 @@ def chalk(
     background_strategy: Optional[SearchStrategy[Color_T]] = None,
 ) -> SearchStrategy[Chalk]:
     default_style_strategy = sets(sampled_from(Style))
-    default_color_strategy = one_of(none(), sampled_from(Color), true_color())
+    default_color_strategy = one_of(
+        none(), sampled_from(Color), true_color(), indexed_color()
+    )
 
     return Chalk(
         style=draw(style_strategy if style_strategy else default_style_strategy),
@@ -94,3 +102,93 @@ def test_Chalk_callable(chalk: Chalk, value: str):
 def test_Chalk_reverse(chalk: Chalk):
     assert Style.REVERSED not in chalk.style
     assert Style.REVERSED in chalk.reverse.style
+
+
+@given(chalk(), text(printable))
+def test_Chalk_affixes(chalk: Chalk, value: str):
+    prefix, suffix = chalk.affixes()
+    if prefix:
+        assert prefix + value + suffix == chalk | value
+    else:
+        assert suffix == ""
+
+
+def test_Chalk_affixes_disabled():
+    configure(disable=True)
+    try:
+        assert Chalk(foreground=Color.RED).affixes() == ("", "")
+    finally:
+        configure(disable=False)
+
+
+def test_Chalk_from_string():
+    chalk = Chalk.from_string("bold Underline bright_red on #ffffff")
+    assert chalk.style == {Style.BOLD, Style.UNDERLINE}
+    assert chalk.foreground == Color.BRIGHT_RED
+    assert chalk.background == TrueColor(255, 255, 255)
+
+
+@pytest.mark.parametrize("spec", ["unknown", "red on", "on bold"])
+def test_Chalk_from_string_raises_ValueError(spec: str):
+    with pytest.raises(ValueError):
+        Chalk.from_string(spec)
+
+
+@given(chalk())
+def test_Chalk_is_interned(test_chalk: Chalk):
+    assert (
+        Chalk(
+            style=set(test_chalk.style),
+            foreground=test_chalk.foreground,
+            background=test_chalk.background,
+        )
+        is test_chalk
+    )
+    assert test_chalk & test_chalk is test_chalk
+    assert hash(test_chalk)
+
+
+def test_Chalk_is_immutable():
+    with pytest.raises(FrozenInstanceError):
+        Chalk().foreground = Color.RED  # type: ignore
+
+
+def test_Chalk_interned_instances_are_released():
+    gc.collect()
+    count = len(Chalk._interned)
+    chalk = Chalk(foreground=TrueColor(1, 2, 3), background=TrueColor(3, 2, 1))
+    assert len(Chalk._interned) == count + 1
+
+    del chalk
+    gc.collect()
+    assert len(Chalk._interned) == count
+
+
+@given(chalk())
+def test_Chalk_copies_are_interned(test_chalk: Chalk):
+    assert copy.copy(test_chalk) is test_chalk
+    assert copy.deepcopy(test_chalk) is test_chalk
+    assert pickle.loads(pickle.dumps(test_chalk)) is test_chalk
+
+
+@given(chalk())
+def test_Chalk_pack_roundtrip(test_chalk: Chalk):
+    packed = test_chalk.pack()
+    assert isinstance(packed, int) and packed >= 0
+    assert Chalk.unpack(packed) is test_chalk
+
+
+def test_Chalk_pack_default_is_zero():
+    assert Chalk().pack() == 0
+    assert Chalk.unpack(0) is Chalk()
+
+
+@given(sampled_from([-1, 1 << 66, 1 << 15, (1 << 16) * 200]))
+def test_Chalk_unpack_raises_ValueError_for_invalid_values(value: int):
+    with pytest.raises(ValueError):
+        Chalk.unpack(value)
+
+
+@given(chalk())
+def test_Chalk_pickle_is_compact(test_chalk: Chalk):
+    assert len(pickle.dumps(test_chalk)) < 64
@@ -0,0 +1,131 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+import json
+import re
+from pathlib import Path
+from string import printable
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, text
+
+from chalky.cli import (
+    build_rule,
+    colorize,
+    iter_file_chunks,
+    iter_stream_chunks,
+    load_highlighter,
+    main,
+)
+from chalky.constants import configure
+
+
+def strip(value: bytes) -> bytes:
+    return re.sub(rb"\x1b\[[0-9;]*m", b"", value)
+
+
+@given(text(printable), integers(min_value=1, max_value=16))
+def test_iter_stream_chunks(value: str, chunk_size: int):
+    content = value.encode("utf-8")
+    chunks = list(iter_stream_chunks(io.BytesIO(content), chunk_size=chunk_size))
+    assert b"".join(chunks) == content
+    assert all(chunk.endswith(b"\n") for chunk in chunks[:-1] if b"\n" in chunk)
+
+
+def test_iter_file_chunks(tmp_path: Path):
+    filepath = tmp_path / "test.log"
+    content = b"".join(b"line %d\n" % index for index in range(100))
+    filepath.write_bytes(content)
+
+    chunks = list(iter_file_chunks(filepath, chunk_size=64))
+    assert b"".join(chunks) == content
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert len(chunks) > 1
+
+    empty_filepath = tmp_path / "empty.log"
+    empty_filepath.touch()
+    assert list(iter_file_chunks(empty_filepath)) == []
+
+
+def test_colorize_preserves_content():
+    content = "INFO 10.0.0.1 é took 35 ms\n".encode("utf-8") + b"\xff\n"
+    output = io.BytesIO()
+    size = colorize(iter([content[:8], content[8:]]), output, load_highlighter())
+    assert size == len(content)
+    assert output.getvalue() != content
+    assert strip(output.getvalue()) == content
+
+
+def test_build_rule_raises_ValueError():
+    with pytest.raises(ValueError):
+        build_rule({"pattern": "a"})
+
+    with pytest.raises(ValueError):
+        build_rule({"preset": "unknown", "style": "red"})
+
+    with pytest.raises(ValueError):
+        build_rule({"pattern": "(unclosed", "style": "red"})
+
+    with pytest.raises(ValueError):
+        build_rule({"keywords": "ERROR", "style": "red"})
+
+    with pytest.raises(ValueError):
+        build_rule({"keywords": ["ERROR", 1], "style": "red"})
+
+    with pytest.raises(ValueError):
+        build_rule({"keywords": ["ERROR"], "style": "red", "priority": "2"})
+
+
+def test_main(tmp_path: Path, capfd):
+    rules_filepath = tmp_path / "rules.json"
+    rules_filepath.write_text(
+        json.dumps({"rules": [{"keywords": ["GET"], "style": "bold green"}]})
+    )
+    log_filepath = tmp_path / "test.log"
+    log_filepath.write_text("GET /index.html\n")
+
+    try:
+        arguments = ["--color", "always", "-r", str(rules_filepath), str(log_filepath)]
+        assert main(arguments) == 0
+    finally:
+        configure(disable=False)
+
+    captured = capfd.readouterr()
+    assert "\x1b[" in captured.out
+    assert re.sub(r"\x1b\[[0-9;]*m", "", captured.out) == "GET /index.html\n"
+
+
+def test_main_fails_on_invalid_rules(tmp_path: Path, capfd):
+    rules_filepath = tmp_path / "rules.json"
+    rules_filepath.write_text(json.dumps([{"keywords": ["GET"]}]))
+    assert main(["-r", str(rules_filepath)]) == 2
+
+
+def test_main_fails_on_invalid_pattern(tmp_path: Path, capfd):
+    rules_filepath = tmp_path / "rules.json"
+    rules_filepath.write_text(json.dumps([{"pattern": "(unclosed", "style": "red"}]))
+    assert main(["-r", str(rules_filepath)]) == 2
+    assert "invalid pattern" in capfd.readouterr().err
+
+
+def test_main_exits_quietly_on_broken_pipe(tmp_path: Path, capfd):
+    log_filepath = tmp_path / "test.log"
+    log_filepath.write_text("GET /index.html\n")
+    try:
+        with patch("chalky.cli.colorize", side_effect=BrokenPipeError), patch(
+            "chalky.cli.os.dup2"
+        ) as mocked_dup2:
+            assert main([str(log_filepath)]) == 141
+    finally:
+        configure(disable=False)
+
+    mocked_dup2.assert_called_once()
+
+    assert capfd.readouterr().err == ""
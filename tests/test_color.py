@@ -12,7 +12,12 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import SearchStrategy, composite, from_regex, integers, text
 
-from chalky.color import TrueColor
+from chalky.color import IndexedColor, TrueColor
+
+
+@composite
+def indexed_color(draw) -> SearchStrategy[IndexedColor]:
+    return IndexedColor(draw(integers(min_value=0, max_value=255)))
 
 
 @composite
@@ -57,3 +62,35 @@ def test_TrueColor_to_bytes(color: TrueColor):
     color_bytes = color.to_bytes()
     assert len(color_bytes) == 3
     assert all(isinstance(value, bytes) for value in color_bytes)
+
+
+@given(integers(min_value=0, max_value=255))
+def test_TrueColor_from_xterm(index: int):
+    color = TrueColor.from_xterm(index)
+    assert all(0 <= value <= 255 for value in (color.red, color.green, color.blue))
+
+
+def test_TrueColor_from_xterm_cube_and_grays():
+    assert TrueColor.from_xterm(16) == TrueColor(0, 0, 0)
+    assert TrueColor.from_xterm(196) == TrueColor(255, 0, 0)
+    assert TrueColor.from_xterm(232) == TrueColor(8, 8, 8)
+    assert TrueColor.from_xterm(255) == TrueColor(238, 238, 238)
+
+
+@given(integers().filter(lambda x: not 0 <= x <= 255))
+def test_TrueColor_from_xterm_raises_ValueError(index: int):
+    with pytest.raises(ValueError):
+        TrueColor.from_xterm(index)
+
+
+@given(integers(min_value=0, max_value=255))
+def test_IndexedColor_to_true_color(index: int):
+    color = IndexedColor(index)
+    assert color.to_true_color() == TrueColor.from_xterm(index)
+    assert color == IndexedColor(index) and hash(color) == hash(IndexedColor(index))
+
+
+@given(integers().filter(lambda x: not 0 <= x <= 255))
+def test_IndexedColor_raises_ValueError(index: int):
+    with pytest.raises(ValueError):
+        IndexedColor(index)
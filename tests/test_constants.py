@@ -30,3 +30,15 @@ def test_configure_disable(value: str):
     applied = Chalk(foreground=Color.RED) | value
     assert isinstance(applied, str)
     assert len(applied) > len(value)
+
+
+def test_configure_keeps_omitted_options():
+    configure(disable=True)
+    try:
+        configure(cache=False)
+        assert is_disabled()
+    finally:
+        configure(disable=False)
+
+    configure()
+    assert not is_disabled()
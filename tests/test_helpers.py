@@ -13,7 +13,12 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import sampled_from
 
-from chalky.helpers import supports_posix, supports_truecolor
+from chalky.helpers import (
+    supports_free_threading,
+    supports_posix,
+    supports_synchronized_output,
+    supports_truecolor,
+)
 
 
 def get_environment(exclude_keys: Optional[Set[str]] = None) -> Dict[str, str]:
@@ -73,3 +78,34 @@ def test_supports_truecolor_fails():
         mocked_supports_posix.return_value = False
         with patch.dict(os.environ, get_environment({"TERM", "COLORTERM"}), clear=True):
             assert not supports_truecolor()
+
+
+@given(sampled_from(("xterm-kitty", "foot", "alacritty")))
+def test_supports_synchronized_output_checks_TERM(term_value: str):
+    with patch.dict(os.environ, {"TERM": term_value}, clear=True):
+        assert supports_synchronized_output()
+
+
+@given(sampled_from(("WezTerm", "iTerm.app")))
+def test_supports_synchronized_output_checks_TERM_PROGRAM(term_program_value: str):
+    with patch.dict(os.environ, {"TERM_PROGRAM": term_program_value}, clear=True):
+        assert supports_synchronized_output()
+
+
+def test_supports_synchronized_output_fails():
+    with patch.dict(os.environ, {"TERM": "dumb"}, clear=True):
+        assert not supports_synchronized_output()
+
+    with patch.dict(os.environ, {}, clear=True):
+        assert not supports_synchronized_output()
+
+
+@given(sampled_from((True, False)))
+def test_supports_free_threading(gil_enabled: bool):
+    with patch("sys._is_gil_enabled", create=True, return_value=gil_enabled):
+        assert supports_free_threading() != gil_enabled
+
+
+def test_supports_free_threading_fails_without_gil_check():
+    with patch("sys._is_gil_enabled", create=True, new=None):
+        assert not supports_free_threading()
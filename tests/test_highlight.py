@@ -0,0 +1,143 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import re
+from string import ascii_lowercase, printable
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.constants import configure
+from chalky.highlight import (
+    AUTOMATON_THRESHOLD,
+    IPV4,
+    LEVEL,
+    NUMBER,
+    PATH,
+    UUID,
+    Highlighter,
+    Rule,
+)
+from chalky.style import Style
+
+RED = Chalk(foreground=Color.RED)
+BLUE = Chalk(foreground=Color.BLUE)
+GREEN = Chalk(foreground=Color.GREEN)
+BOLD_RED = Chalk({Style.BOLD}, Color.RED)
+
+
+def strip(value: str) -> str:
+    return re.sub(r"\x1b\[[0-9;]*m", "", value)
+
+
+@given(text(printable))
+def test_Highlighter_preserves_text(value: str):
+    highlighter = Highlighter()
+    highlighter.add_pattern(NUMBER, RED)
+    highlighter.add_pattern(LEVEL, BLUE)
+    highlighter.add_keywords(["a", "the"], GREEN)
+    assert strip(highlighter | value) == value
+
+
+def test_Highlighter_without_matches_returns_value():
+    highlighter = Highlighter([Rule(chalk=RED, pattern=NUMBER)])
+    value = "nothing to see"
+    assert highlighter(value) is value
+
+
+def test_Highlighter_applies_rules():
+    highlighter = Highlighter()
+    highlighter.add_pattern(NUMBER, RED)
+    highlighter.add_keywords(["GET"], GREEN)
+
+    red_prefix, red_suffix = RED.affixes()
+    green_prefix, green_suffix = GREEN.affixes()
+    assert highlighter | "GET 200" == (
+        f"{green_prefix}GET{green_suffix} {red_prefix}200{red_suffix}"
+    )
+
+
+def test_Highlighter_resolves_by_priority():
+    highlighter = Highlighter()
+    highlighter.add_pattern(NUMBER, RED)
+    highlighter.add_pattern(IPV4, BLUE, priority=1)
+
+    blue_prefix, blue_suffix = BLUE.affixes()
+    assert highlighter | "10.0.0.1" == f"{blue_prefix}10.0.0.1{blue_suffix}"
+
+
+@given(lists(text(ascii_lowercase, min_size=2), min_size=1))
+def test_Highlighter_automaton_matches_regex(words):
+    keywords = [f"kw{index}" for index in range(AUTOMATON_THRESHOLD + 1)]
+    value = " ".join(words + keywords[:3] + ["kw1x"])
+
+    automaton_highlighter = Highlighter()
+    automaton_highlighter.add_keywords(keywords, RED)
+    regex_highlighter = Highlighter()
+    regex_highlighter.add_keywords(keywords[:3], RED)
+
+    assert automaton_highlighter | value == regex_highlighter | value
+
+
+@given(
+    lists(
+        sampled_from(["/var/error/log", "error", "ERROR", "10.0.0.1", "error_log"]),
+        min_size=1,
+    )
+)
+def test_Highlighter_automaton_resolves_like_regex(words):
+    value = " ".join(words)
+    padding = [f"kw{index}" for index in range(AUTOMATON_THRESHOLD)]
+
+    highlighters = []
+    for keywords in (["error"], ["error"] + padding):
+        highlighter = Highlighter()
+        highlighter.add_pattern(PATH, BLUE)
+        highlighter.add_pattern(IPV4, GREEN, priority=1)
+        highlighter.add_keywords(keywords, RED, priority=1)
+        highlighter.add_pattern(LEVEL, BOLD_RED, priority=2)
+        highlighters.append(highlighter)
+
+    assert highlighters[0] | value == highlighters[1] | value
+    assert highlighters[1]._automaton is not None
+
+
+def test_Highlighter_automaton_resolves_by_priority():
+    keywords = ["10"] + [f"kw{index}" for index in range(AUTOMATON_THRESHOLD)]
+    highlighter = Highlighter()
+    highlighter.add_pattern(NUMBER, BLUE)
+    highlighter.add_keywords(keywords, RED, priority=1)
+
+    red_prefix, red_suffix = RED.affixes()
+    blue_prefix, blue_suffix = BLUE.affixes()
+    assert highlighter | "/var/10 20" == (
+        f"/var/{red_prefix}10{red_suffix} {blue_prefix}20{blue_suffix}"
+    )
+
+
+def test_Highlighter_respects_disabled():
+    highlighter = Highlighter()
+    highlighter.add_pattern(UUID, RED)
+    value = "id 123e4567-e89b-12d3-a456-426614174000"
+    assert highlighter | value != value
+
+    configure(disable=True)
+    try:
+        assert highlighter | value == value
+    finally:
+        configure(disable=False)
+
+
+def test_Highlighter_add_raises_ValueError():
+    with pytest.raises(ValueError):
+        Highlighter().add(Rule(chalk=RED))
+
+    with pytest.raises(ValueError):
+        Highlighter().add(Rule(chalk=RED, pattern="a", keywords=["a"]))
@@ -0,0 +1,133 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+
+from chalky.color import XTERM_SYSTEM_COLORS, TrueColor
+from chalky.text import strip
+
+numpy = pytest.importorskip("numpy")
+from chalky.image import (  # noqa: E402 isort:skip
+    TRUECOLOR,
+    UPPER_HALF_BLOCK,
+    get_system_indexes,
+    get_xterm_indexes,
+    read_ppm,
+    render,
+)
+
+XTERM_PALETTE = numpy.array(
+    [
+        [color.red, color.green, color.blue]
+        for color in map(TrueColor.from_xterm, range(16, 256))
+    ]
+)
+
+
+def get_pixels(seed: int, height: int, width: int):
+    return numpy.random.default_rng(seed).integers(
+        0, 256, (height, width, 3), dtype=numpy.uint8
+    )
+
+
+@given(lists(tuples(*[integers(0, 255)] * 3), min_size=1))
+def test_get_xterm_indexes_finds_closest_color(pixels):
+    pixels = numpy.array(pixels)
+    distance = ((pixels[:, numpy.newaxis, :] - XTERM_PALETTE) ** 2).sum(axis=-1)
+    indexes = get_xterm_indexes(pixels)
+    assert numpy.all((indexes >= 16) & (indexes <= 255))
+    assert numpy.array_equal(
+        distance[numpy.arange(len(pixels)), indexes - 16], distance.min(axis=1)
+    )
+
+
+def test_get_system_indexes_matches_palette():
+    assert get_system_indexes(numpy.array(XTERM_SYSTEM_COLORS)).tolist() == list(
+        range(16)
+    )
+
+
+@given(
+    integers(0, 2 ** 16),
+    integers(1, 9),
+    integers(1, 9),
+    sampled_from([TRUECOLOR, 256, 16]),
+    sampled_from([False, True]),
+)
+def test_render_draws_half_block_cells(
+    seed: int, height: int, width: int, colors: int, dither: bool
+):
+    rendered = render(get_pixels(seed, height, width), colors=colors, dither=dither)
+    lines = rendered.split("\n")
+    assert len(lines) == (height + 1) // 2
+    assert all(strip(line) == UPPER_HALF_BLOCK * width for line in lines)
+    assert all(line.endswith("\x1b[0m") for line in lines)
+
+
+def test_render_merges_runs():
+    pixels = numpy.zeros((2, 4, 3), dtype=numpy.uint8)
+    pixels[0] = (255, 0, 0)
+    pixels[:, 3] = (0, 0, 255)
+    assert render(pixels, colors=TRUECOLOR) == (
+        f"\x1b[38;2;255;0;0;48;2;0;0;0m{UPPER_HALF_BLOCK * 3}"
+        f"\x1b[38;2;0;0;255;48;2;0;0;255m{UPPER_HALF_BLOCK}\x1b[0m"
+    )
+    assert render(pixels, colors=16) == (
+        f"\x1b[91;40m{UPPER_HALF_BLOCK * 3}\x1b[34;44m{UPPER_HALF_BLOCK}\x1b[0m"
+    )
+
+
+def test_render_odd_height_uses_default_background():
+    pixels = numpy.full((1, 2, 3), 255, dtype=numpy.uint8)
+    assert render(pixels, colors=256) == (
+        f"\x1b[38;5;231;49m{UPPER_HALF_BLOCK * 2}\x1b[0m"
+    )
+
+
+def test_render_scales_to_width():
+    rendered = render(get_pixels(0, 40, 80), width=20, colors=256)
+    lines = rendered.split("\n")
+    assert len(lines) == 5
+    assert all(strip(line) == UPPER_HALF_BLOCK * 20 for line in lines)
+
+
+@pytest.mark.parametrize(
+    "pixels,colors",
+    [
+        (numpy.zeros((2, 2)), 256),
+        (numpy.zeros((0, 2, 3)), 256),
+        (numpy.zeros((2, 2, 3)), 8),
+    ],
+)
+def test_render_raises_ValueError(pixels, colors: int):
+    with pytest.raises(ValueError):
+        render(pixels, colors=colors)
+
+
+def test_read_ppm_binary_and_plain():
+    pixels = get_pixels(1, 3, 2)
+    binary = b"P6\n# comment\n2 3\n255\n" + pixels.tobytes()
+    plain = b"P3 2 3 255\n" + " ".join(map(str, pixels.flatten())).encode()
+    assert numpy.array_equal(read_ppm(binary), pixels)
+    assert numpy.array_equal(read_ppm(plain), pixels)
+
+
+def test_read_ppm_scales_values(tmp_path):
+    path = tmp_path / "image.ppm"
+    values = numpy.array([65535, 0, 32768], dtype=">u2")
+    path.write_bytes(b"P6 1 1 65535\n" + values.tobytes())
+    assert read_ppm(path).tolist() == [[[255, 0, 128]]]
+
+
+@pytest.mark.parametrize(
+    "content", [b"P5 1 1 255\n\x00", b"P6 1 1", b"P6 2 2 255\n\x00\x00\x00"]
+)
+def test_read_ppm_raises_ValueError(content: bytes):
+    with pytest.raises(ValueError):
+        read_ppm(content)
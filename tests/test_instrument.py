@@ -0,0 +1,133 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from collections import namedtuple
+from string import printable
+
+from hypothesis import given
+from hypothesis.strategies import text
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.constants import configure, is_instrumented
+from chalky.instrument import (
+    CacheStats,
+    install,
+    is_installed,
+    profile,
+    register_cache,
+    reset_stats,
+    stats,
+    uninstall,
+)
+from chalky.interface.ansi import AnsiInterface
+from chalky.style import Style
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class NamedTextIO(io.TextIOWrapper):
+    name = "<test>"
+
+    def __init__(self):
+        super().__init__(io.BytesIO(), encoding="utf-8")
+
+    def getvalue(self) -> bytes:
+        self.flush()
+        return self.buffer.getvalue()
+
+
+def test_configure_instrument():
+    original_and = Chalk.__dict__["__and__"]
+    assert not is_instrumented()
+
+    configure(instrument=True)
+    assert is_instrumented()
+    assert is_installed()
+    assert Chalk.__dict__["__and__"] is not original_and
+
+    configure(instrument=False)
+    assert not is_instrumented()
+    assert not is_installed()
+    assert Chalk.__dict__["__and__"] is original_and
+
+
+@given(text(printable))
+def test_stats_counts_interface(value: str):
+    interface = AnsiInterface(NamedTextIO())
+    reset_stats()
+    install()
+    try:
+        interface.apply(value, {Style.BOLD}, None, Color.RED)
+        interface.reset()
+        Chalk(foreground=Color.RED) & Chalk(background=Color.BLUE)
+    finally:
+        uninstall()
+
+    snapshot = stats()
+    assert not snapshot.enabled
+    assert snapshot.compositions == 1
+
+    interface_stats = snapshot.interfaces["<test>"]
+    assert interface_stats.applies == 1
+    assert interface_stats.writes == 1
+    assert interface_stats.flushes == 1
+    assert interface_stats.bytes_emitted == len(interface.io.getvalue())
+
+
+def test_stats_counts_only_actual_flushes():
+    interface = AnsiInterface(NamedTextIO())
+    reset_stats()
+    install()
+    try:
+        interface.writelines(("a", "b"))
+        interface.write_text("c")
+        with interface.batch(synchronized=False):
+            interface.write_text("d")
+            interface.reset()
+    finally:
+        uninstall()
+
+    interface_stats = stats().interfaces["<test>"]
+    assert interface_stats.writes == 3
+    assert interface_stats.flushes == 1
+    assert interface_stats.bytes_emitted == len(interface.io.getvalue())
+
+
+def test_stats_not_collected_when_uninstalled():
+    interface = AnsiInterface(NamedTextIO())
+    reset_stats()
+    interface.reset()
+    assert "<test>" not in stats().interfaces
+
+
+def test_stats_reports_caches():
+    class Cache:
+        def cache_info(self):
+            return CacheInfo(hits=3, misses=1, maxsize=None, currsize=1)
+
+    register_cache("test", Cache())
+    cache_stats = stats().caches["test"]
+    assert cache_stats.hit_rate == 0.75
+    assert "interface" in stats().caches
+    assert CacheStats(hits=0, misses=0, size=0, maxsize=1).hit_rate == 0.0
+
+
+def test_profile():
+    interface = AnsiInterface(NamedTextIO())
+    with profile() as report:
+        assert is_installed()
+        assert is_instrumented()
+        interface.apply("test", set(), Color.RED, None)
+        interface.reset()
+
+    assert not is_installed()
+    assert not is_instrumented()
+    assert report.build_time > 0
+    assert report.io_time > 0
+    assert report.total_time == report.build_time + report.io_time
@@ -0,0 +1,105 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers
+
+from chalky.interface.ansi import (
+    AnsiInterface,
+    build_cursor,
+    build_cursor_down,
+    build_cursor_up,
+)
+from chalky.live import LiveRegion, Progress, ProgressBar
+
+
+def get_interface() -> AnsiInterface:
+    return AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+
+
+def get_written(interface: AnsiInterface) -> bytes:
+    interface.io.flush()
+    return interface.io.buffer.getvalue()
+
+
+@given(floats(max_value=0))
+def test_LiveRegion_raises_ValueError(fps: float):
+    with pytest.raises(ValueError):
+        LiveRegion(fps=fps)
+
+
+def test_LiveRegion_render_new_lines():
+    region = LiveRegion(["a", "b"], interface=get_interface())
+    assert region.render() == b"a\nb\n"
+    assert region.render() == b""
+
+
+def test_LiveRegion_render_only_changed_lines():
+    region = LiveRegion(["a", "b", "c"], interface=get_interface())
+    region.render()
+
+    region.lines[1] = "new"
+    content = region.render()
+    assert content.startswith(build_cursor_up(2))
+    assert b"new" in content
+    assert b"a" not in content and b"c" not in content
+    assert content.endswith(build_cursor_down(2) + b"\r")
+
+
+def test_LiveRegion_throttles_updates():
+    interface = get_interface()
+    region = LiveRegion(["0"], fps=1, interface=interface)
+    with patch("time.monotonic", return_value=100.0):
+        region.refresh()
+        for count in range(1000):
+            region.update(0, str(count))
+
+    assert get_written(interface) == b"0\n"
+
+    with patch("time.monotonic", return_value=101.0):
+        region.update(0, "done")
+
+    assert b"done" in get_written(interface)
+
+
+def test_LiveRegion_context_toggles_cursor():
+    interface = get_interface()
+    with LiveRegion(["a"], interface=interface):
+        pass
+
+    written = get_written(interface)
+    assert written.startswith(build_cursor(False))
+    assert written.endswith(build_cursor(True))
+
+
+@given(integers(min_value=0, max_value=200), integers(min_value=1, max_value=100))
+def test_ProgressBar_render(completed: int, total: int):
+    rendered = ProgressBar("test", total=total, completed=completed, width=10).render()
+    assert rendered.startswith("test [")
+    assert f"{completed}/{total}" in rendered
+
+
+def test_Progress_renders_bars_on_refresh():
+    interface = get_interface()
+    progress = Progress(interface=interface)
+    first = progress.add("first", total=10)
+    second = progress.add("second", total=10)
+
+    with patch("time.monotonic", return_value=progress._last_refresh):
+        progress.advance(first, 5)
+        progress.advance(second, 10)
+
+    assert progress.lines[0].endswith("0/10")
+
+    progress.refresh()
+    assert progress.lines[0].endswith("5/10")
+    assert progress.lines[1].endswith("10/10")
+    assert b"10/10" in get_written(interface)
@@ -0,0 +1,100 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from string import printable
+from unittest.mock import patch
+
+from hypothesis import given
+from hypothesis.strategies import integers, lists, one_of, text, tuples
+
+from chalky.chalk import Chalk
+from chalky.interface.base import WRITE_THRESHOLD
+from chalky.output import print as chalky_print
+
+from .test_chalk import chalk
+
+# the empty chalk only writes its value, applying it with ``|`` appends a reset
+styled_chalk = chalk().filter(lambda test_chalk: test_chalk is not Chalk())
+
+
+def get_buffer() -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+
+def read_buffer(buffer: io.TextIOWrapper) -> str:
+    buffer.flush()
+    return buffer.buffer.getvalue().decode("utf-8")  # type: ignore
+
+
+@given(
+    lists(one_of(text(printable), integers(), tuples(styled_chalk, text(printable))))
+)
+def test_print_matches_builtin_print(parts: list):
+    buffer, expected = get_buffer(), get_buffer()
+    chalky_print(*parts, file=buffer)
+    print(
+        *[part[0] | part[1] if isinstance(part, tuple) else part for part in parts],
+        file=expected,
+    )
+    assert read_buffer(buffer) == read_buffer(expected)
+
+
+@given(styled_chalk, text(printable))
+def test_print_sep_and_end(test_chalk: Chalk, value: str):
+    buffer = get_buffer()
+    chalky_print("a", (test_chalk, value), sep="|", end="", file=buffer)
+    assert read_buffer(buffer) == f"a|{test_chalk | value}"
+
+
+def test_print_nested_values():
+    outer, inner = Chalk.from_string("red"), Chalk.from_string("bold")
+    buffer = get_buffer()
+    chalky_print((outer, f"a {inner | 'b'} c"), file=buffer)
+    assert read_buffer(buffer) == (outer | f"a {inner | 'b'} c") + "\n"
+
+
+def test_print_disabled():
+    buffer = get_buffer()
+    with patch("chalky.output.is_disabled", return_value=True):
+        chalky_print((Chalk.from_string("bold red"), "value"), 1, file=buffer)
+
+    assert read_buffer(buffer) == "value 1\n"
+
+
+def test_print_flush():
+    buffer = get_buffer()
+    with patch.object(buffer, "flush", wraps=buffer.flush) as mocked_flush:
+        chalky_print("value", file=buffer)
+        mocked_flush.assert_not_called()
+        chalky_print("value", file=buffer, flush=True)
+        mocked_flush.assert_called_once()
+
+
+def test_print_writes_small_lines_at_once():
+    buffer = get_buffer()
+    with patch(
+        "chalky.interface.ansi.AnsiInterface.write_text"
+    ) as mocked_write_text, patch(
+        "chalky.interface.ansi.AnsiInterface.writelines"
+    ) as mocked_writelines:
+        chalky_print((Chalk.from_string("red"), "value"), 1, file=buffer)
+
+    mocked_writelines.assert_not_called()
+    mocked_write_text.assert_called_once_with(
+        (Chalk.from_string("red") | "value") + " 1\n"
+    )
+
+
+def test_print_writes_large_values_as_pieces():
+    buffer = get_buffer()
+    large = "x" * WRITE_THRESHOLD
+    with patch("chalky.interface.ansi.AnsiInterface.writelines") as mocked_writelines:
+        chalky_print((Chalk.from_string("red"), large), file=buffer)
+
+    pieces = list(mocked_writelines.call_args.args[0])
+    assert large in pieces and pieces[-1] == "\n"
@@ -0,0 +1,43 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+from string import printable
+from typing import List
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, text
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.parallel import render_lines
+
+
+def rule(line: str) -> str:
+    return Chalk(foreground=Color.RED) | line
+
+
+@given(lists(text(printable)), integers(min_value=1, max_value=5))
+def test_render_lines_single_worker(lines: List[str], chunk_size: int):
+    rendered = list(render_lines(lines, rule, workers=1, chunk_size=chunk_size))
+    assert rendered == [rule(line) for line in lines]
+
+
+@pytest.mark.parametrize("free_threading", [False, True])
+def test_render_lines_preserves_order(free_threading: bool):
+    lines = [str(index) for index in range(1000)]
+    with patch("chalky.parallel.supports_free_threading", return_value=free_threading):
+        rendered = list(render_lines(lines, rule, workers=2, chunk_size=7))
+
+    assert rendered == [rule(line) for line in lines]
+
+
+@given(integers(max_value=0))
+def test_render_lines_raises_ValueError(chunk_size: int):
+    with pytest.raises(ValueError):
+        list(render_lines(["test"], rule, chunk_size=chunk_size))
@@ -0,0 +1,114 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from dataclasses import replace
+from typing import List
+
+from hypothesis import given
+from hypothesis.strategies import integers, text
+
+from chalky.chalk import Chalk
+from chalky.color import Color, IndexedColor, TrueColor
+from chalky.interface.ansi import AnsiInterface
+from chalky.parser import AnsiParser, Control, Segment, parse
+from chalky.style import Style
+
+from .test_chalk import chalk
+
+
+def get_segments(events) -> List[Segment]:
+    return [event for event in events if isinstance(event, Segment)]
+
+
+def feed_split(value, size: int):
+    parser = AnsiParser()
+    events = []
+    for start in range(0, len(value), size):
+        events.extend(parser.feed(value[start : start + size]))
+    events.extend(parser.close())
+    return events
+
+
+def join_segments(events) -> List[Segment]:
+    joined: List[Segment] = []
+    for segment in get_segments(events):
+        if joined and joined[-1].chalk == segment.chalk:
+            joined[-1] = Segment(joined[-1].text + segment.text, segment.chalk)
+        else:
+            joined.append(segment)
+    return joined
+
+
+@given(chalk(), text(alphabet="abc xyz", min_size=1))
+def test_parse_roundtrips_applied_chalk(test_chalk: Chalk, value: str):
+    test_chalk = replace(
+        test_chalk, style=test_chalk.style - {Style.RESET, Style.NORMAL}
+    )
+    interface = AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+    styled = interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    segments = [segment for segment in get_segments(parse(styled)) if segment.text]
+    assert segments == [Segment(value, test_chalk)]
+
+
+@given(integers(min_value=1, max_value=8))
+def test_AnsiParser_handles_split_sequences(size: int):
+    value = "a\x1b[1;31mb\x1b[38;2;1;2;3mc\x1b[0m\x1b[2Jd\x1b]0;title\x07e"
+    assert join_segments(feed_split(value, size)) == join_segments(parse(value))
+    assert [
+        event for event in feed_split(value, size) if isinstance(event, Control)
+    ] == [
+        Control("\x1b[2J", "J", "2"),
+        Control("\x1b]0;title\x07", "]", "0;title"),
+    ]
+
+
+@given(integers(min_value=1, max_value=4))
+def test_AnsiParser_handles_split_utf8_bytes(size: int):
+    value = "\x1b[32m→ café\x1b[0m".encode("utf-8")
+    segments = join_segments(feed_split(value, size))
+    assert segments == [Segment("→ café", Chalk(foreground=Color.GREEN))]
+
+
+def test_AnsiParser_sgr_resets():
+    segments = get_segments(parse("\x1b[1;3;31;44ma\x1b[22;39mb\x1b[23;49mc\x1b[md"))
+    assert segments == [
+        Segment("a", Chalk({Style.BOLD, Style.ITALIC}, Color.RED, Color.BLUE)),
+        Segment("b", Chalk({Style.ITALIC}, background=Color.BLUE)),
+        Segment("c", Chalk()),
+        Segment("d", Chalk()),
+    ]
+
+
+def test_AnsiParser_extended_colors():
+    segments = get_segments(parse("\x1b[38;5;9;48:5:196ma\x1b[38:2::10:20:30mb"))
+    background = IndexedColor(196)
+    assert segments == [
+        Segment("a", Chalk(foreground=IndexedColor(9), background=background)),
+        Segment("b", Chalk(foreground=TrueColor(10, 20, 30), background=background)),
+    ]
+
+
+def test_AnsiParser_close_flushes_incomplete_sequence():
+    parser = AnsiParser()
+    assert get_segments(parser.feed("a\x1b[1")) == [Segment("a", Chalk())]
+    assert parser.close() == [Segment("\x1b[1", Chalk())]
+
+
+@given(integers(min_value=1, max_value=4))
+def test_AnsiParser_consumes_escape_intermediates(size: int):
+    value = "\x1b[1mX\x1b(B\x1b[mY"
+    events = feed_split(value, size)
+    assert join_segments(events) == [
+        Segment("X", Chalk({Style.BOLD})),
+        Segment("Y", Chalk()),
+    ]
+    assert [event for event in events if isinstance(event, Control)] == [
+        Control("\x1b(B", "B", "")
+    ]
@@ -0,0 +1,53 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import pickle
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists
+
+from chalky.chalk import Chalk
+from chalky.registry import StyleTable
+
+from .test_chalk import chalk
+
+
+@given(lists(chalk()))
+def test_StyleTable_indexes_are_stable(chalks: List[Chalk]):
+    table = StyleTable(chalks)
+    assert len(table) == len(set(chalks))
+    for test_chalk in chalks:
+        assert test_chalk in table
+        assert table[table.index(test_chalk)] is test_chalk
+        assert table.register(test_chalk) == table.index(test_chalk)
+
+
+@given(lists(chalk()))
+def test_StyleTable_pickle_roundtrip(chalks: List[Chalk]):
+    table = StyleTable(chalks)
+    loaded = pickle.loads(pickle.dumps(table))
+    assert isinstance(loaded, StyleTable)
+    assert list(loaded) == list(table)
+
+
+def test_StyleTable_register_appends():
+    table = StyleTable()
+    assert table.register(Chalk.from_string("red")) == 0
+    assert table.register(Chalk.from_string("bold")) == 1
+    assert table.register(Chalk.from_string("red")) == 0
+    assert len(table) == 2
+
+
+def test_StyleTable_unregistered_raises():
+    table = StyleTable([Chalk.from_string("red")])
+    assert Chalk.from_string("blue") not in table
+    with pytest.raises(ValueError):
+        table.index(Chalk.from_string("blue"))
+    with pytest.raises(IndexError):
+        table[1]
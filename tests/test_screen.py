@@ -0,0 +1,129 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from string import ascii_letters
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, text
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.interface.ansi import (
+    AnsiInterface,
+    build_position_cursor,
+    build_reset,
+    get_prefix,
+)
+from chalky.screen import Screen
+
+
+def get_screen(width: int = 10, height: int = 4) -> Screen:
+    return Screen(
+        width,
+        height,
+        interface=AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8")),
+    )
+
+
+@given(integers(max_value=0), integers(min_value=1))
+def test_Screen_raises_ValueError(width: int, height: int):
+    with pytest.raises(ValueError):
+        Screen(width, height)
+
+
+def test_Screen_first_refresh_draws_everything():
+    screen = get_screen()
+    content = screen.diff()
+    assert content.count(b" ") == screen.width * screen.height
+
+
+def test_Screen_refresh_is_empty_without_changes():
+    screen = get_screen()
+    screen.refresh()
+    assert screen.diff() == b""
+
+
+@given(integers(min_value=0, max_value=9), text(ascii_letters, min_size=1, max_size=3))
+def test_Screen_diff_only_changed_cells(x: int, value: str):
+    screen = get_screen()
+    screen.refresh()
+
+    screen.write(x, 2, value)
+    content = screen.diff()
+    assert content.startswith(build_position_cursor(x + 1, 3))
+    assert value[: screen.width - x].encode("utf-8") in content
+    assert len(content) < screen.width
+
+
+def test_Screen_diff_styles_runs():
+    red = Chalk(foreground=Color.RED)
+    screen = get_screen()
+    screen.refresh()
+
+    screen.write(0, 0, "ab", red)
+    screen.write(2, 0, "cd", red)
+    screen.write(4, 0, "ef")
+    content = screen.diff()
+
+    assert content.count(b"\x1b[31m") == 1
+    assert b"abcd" + build_reset() + b"ef" in content
+
+
+def test_Screen_diff_reuses_cached_prefixes():
+    red = Chalk(foreground=Color.RED)
+    screen = get_screen()
+    screen.write(0, 0, "ab", red)
+    screen.diff()
+
+    hits = get_prefix.cache_info().hits
+    screen.diff()
+    assert get_prefix.cache_info().hits == hits + 1
+
+
+def test_Screen_write_clips():
+    screen = get_screen(width=4, height=1)
+    screen.write(-2, 0, "abcdef")
+    screen.write(0, 3, "ignored")
+    assert screen.diff() == build_position_cursor(1, 1) + b"cdef"
+
+
+def test_Screen_invalidate():
+    screen = get_screen()
+    screen.refresh()
+    screen.invalidate()
+    assert screen.diff() == get_screen().diff()
+
+
+def test_Screen_refresh_writes():
+    screen = get_screen()
+    screen.fill(char="x")
+    screen.refresh()
+
+    screen.interface.io.flush()
+    written = screen.interface.io.buffer.getvalue()
+    assert written.count(b"x") == screen.width * screen.height
+
+
+def test_Screen_write_wide_characters():
+    screen = get_screen(width=5, height=1)
+    screen.refresh()
+
+    screen.write(0, 0, "漢字x")
+    assert screen.diff() == build_position_cursor(1, 1) + "漢字x".encode("utf-8")
+
+    screen.refresh()
+    screen.write(1, 0, "a")
+    assert screen.diff() == build_position_cursor(1, 1) + b" a"
+
+
+def test_Screen_write_clips_wide_characters():
+    screen = get_screen(width=3, height=1)
+    screen.write(-1, 0, "漢字")
+    screen.write(2, 0, "漢")
+    assert screen.diff() == build_position_cursor(1, 1) + b"   "
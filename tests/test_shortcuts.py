@@ -6,11 +6,12 @@
 """
 
 from hypothesis import given
-from hypothesis.strategies import booleans, integers
+from hypothesis.strategies import booleans, integers, sampled_from
 
 from chalky.chalk import Chalk
-from chalky.color import TrueColor
-from chalky.shortcuts import hex, rgb
+from chalky.color import Color, IndexedColor, TrueColor
+from chalky.shortcuts import bg, fg, hex, rgb, sty
+from chalky.style import Style
 
 from .test_color import hex_color
 
@@ -36,3 +37,22 @@ def test_rgb(red: int, green: int, blue: int, background: bool):
     assert getattr(chalk, "background" if background else "foreground") == TrueColor(
         red, green, blue
     )
+
+
+@given(integers(min_value=0, max_value=255))
+def test_index(index: int):
+    assert fg.index(index) is Chalk(foreground=IndexedColor(index))
+    assert bg.index(index) is Chalk(background=IndexedColor(index))
+
+
+@given(sampled_from(Color))
+def test_color_shortcuts_match_names(color: Color):
+    assert getattr(fg, color.name.lower()).foreground == color
+    assert getattr(bg, color.name.lower()).background == color
+
+
+@given(sampled_from(Style))
+def test_style_shortcuts_match_names(style: Style):
+    shortcut = getattr(sty, style.name.lower(), None)
+    if shortcut is not None:
+        assert shortcut.style == {style}
@@ -0,0 +1,89 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from typing import List
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, text
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.interface.ansi import AnsiInterface
+from chalky.style import Style
+from chalky.tabular import table
+from chalky.text import strip
+
+
+def get_interface() -> AnsiInterface:
+    return AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+
+
+@given(
+    lists(
+        lists(text(alphabet="abcdef", max_size=8), min_size=3, max_size=3),
+        min_size=1,
+        max_size=20,
+    )
+)
+def test_table_aligns_styled_cells(rows: List[List[str]]):
+    red = Chalk(foreground=Color.RED)
+    styled_rows = [[red | row[0], row[1], row[2]] for row in rows]
+    lines = list(
+        table(
+            styled_rows,
+            styles=[None, Chalk(style={Style.BOLD}), None],
+            interface=get_interface(),
+        )
+    )
+    plain_lines = list(table(rows, interface=get_interface()))
+    assert [strip(line) for line in lines] == plain_lines
+
+
+def test_table_header_and_alignment():
+    lines = list(
+        table(
+            [("a", 1, "x"), ("bbb", 100, "y")],
+            columns=["name", "count", "c"],
+            align="<>^",
+            interface=get_interface(),
+        )
+    )
+    assert lines == ["name  count  c", "a         1  x", "bbb     100  y"]
+
+
+@given(integers(min_value=1, max_value=5))
+def test_table_streams_after_sample(sample: int):
+    consumed: List[int] = []
+
+    def rows():
+        for index in range(100):
+            consumed.append(index)
+            yield (str(index),)
+
+    lines = table(rows(), sample=sample, interface=get_interface())
+    next(lines)
+    assert len(consumed) == sample
+
+
+def test_table_fixed_widths_do_not_buffer():
+    consumed: List[int] = []
+
+    def rows():
+        for index in range(100):
+            consumed.append(index)
+            yield (str(index), "value")
+
+    lines = table(rows(), widths=[4, 5], interface=get_interface())
+    assert next(lines) == "0     value"
+    assert consumed == [0]
+
+
+def test_table_raises_ValueError_for_alignment():
+    with pytest.raises(ValueError):
+        next(table([("a",)], align="?"))
@@ -0,0 +1,131 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from string import ascii_letters, printable
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, text
+
+import chalky
+from chalky import fg, sty
+from chalky.chalk import Chalk
+from chalky.interface.ansi import AnsiInterface, build_set_title
+from chalky.text import slice, strip, truncate, visible_width, wrap
+
+from .test_chalk import chalk
+
+
+@given(chalk(), text(printable))
+def test_strip_removes_applied_chalk(test_chalk: Chalk, value: str):
+    interface = AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+    styled = interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    assert strip(styled) == value
+    assert visible_width(styled) == len(value)
+
+
+def test_strip_removes_control_sequences():
+    value = "a\x1b[2Jb" + build_set_title("title").decode() + "c\x1b7d"
+    assert strip(value) == "abcd"
+
+
+def test_visible_width_counts_wide_characters():
+    assert visible_width(fg.red | "漢字") == 4
+
+
+@given(chalk(), text(printable + "漢字é👩‍💻"), integers(0, 20), integers(0, 20))
+def test_slice_matches_plain_slice(
+    test_chalk: Chalk, value: str, start: int, size: int
+):
+    interface = AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+    styled = interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    sliced = slice(styled, start, start + size)
+    assert strip(sliced) == strip(slice(value, start, start + size))
+    assert visible_width(sliced) <= size
+
+
+def test_slice_carries_style():
+    styled = fg.red | "abc" + (fg.blue | "def")
+    assert strip(slice(styled, 1, 5)) == "bcde"
+    assert slice(styled, 4, 6) == "\x1b[34mef\x1b[0m"
+    assert slice(styled, 6) == ""
+    assert slice("漢字ab", 1, 4) == " 字"
+
+    with pytest.raises(ValueError):
+        slice(styled, -1)
+
+
+@given(chalk(), text(printable + "漢字é👩‍💻"), integers(1, 20))
+def test_truncate_fits_width(test_chalk: Chalk, value: str, width: int):
+    interface = AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+    styled = interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    truncated = truncate(styled, width)
+    if visible_width(value) <= width:
+        assert truncated == styled
+    else:
+        assert visible_width(truncated) <= width
+        assert strip(truncated).endswith("…")
+        assert value.startswith(strip(truncated)[:-1])
+
+
+def test_truncate_styles_ellipsis():
+    assert truncate(fg.red | "abcdef", 4) == "\x1b[31mabc…\x1b[0m"
+    assert truncate("abcdef", 4, ellipsis="..") == "ab.."
+
+    with pytest.raises(ValueError):
+        truncate("abcdef", 1, ellipsis="...")
+
+
+@given(chalk(), text(ascii_letters + " 漢字é\n"), integers(2, 20))
+def test_wrap_fits_width(test_chalk: Chalk, value: str, width: int):
+    interface = AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+    styled = interface.apply(
+        value, test_chalk.style, test_chalk.background, test_chalk.foreground
+    )
+    lines = wrap(styled, width)
+    assert [strip(line) for line in lines] == wrap(value, width)
+    for line in lines:
+        assert visible_width(line) <= width
+    assert "".join(strip(line) for line in lines).replace(" ", "") == value.replace(
+        " ", ""
+    ).replace("\n", "")
+
+
+def test_wrap_carries_style_across_lines():
+    assert wrap(sty.bold | "one two three", 7) == [
+        "\x1b[1mone two\x1b[0m",
+        "\x1b[1mthree\x1b[0m",
+    ]
+    assert wrap("abcdef", 4) == ["abcd", "ef"]
+    assert wrap("a\nb", 4) == ["a", "b"]
+
+    with pytest.raises(ValueError):
+        wrap("abc", 0)
+
+
+def test_wrap_drops_whitespace_at_breaks():
+    assert wrap("abc  def", 3) == ["abc", "def"]
+    assert wrap("  indented text", 8) == ["indented", "text"]
+    assert wrap("ab  \ncd", 3) == ["ab", "cd"]
+    assert wrap(sty.bold | "abc  def", 3) == [
+        "\x1b[1mabc\x1b[0m",
+        "\x1b[1mdef\x1b[0m",
+    ]
+
+
+def test_slice_is_exported_without_shadowing_the_builtin():
+    namespace: dict = {}
+    exec("from chalky import *", namespace)
+    assert chalky.slice is slice
+    assert "slice" not in namespace
@@ -0,0 +1,125 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+import os
+import threading
+from pathlib import Path
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import text
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.constants import configure
+from chalky.interface.ansi import AnsiInterface
+from chalky.style import Style
+from chalky.theme import Theme
+
+
+def get_interface() -> AnsiInterface:
+    return AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+
+
+def write_theme(path: Path, content: str, mtime_offset: int = 0):
+    path.write_text(content, encoding="utf-8")
+    stat = path.stat()
+    os.utime(
+        path,
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000),
+    )
+
+
+@given(text())
+def test_Theme_applies_like_chalk(value: str):
+    interface = get_interface()
+    theme = Theme({"error": "bold red"}, interface=interface)
+    chalk = Chalk(style={Style.BOLD}, foreground=Color.RED)
+    assert theme["error"].chalk is chalk
+    assert theme["error"] | value == interface.apply(
+        value, chalk.style, chalk.background, chalk.foreground
+    )
+
+
+def test_Theme_flattens_tables():
+    theme = Theme({"error": "red", "log": {"key": "cyan", "value": "white on blue"}})
+    assert set(theme) == {"error", "log.key", "log.value"}
+    assert len(theme) == 3
+    assert theme["log.value"].chalk.background == Color.BLUE
+    assert "missing" not in theme
+    with pytest.raises(KeyError):
+        theme["missing"]
+
+
+@pytest.mark.parametrize("entries", [{"error": "reddish"}, {"error": 1}])
+def test_Theme_raises_ValueError(entries: dict):
+    with pytest.raises(ValueError):
+        Theme(entries)
+
+
+def test_Theme_respects_disabled():
+    theme = Theme({"error": "red"}, interface=get_interface())
+    try:
+        configure(disable=True)
+        assert theme["error"] | "value" == "value"
+    finally:
+        configure(disable=False)
+
+
+def test_Theme_load_reloads_changed_file(tmp_path: Path):
+    path = tmp_path / "theme.toml"
+    write_theme(path, 'error = "red"\n[log]\nkey = "cyan"\n')
+    theme = Theme.load(path, interval=0, interface=get_interface())
+    assert theme["error"].chalk.foreground == Color.RED
+    assert theme["log.key"].chalk.foreground == Color.CYAN
+    assert not theme.reload()
+
+    write_theme(path, 'error = "bold magenta"\n', mtime_offset=1)
+    assert theme["error"].chalk.foreground == Color.MAGENTA
+    assert "log.key" not in theme
+
+
+def test_Theme_load_keeps_styles_of_invalid_file(tmp_path: Path):
+    path = tmp_path / "theme.toml"
+    write_theme(path, 'error = "red"\n')
+    theme = Theme.load(path, interval=0, interface=get_interface())
+
+    write_theme(path, 'error = "reddish"\n', mtime_offset=1)
+    assert not theme.reload()
+    assert theme["error"].chalk.foreground == Color.RED
+
+    write_theme(path, 'error = "green"\n', mtime_offset=2)
+    assert theme.reload()
+    assert theme["error"].chalk.foreground == Color.GREEN
+
+
+def test_Theme_load_checks_after_interval(tmp_path: Path):
+    path = tmp_path / "theme.toml"
+    write_theme(path, 'error = "red"\n')
+    theme = Theme.load(path, interval=3600, interface=get_interface())
+
+    write_theme(path, 'error = "green"\n', mtime_offset=1)
+    assert theme["error"].chalk.foreground == Color.RED
+    assert theme.reload()
+    assert theme["error"].chalk.foreground == Color.GREEN
+
+
+def test_Theme_reload_does_not_block_readers(tmp_path: Path):
+    path = tmp_path / "theme.toml"
+    write_theme(path, 'error = "red"\n')
+    theme = Theme.load(path, interval=0, interface=get_interface())
+
+    with theme._reload_lock:
+        write_theme(path, 'error = "green"\n', mtime_offset=1)
+        result = []
+        reader = threading.Thread(target=lambda: result.append(theme["error"]))
+        reader.start()
+        reader.join(timeout=5)
+        assert result[0].chalk.foreground == Color.RED
+
+    assert theme["error"].chalk.foreground == Color.GREEN
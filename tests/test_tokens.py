@@ -0,0 +1,70 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import io
+from string import printable
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, text, tuples
+
+from chalky.chalk import Chalk
+from chalky.color import Color
+from chalky.constants import configure
+from chalky.interface.ansi import AnsiInterface
+from chalky.style import Style
+from chalky.text import strip
+from chalky.tokens import TokenRenderer, get_token_parts, render_tokens
+
+BOLD = Chalk(style={Style.BOLD})
+RED = Chalk(foreground=Color.RED)
+BLUE = Chalk(foreground=Color.BLUE)
+STYLE_MAP = {"keyword": RED, "name": BLUE, "name.function": BOLD, ("string",): "green"}
+TOKEN_TYPES = ["keyword", "name", "name.function", "name.class", ("string",), "text"]
+
+
+def get_interface() -> AnsiInterface:
+    return AnsiInterface(io.TextIOWrapper(io.BytesIO(), encoding="utf-8"))
+
+
+@pytest.mark.parametrize(
+    "token_type,parts",
+    [("name.function", ("name", "function")), ("", ()), (("a", "b"), ("a", "b"))],
+)
+def test_get_token_parts(token_type, parts):
+    assert get_token_parts(token_type) == parts
+
+
+def test_TokenRenderer_inherits_parent_styles():
+    renderer = TokenRenderer(STYLE_MAP, interface=get_interface())
+    assert renderer.get_chalk("name.function") is BLUE & BOLD
+    assert renderer.get_chalk(("name", "class")) is BLUE
+    assert renderer.get_chalk("string.escape") is Chalk(foreground=Color.GREEN)
+    assert renderer.get_chalk("text") is None
+    assert renderer.get_affixes("name") is renderer.get_affixes("name.class")
+
+
+@given(lists(tuples(sampled_from(TOKEN_TYPES), text(printable))))
+def test_render_tokens_preserves_text(tokens: List[Tuple[str, str]]):
+    rendered = render_tokens(tokens, STYLE_MAP, interface=get_interface())
+    assert strip(rendered) == "".join(value for _, value in tokens)
+
+
+def test_render_tokens_merges_adjacent_tokens():
+    tokens = [("name", "a"), ("name.class", "b"), ("text", " "), ("keyword", "c")]
+    assert render_tokens(tokens, STYLE_MAP, interface=get_interface()) == (
+        "\x1b[34mab\x1b[0m \x1b[31mc\x1b[0m"
+    )
+
+
+def test_render_tokens_respects_disabled():
+    try:
+        configure(disable=True)
+        assert render_tokens([("keyword", "def")], STYLE_MAP) == "def"
+    finally:
+        configure(disable=False)
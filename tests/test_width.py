@@ -0,0 +1,67 @@
+# -*- encoding: utf-8 -*-
+# Copyright (c) 2020 Stephen Bunn <stephen@bunn.io>
+# ISC License <https://choosealicense.com/licenses/isc>
+
+"""
+"""
+
+import unicodedata
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import characters, text
+
+from chalky._width_table import ENDS, STARTS, UNICODE_VERSION, WIDTHS
+from chalky.width import cell_width, get_clusters, get_codepoint_width
+
+
+@given(text(characters(max_codepoint=0x7F)))
+def test_cell_width_of_ascii_is_length(value: str):
+    assert cell_width(value) == len(value)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("漢字", 4),
+        ("한국어", 6),
+        ("ｆｕｌｌ", 8),
+        ("é", 1),
+        ("a\u200bb", 2),
+        ("😀", 2),
+        ("❤", 1),
+        ("❤️", 2),
+        ("👍🏽", 2),
+        ("👩‍💻", 2),
+        ("👨‍👩‍👧‍👦", 2),
+        ("🇯🇵🇺🇸", 4),
+    ],
+)
+def test_cell_width_handles_wide_and_zero_width(value: str, expected: int):
+    assert cell_width(value) == expected
+
+
+@given(text(characters(min_codepoint=0x80)))
+def test_cell_width_is_sum_of_clusters(value: str):
+    clusters = get_clusters(value)
+    assert "".join(cluster for cluster, _ in clusters) == value
+    assert cell_width(value) == sum(width for _, width in clusters)
+
+
+def test_get_clusters_keeps_joined_emoji():
+    assert get_clusters("a👩‍💻b") == [("a", 1), ("👩‍💻", 2), ("b", 1)]
+
+
+@given(characters(min_codepoint=0x80))
+def test_get_codepoint_width_matches_east_asian_width(character: str):
+    width = get_codepoint_width(ord(character))
+    if width == 2 and unicodedata.category(character) != "Cn":
+        assert unicodedata.east_asian_width(character) in ("W", "F")
+
+
+def test_width_table_is_sorted_and_disjoint():
+    assert len(STARTS) == len(ENDS) == len(WIDTHS)
+    assert all(start <= end for start, end in zip(STARTS, ENDS))
+    assert all(end < start for end, start in zip(ENDS, STARTS[1:]))
+    assert set(WIDTHS) == {0, 2}
+    assert UNICODE_VERSION